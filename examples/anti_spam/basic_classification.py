@@ -69,13 +69,13 @@ def batch_classification_example():
 
     print(f"Processing {len(emails)} emails in batch...\n")
 
-    # Process in batch
-    results = engine.predict_batch(emails, batch_size=4)
-
     spam_count = 0
     legitimate_count = 0
     security_alerts = 0
 
+    # Stream results batch by batch instead of materializing them all
+    results = engine.predict_batch_iter(emails, batch_size=4)
+
     for i, (email, result) in enumerate(zip(emails, results, strict=False)):
         print(f"{i+1}. {result['label']} ({result['score']:.3f}) - {email[:30]}...")
 
@@ -5,10 +5,30 @@ This example demonstrates real-time threat detection and automated remediation
 using the Blue Team pipeline.
 """
 
+import asyncio
+import json
+import re
+import sys
+from functools import lru_cache
+
 from src.defensive.blue_team_pipeline import BlueTeamPipeline
 from src.defensive.remediation_engine import AutomatedRemediationEngine
 from src.defensive.threat_detectors import run_all_detectors
 
+URGENT_RE = re.compile("urgent|verify", re.IGNORECASE)
+PROMO_RE = re.compile("free|win", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _mock_prediction(text):
+    """Simulate model responses based on content."""
+    if URGENT_RE.search(text):
+        return "SPAM", 0.85
+    elif PROMO_RE.search(text):
+        return "SPAM", 0.75
+    else:
+        return "NOT_SPAM", 0.2
+
 
 def threat_detection_example():
     """Demonstrate threat detection capabilities."""
@@ -108,17 +128,24 @@ def automated_remediation_example():
 
     print("Processing threat events with automated remediation:\n")
 
-    for event in threat_events:
-        print(f"Processing event: {event['event_id']}")
-        print(f"  Threat level: {event['threat_level']}")
-        print(f"  Text preview: {event['text'][:50]}...")
+    # Execute remediation for all events concurrently; alerts and audit writes overlap
+    async def remediate_all():
+        return await asyncio.gather(*(remediation_engine.aremediate(event) for event in threat_events))
 
-        # Execute remediation
-        result = remediation_engine.remediate(event)
+    results = asyncio.run(remediate_all())
 
-        print(f"  Status: {result['status']}")
-        print(f"  Actions: {result['actions_taken']}")
-        print()
+    # Collect one structured record per event and write them in a single call
+    records = [
+        {
+            "event_id": event['event_id'],
+            "threat_level": event['threat_level'],
+            "text_preview": event['text'][:50],
+            "status": result['status'],
+            "actions": result['actions_taken'],
+        }
+        for event, result in zip(threat_events, results, strict=True)
+    ]
+    sys.stdout.write(json.dumps(records, indent=2, ensure_ascii=False) + "\n")
 
 
 def blue_team_pipeline_example():
@@ -129,13 +156,9 @@ def blue_team_pipeline_example():
 
     def mock_model_predict(text):
         """Mock model to simulate predictions."""
-        # Simulate model responses based on content
-        if "urgent" in text.lower() or "verify" in text.lower():
-            return {"label": "SPAM", "score": 0.85}
-        elif "free" in text.lower() or "win" in text.lower():
-            return {"label": "SPAM", "score": 0.75}
-        else:
-            return {"label": "NOT_SPAM", "score": 0.2}
+        # Fresh dict per call: the pipeline annotates the prediction in place
+        label, score = _mock_prediction(text)
+        return {"label": label, "score": score}
 
     # Test the pipeline with various inputs
     test_inputs = [
@@ -148,20 +171,26 @@ def blue_team_pipeline_example():
 
     print("Processing through complete security pipeline:\n")
 
-    for text in test_inputs:
-        print(f"Input: {text[:40]}...")
-
-        # Process through the complete pipeline
-        result = blue_team.process_incoming_text(text, mock_model_predict)
+    # Process all inputs through the complete pipeline concurrently; model
+    # predictions are coalesced into batched calls
+    def mock_batch_predict(texts):
+        return [mock_model_predict(text) for text in texts]
 
-        print(f"  Model prediction: {result['model_prediction']['label']} ({result['model_prediction']['score']:.2f})")
-        print(f"  Threat detected: {result['threat_detected']}")
-        print(f"  Final action: {result['final_action']}")
+    results = asyncio.run(blue_team.abatch_process_texts(test_inputs, mock_batch_predict))
 
-        if result['threat_detected']:
-            print(f"  Event ID: {result.get('threat_event_id', 'N/A')}")
-
-        print()
+    # Collect one structured record per input and write them in a single call
+    records = [
+        {
+            "input": text[:40],
+            "label": result['model_prediction']['label'],
+            "score": round(result['model_prediction']['score'], 2),
+            "threat_detected": result['threat_detected'],
+            "final_action": result['final_action'],
+            "event_id": result['threat_event_id'],
+        }
+        for text, result in zip(test_inputs, results, strict=True)
+    ]
+    sys.stdout.write(json.dumps(records, indent=2, ensure_ascii=False) + "\n")
 
 
 if __name__ == "__main__":
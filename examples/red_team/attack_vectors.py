@@ -13,6 +13,7 @@ from src.adversarial.attack_vectors import (
     PromptInjectionAttack,
     SemanticShiftAttack,
 )
+from src.adversarial.red_team_engine import RedTeamEngine
 
 
 def demonstrate_attack_vectors():
@@ -88,24 +89,28 @@ def attack_effectiveness_comparison():
         "Urgent account verification"
     ]
 
+    # Display name -> red team engine attack name
     attacks = {
-        "Obfuscation": CharacterObfuscationAttack(),
-        "Semantic": SemanticShiftAttack(),
-        "Injection": PromptInjectionAttack(),
-        "Encoding": EncodingEvasionAttack(),
-        "Homograph": HomographSubstitutionAttack()
+        "Obfuscation": "OBFUSCATION",
+        "Semantic": "SEMANTIC_SHIFT",
+        "Injection": "PROMPT_INJECTION",
+        "Encoding": "ENCODING_EVASION",
+        "Homograph": "HOMOGRAPH_SUBSTITUTION"
     }
 
+    # Run the full message x attack matrix in one campaign call
+    campaign = RedTeamEngine().execute_campaign(base_messages, list(attacks.values()))
+
     print("Effectiveness across different message types:\n")
 
-    for msg in base_messages:
+    for i, msg in enumerate(base_messages):
         print(f"Message: '{msg}'")
-        for name, attack in attacks.items():
-            try:
-                result = attack.execute(msg)
+        for name, attack_name in attacks.items():
+            result = campaign[attack_name][i]
+            if not result.success and "error" in result.metadata:
+                print(f"  {name:12}: Error - {result.metadata['error'][:30]}...")
+            else:
                 print(f"  {name:12}: {result.metadata.get('chars_modified', result.metadata.get('words_modified', result.metadata.get('chars_encoded', result.metadata.get('chars_substituted', 0))))} changes")
-            except Exception as e:
-                print(f"  {name:12}: Error - {str(e)[:30]}...")
         print()
 
 
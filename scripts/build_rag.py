@@ -1,56 +1,89 @@
 #!/usr/bin/env python3
 """Build RAG knowledge base from cybersecurity sources."""
 
+import asyncio
 import logging
+import os
+import shelve
 import sys
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import chain, islice
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+# Pin encoder threads before torch/tokenizers are imported: one intra-op thread per
+# physical core (approximated as half the logical CPUs) and no tokenizer thread pool
+# competing with torch for the same cores
+ENCODER_THREADS = max(1, (os.cpu_count() or 2) // 2)
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+os.environ.setdefault("OMP_NUM_THREADS", str(ENCODER_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(ENCODER_THREADS))
+
+# Add repository root to path for the shared src.rag helpers
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.rag.sources import load_mitre_techniques  # noqa: E402
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+# Large enough to fill CPU GEMM tiles; encode() length-sorts the full input, so padding stays tight
+EMBEDDING_BATCH_SIZE = 128
+UPSERT_BATCH_SIZE = 1000
 
-def download_mitre_attack() -> list[dict[str, Any]]:
-    """Download and parse MITRE ATT&CK framework data."""
-    logger.info("Downloading MITRE ATT&CK data...")
+# On-disk caches of content digest -> embedding, shared across runs of the same model and backend
+EMBEDDING_CACHE_DIR = Path("./data")
 
-    url = "https://raw.githubusercontent.com/mitre/cti/master/enterprise-attack/enterprise-attack.json"
+# Optional INT8 ONNX encoder for CPU-bound ingest: RAG_EMBEDDING_BACKEND=onnx-int8
+EMBEDDING_BACKEND = os.getenv("RAG_EMBEDDING_BACKEND", "torch")
+ONNX_INT8_MODEL_DIR = Path("./models/minilm-int8")
+ONNX_INT8_QUANTIZATION = "avx512_vnni"
+ONNX_INT8_FILE_NAME = f"model_qint8_{ONNX_INT8_QUANTIZATION}.onnx"
+FIDELITY_SAMPLE_SIZE = 64
+FIDELITY_MIN_COSINE = 0.99
 
-    try:
-        response = httpx.get(url, timeout=60)
-        response.raise_for_status()
-        data = response.json()
+# Optional torch.compile of the transformer forward pass: RAG_TORCH_COMPILE=1
+TORCH_COMPILE = os.getenv("RAG_TORCH_COMPILE", "0") == "1"
+
+# Encoder backend actually used, decided once per run so every vector comes from one model
+_resolved_backend: str | None = None
 
+
+async def download_mitre_attack(client: httpx.AsyncClient) -> list[dict[str, Any]]:
+    """Download (or revalidate the cached) MITRE ATT&CK data using the shared HTTP client."""
+    logger.info("Downloading MITRE ATT&CK data...")
+
+    try:
         documents = []
-        objects = data.get("objects", [])
 
-        for obj in objects:
-            obj_type = obj.get("type")
+        techniques = await load_mitre_techniques(client)
+        # Gunzip and JSON parsing are CPU-bound; keep them off the event loop
+        for technique in await asyncio.to_thread(list, techniques):
+            description = technique["description"]
+            if not description:
+                continue
 
-            if obj_type == "attack-pattern":
-                # Extract technique information
-                name = obj.get("name", "Unknown")
-                description = obj.get("description", "")
-                technique_id = obj.get("external_references", [{}])[0].get(
-                    "external_id", "Unknown"
-                )
+            name = technique["name"] or "Unknown"
+            technique_id = technique["id"] or "Unknown"
 
-                if description:
-                    documents.append(
-                        {
-                            "id": f"mitre_{technique_id}",
-                            "content": f"{name} ({technique_id}): {description}",
-                            "metadata": {
-                                "source": "MITRE",
-                                "category": "attack_pattern",
-                                "technique_id": technique_id,
-                                "name": name,
-                            },
-                        }
-                    )
+            documents.append(
+                {
+                    "id": f"mitre_{technique_id}",
+                    "content": f"{name} ({technique_id}): {description}",
+                    "metadata": {
+                        "source": "MITRE",
+                        "category": "attack_pattern",
+                        "technique_id": technique_id,
+                        "name": name,
+                    },
+                }
+            )
 
         logger.info(f"Downloaded {len(documents)} MITRE ATT&CK techniques")
         return documents
@@ -60,8 +93,8 @@ def download_mitre_attack() -> list[dict[str, Any]]:
         return []
 
 
-def create_nist_csf_docs() -> list[dict[str, Any]]:
-    """Create NIST Cybersecurity Framework documents."""
+def create_nist_csf_docs() -> Iterator[dict[str, Any]]:
+    """Yield NIST Cybersecurity Framework documents."""
     logger.info("Creating NIST CSF documentation...")
 
     # NIST CSF Core Functions and Categories
@@ -98,27 +131,25 @@ def create_nist_csf_docs() -> list[dict[str, Any]]:
         ],
     }
 
-    documents = []
+    count = 0
     for function, categories in nist_data.items():
         for i, category in enumerate(categories):
-            documents.append(
-                {
-                    "id": f"nist_{function.lower()}_{i}",
-                    "content": f"NIST CSF {function} - {category}",
-                    "metadata": {
-                        "source": "NIST",
-                        "category": "framework",
-                        "function": function,
-                    },
-                }
-            )
+            count += 1
+            yield {
+                "id": f"nist_{function.lower()}_{i}",
+                "content": f"NIST CSF {function} - {category}",
+                "metadata": {
+                    "source": "NIST",
+                    "category": "framework",
+                    "function": function,
+                },
+            }
 
-    logger.info(f"Created {len(documents)} NIST CSF documents")
-    return documents
+    logger.info(f"Created {count} NIST CSF documents")
 
 
-def create_owasp_top10_docs() -> list[dict[str, Any]]:
-    """Create OWASP Top 10 documents."""
+def create_owasp_top10_docs() -> Iterator[dict[str, Any]]:
+    """Yield OWASP Top 10 documents."""
     logger.info("Creating OWASP Top 10 documentation...")
 
     owasp_top10 = [
@@ -174,32 +205,261 @@ def create_owasp_top10_docs() -> list[dict[str, Any]]:
         },
     ]
 
-    documents = []
     for item in owasp_top10:
-        documents.append(
-            {
-                "id": f"owasp_{item['id'].lower()}",
-                "content": f"OWASP Top 10 {item['id']}: {item['name']} - {item['description']}",
-                "metadata": {
-                    "source": "OWASP",
-                    "category": "top10",
-                    "vulnerability_id": item["id"],
-                    "name": item["name"],
-                },
-            }
+        yield {
+            "id": f"owasp_{item['id'].lower()}",
+            "content": f"OWASP Top 10 {item['id']}: {item['name']} - {item['description']}",
+            "metadata": {
+                "source": "OWASP",
+                "category": "top10",
+                "vulnerability_id": item["id"],
+                "name": item["name"],
+            },
+        }
+
+    logger.info(f"Created {len(owasp_top10)} OWASP Top 10 documents")
+
+
+@lru_cache(maxsize=1)
+def get_embedding_model():
+    """Load the sentence-transformers embedding model once per process.
+
+    On CUDA the weights are cast to FP16; on CPU they stay FP32 and encoding
+    runs under BF16 autocast instead (see ``_encode``). With ``RAG_TORCH_COMPILE=1``
+    the underlying transformer is compiled once so later batches skip eager
+    per-op dispatch.
+    """
+    try:
+        import torch
+        from sentence_transformers import SentenceTransformer
+    except ImportError as e:
+        raise ImportError(
+            "sentence-transformers is required to build the RAG index. "
+            "Install with: pip install sentence-transformers"
+        ) from e
+
+    torch.set_num_threads(ENCODER_THREADS)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Already fixed by earlier parallel work in this process
+        pass
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model = SentenceTransformer(EMBEDDING_MODEL_NAME, device=device)
+    if device == "cuda":
+        model = model.half()
+
+    if TORCH_COMPILE:
+        # dynamic=True: padded sequence lengths vary per batch and must not recompile
+        model[0].auto_model = torch.compile(
+            model[0].auto_model,
+            mode="reduce-overhead" if device == "cuda" else "default",
+            dynamic=True,
+        )
+
+    logger.info(f"Loaded {EMBEDDING_MODEL_NAME} on {device} (compiled: {TORCH_COMPILE})")
+    return model
+
+
+def _encode(model, contents: list[str]):
+    """Encode texts with a loaded model, using BF16 autocast for PyTorch CPU models."""
+    import torch
+
+    autocast = model.device.type == "cpu" and getattr(model, "backend", "torch") == "torch"
+    with (
+        torch.inference_mode(),
+        torch.autocast(device_type="cpu", dtype=torch.bfloat16, enabled=autocast),
+    ):
+        embeddings = model.encode(
+            contents,
+            batch_size=EMBEDDING_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+
+    # Reduced-precision activations come back as float16/bfloat16; store float32
+    return embeddings.astype("float32", copy=False)
+
+
+@lru_cache(maxsize=1)
+def get_onnx_int8_model():
+    """Load the INT8 ONNX export of the embedding model, exporting it on first use."""
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+    model_file = ONNX_INT8_MODEL_DIR / "onnx" / ONNX_INT8_FILE_NAME
+    if not model_file.exists():
+        logger.info(f"Exporting INT8 ONNX model to {ONNX_INT8_MODEL_DIR}...")
+        onnx_model = SentenceTransformer(EMBEDDING_MODEL_NAME, backend="onnx")
+        onnx_model.save(str(ONNX_INT8_MODEL_DIR))
+        export_dynamic_quantized_onnx_model(
+            onnx_model, ONNX_INT8_QUANTIZATION, str(ONNX_INT8_MODEL_DIR)
         )
 
-    logger.info(f"Created {len(documents)} OWASP Top 10 documents")
-    return documents
+    return SentenceTransformer(
+        str(ONNX_INT8_MODEL_DIR),
+        backend="onnx",
+        model_kwargs={"file_name": f"onnx/{ONNX_INT8_FILE_NAME}"},
+    )
+
+
+def check_quantized_fidelity(quantized_model, sample: list[str]) -> bool:
+    """
+    Compare quantized embeddings against the full-precision model on a sample.
+
+    Args:
+        quantized_model: Quantized embedding model
+        sample: Texts to embed with both models
+
+    Returns:
+        True if every sample's cosine similarity is at least FIDELITY_MIN_COSINE
+    """
+    reference = _encode(get_embedding_model(), sample)
+    candidate = _encode(quantized_model, sample)
+
+    # Both sides are L2-normalised, so the row-wise dot product is the cosine
+    min_cosine = float((reference * candidate).sum(axis=1).min())
+    logger.info(f"INT8 ONNX fidelity: min cosine {min_cosine:.4f} over {len(sample)} samples")
+    return min_cosine >= FIDELITY_MIN_COSINE
+
+
+def resolve_encoder_backend(probe: list[str]) -> str:
+    """
+    Decide the encoder backend for this run and pin it.
 
+    With ``RAG_EMBEDDING_BACKEND=onnx-int8`` the fidelity check runs once, on the
+    first batch of the run; later batches reuse the decision instead of
+    reloading the FP32 model and possibly mixing INT8 and FP32 vectors.
 
-def build_chroma_index(documents: list[dict[str, Any]], persist_directory: str) -> bool:
-    """Build Chroma vector store index."""
+    Args:
+        probe: Texts used for the one-off fidelity check
+
+    Returns:
+        'onnx-int8' or 'torch'
+    """
+    global _resolved_backend
+
+    if _resolved_backend is None:
+        _resolved_backend = "torch"
+        if EMBEDDING_BACKEND == "onnx-int8":
+            if check_quantized_fidelity(get_onnx_int8_model(), probe[:FIDELITY_SAMPLE_SIZE]):
+                _resolved_backend = "onnx-int8"
+            else:
+                logger.warning("INT8 ONNX model failed the fidelity check, using PyTorch model")
+        logger.info(f"Encoder backend pinned to {_resolved_backend} for this run")
+
+    return _resolved_backend
+
+
+def embedding_cache_path(backend: str) -> Path:
+    """Embedding cache location for a model and backend; INT8 and FP32 vectors never share one."""
+    return EMBEDDING_CACHE_DIR / f"emb_cache-{EMBEDDING_MODEL_NAME}-{backend}"
+
+
+def _encode_uncached(contents: list[str], backend: str):
+    """Run the pinned encoder backend over texts missing from the cache."""
+    logger.debug(f"Encoding {len(contents)} documents with {EMBEDDING_MODEL_NAME}...")
+
+    if backend == "onnx-int8":
+        return _encode(get_onnx_int8_model(), contents)
+    return _encode(get_embedding_model(), contents)
+
+
+def encode_documents(contents: list[str]):
+    """
+    Encode all document contents, reusing cached embeddings where possible.
+
+    Embeddings are cached on disk, one cache per encoder backend, keyed by a
+    blake2b digest of the content, so repeated and previously seen texts skip
+    the encoder. Misses are encoded in a single batched pass. With ``RAG_EMBEDDING_BACKEND=onnx-int8`` the
+    quantized ONNX model is used when it passes the fidelity check, otherwise
+    the PyTorch model is used; the choice is made once per run.
+
+    Args:
+        contents: Document texts to embed
+
+    Returns:
+        Array of L2-normalised embeddings, one row per document
+    """
+    import numpy as np
+
+    keys = [blake2b(content.encode("utf-8"), digest_size=16).hexdigest() for content in contents]
+    backend = resolve_encoder_backend(contents)
+    EMBEDDING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    with shelve.open(str(embedding_cache_path(backend))) as cache:
+        vectors = {}
+        misses = {}
+        for key, content in zip(keys, contents, strict=True):
+            if key in vectors or key in misses:
+                continue
+            if key in cache:
+                vectors[key] = cache[key]
+            else:
+                misses[key] = content
+
+        logger.debug(f"Embedding cache: {len(vectors)} hits, {len(misses)} misses")
+
+        if misses:
+            embeddings = _encode_uncached(list(misses.values()), backend)
+            for key, embedding in zip(misses, embeddings, strict=True):
+                cache[key] = vectors[key] = embedding
+
+    return np.stack([vectors[key] for key in keys]) if keys else np.empty((0, 0), np.float32)
+
+
+def content_hash_id(doc: dict[str, Any]) -> str:
+    """Derive a document id that changes whenever the document content changes."""
+    digest = blake2b(doc["content"].encode("utf-8"), digest_size=8).hexdigest()
+    return f"{doc['id']}_{digest}"
+
+
+def upsert_embeddings(collection, embeddings, **columns) -> None:
+    """
+    Upsert a slice of documents, handing Chroma the float32 ndarray directly.
+
+    Args:
+        collection: Chroma collection
+        embeddings: 2-D float32 array view for this slice
+        **columns: ids, documents and metadatas for the same slice
+    """
+    try:
+        collection.upsert(embeddings=embeddings, **columns)
+    except ValueError:
+        # Older Chroma releases only accept nested lists; convert just this slice
+        collection.upsert(embeddings=embeddings.tolist(), **columns)
+
+
+def batched(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield successive lists of up to ``size`` items (itertools.batched needs 3.12)."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def build_chroma_index(documents: Iterable[dict[str, Any]], persist_directory: str) -> bool:
+    """
+    Build or incrementally update the Chroma vector store index.
+
+    Documents are consumed as a stream in batches of ``UPSERT_BATCH_SIZE``, so
+    only one batch of contents and embeddings is held at a time. They are keyed
+    by a content-hash id: unchanged documents keep their stored embeddings and
+    only new or modified ones are encoded and upserted. Entries whose id no
+    longer appears in ``documents`` are deleted once the stream is exhausted.
+
+    Args:
+        documents: Documents with 'id', 'content' and 'metadata'
+        persist_directory: Directory for the persistent Chroma store
+
+    Returns:
+        True if successful, False otherwise
+    """
     logger.info("Building Chroma index...")
 
     try:
         import chromadb
-        from chromadb.utils import embedding_functions
+        from tqdm import tqdm
 
         # Create persist directory
         persist_path = Path(persist_directory)
@@ -208,41 +468,51 @@ def build_chroma_index(documents: list[dict[str, Any]], persist_directory: str)
         # Initialize Chroma client with persistence
         client = chromadb.PersistentClient(path=str(persist_path))
 
-        # Use sentence-transformers embedding function
-        embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
-            model_name="all-MiniLM-L6-v2"
-        )
-
-        # Get or create collection
-        try:
-            collection = client.get_collection(
-                name="cybersecurity_knowledge", embedding_function=embedding_function
-            )
-            # Delete existing collection to rebuild
-            client.delete_collection(name="cybersecurity_knowledge")
-            logger.info("Deleted existing collection")
-        except Exception:
-            pass
-
-        collection = client.create_collection(
+        # The collection keeps Chroma's default embedder (also all-MiniLM-L6-v2) for
+        # query_texts lookups, so stored and query vectors stay in the same space.
+        collection = client.get_or_create_collection(
             name="cybersecurity_knowledge",
-            embedding_function=embedding_function,
             metadata={"description": "Cybersecurity knowledge base with MITRE, NIST, OWASP"},
         )
 
-        # Add documents in batches
-        batch_size = 100
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
-            ids = [doc["id"] for doc in batch]
-            contents = [doc["content"] for doc in batch]
-            metadatas = [doc["metadata"] for doc in batch]
-
-            collection.add(documents=contents, metadatas=metadatas, ids=ids)
+        stored_ids = set(collection.get(include=[])["ids"])
+        seen_ids: set[str] = set()
+        upserted = 0
+
+        # One progress bar instead of a formatted log record per batch
+        with tqdm(desc="chroma upsert", unit="doc") as progress:
+            for batch in batched(documents, UPSERT_BATCH_SIZE):
+                progress.update(len(batch))
+
+                # Parallel (structure-of-arrays) columns for this batch's new or changed documents
+                ids, contents, metadatas = [], [], []
+                for doc in batch:
+                    doc_id = content_hash_id(doc)
+                    if doc_id in seen_ids:
+                        continue
+                    seen_ids.add(doc_id)
+                    if doc_id not in stored_ids:
+                        ids.append(doc_id)
+                        contents.append(doc["content"])
+                        metadatas.append(doc["metadata"])
+
+                if not ids:
+                    continue
+
+                # Embed the batch up front so Chroma never runs its embedding function
+                embeddings = encode_documents(contents)
+                upsert_embeddings(
+                    collection, embeddings, ids=ids, documents=contents, metadatas=metadatas
+                )
+                upserted += len(ids)
 
-            logger.info(f"Added batch {i // batch_size + 1} ({len(batch)} documents)")
+        stale_ids = list(stored_ids - seen_ids)
+        if stale_ids:
+            collection.delete(ids=stale_ids)
+            logger.info(f"Deleted {len(stale_ids)} stale documents")
 
-        logger.info(f"✅ Successfully built Chroma index with {len(documents)} documents")
+        logger.info(f"📊 {len(seen_ids) - upserted} documents unchanged, {upserted} embedded")
+        logger.info(f"✅ Chroma index up to date with {len(seen_ids)} documents")
         logger.info(f"📁 Persisted to: {persist_path.absolute()}")
 
         return True
@@ -252,34 +522,40 @@ def build_chroma_index(documents: list[dict[str, Any]], persist_directory: str)
         return False
 
 
-def main():
-    """Main function to build RAG knowledge base."""
-    logger.info("🚀 Starting RAG knowledge base build...")
+# Remote sources are fetched concurrently over one pooled client; local ones are built inline
+REMOTE_SOURCES = (download_mitre_attack,)
+LOCAL_SOURCES = (create_nist_csf_docs, create_owasp_top10_docs)
 
-    # Collect documents from all sources
-    all_documents = []
 
-    # MITRE ATT&CK
-    mitre_docs = download_mitre_attack()
-    all_documents.extend(mitre_docs)
+async def collect_documents() -> Iterator[dict[str, Any]]:
+    """
+    Collect documents from every knowledge source.
 
-    # NIST CSF
-    nist_docs = create_nist_csf_docs()
-    all_documents.extend(nist_docs)
+    Returns:
+        Lazy stream of documents from all remote sources followed by all local sources
+    """
+    limits = httpx.Limits(max_connections=8)
+    async with httpx.AsyncClient(timeout=60, limits=limits) as client:
+        remote_docs = await asyncio.gather(*(fetch(client) for fetch in REMOTE_SOURCES))
 
-    # OWASP Top 10
-    owasp_docs = create_owasp_top10_docs()
-    all_documents.extend(owasp_docs)
+    return chain(*remote_docs, *(build() for build in LOCAL_SOURCES))
+
+
+def main():
+    """Main function to build RAG knowledge base."""
+    logger.info("🚀 Starting RAG knowledge base build...")
 
-    logger.info(f"📊 Total documents collected: {len(all_documents)}")
+    # Collect documents from all sources (MITRE ATT&CK, NIST CSF, OWASP Top 10)
+    documents = asyncio.run(collect_documents())
 
-    if not all_documents:
+    first_document = next(documents, None)
+    if first_document is None:
         logger.error("❌ No documents collected. Exiting.")
         sys.exit(1)
 
     # Build Chroma index
     persist_directory = "./data/chroma"
-    success = build_chroma_index(all_documents, persist_directory)
+    success = build_chroma_index(chain([first_document], documents), persist_directory)
 
     if success:
         logger.info("🎉 RAG knowledge base build complete!")
@@ -19,24 +19,34 @@ def create_admin_user(username: str = "admin", email: str = "admin@otis.local",
     """Create initial admin user."""
     logger.info("Creating admin user", username=username)
 
-    with get_db_context() as db:
-        # Check if user exists
-        existing_user = db.query(User).filter(User.username == username).first()
-        if existing_user:
-            logger.warning("Admin user already exists", username=username)
-            return
+    # Hash before opening the session so the KDF does not hold a connection
+    hashed_password = get_password_hash(password)
 
-        # Create admin user
-        admin_user = User(
-            username=username,
-            email=email,
-            hashed_password=get_password_hash(password),
-            role=UserRole.ADMIN,
-            is_active=True,
+    with get_db_context() as db:
+        # Single round-trip: insert unless the username or email is already taken
+        if db.get_bind().dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+
+        stmt = (
+            insert(User)
+            .values(
+                username=username,
+                email=email,
+                hashed_password=hashed_password,
+                role=UserRole.ADMIN,
+                is_active=True,
+            )
+            .on_conflict_do_nothing()
         )
-        db.add(admin_user)
+        result = db.execute(stmt)
         db.commit()
 
+        if result.rowcount == 0:
+            logger.warning("Admin user already exists", username=username, email=email)
+            return
+
         logger.info("Admin user created successfully", username=username)
         print("\nAdmin user created:")
         print(f"  Username: {username}")
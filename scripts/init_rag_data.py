@@ -1,50 +1,81 @@
 #!/usr/bin/env python3
 """Initialize RAG data with MITRE ATT&CK, NIST, and OWASP knowledge."""
 import asyncio
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# Pin encoder threads before chromadb/numpy/torch are imported: one intra-op thread per
+# physical core (approximated as half the logical CPUs) and no tokenizer thread pool
+# competing with torch for the same cores
+ENCODER_THREADS = max(1, (os.cpu_count() or 2) // 2)
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+os.environ.setdefault("OMP_NUM_THREADS", str(ENCODER_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(ENCODER_THREADS))
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import httpx
-
-from src.core.config import get_settings
-from src.core.logging import configure_logging, get_logger
-from src.services.chroma import ChromaService
+from src.core.config import get_settings  # noqa: E402
+from src.core.logging import configure_logging, get_logger  # noqa: E402
+from src.rag.sources import load_mitre_techniques  # noqa: E402
+from src.services.chroma import ChromaService  # noqa: E402
 
 settings = get_settings()
 configure_logging()
 logger = get_logger(__name__)
 
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+# Large enough to fill CPU GEMM tiles; encode() length-sorts the full input, so padding stays tight
+EMBEDDING_BATCH_SIZE = 128
+
+
+@lru_cache(maxsize=1)
+def get_embedding_model():
+    """Load the sentence-transformers embedding model once per process (FP16 on CUDA)."""
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    torch.set_num_threads(ENCODER_THREADS)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Already fixed by earlier parallel work in this process
+        pass
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model = SentenceTransformer(EMBEDDING_MODEL_NAME, device=device)
+    return model.half() if device == "cuda" else model
+
+
+def encode_documents(documents: list[str]) -> list[list[float]]:
+    """Encode all documents in one batched pass with normalised embeddings (BF16 autocast on CPU)."""
+    import torch
+
+    model = get_embedding_model()
+    with torch.inference_mode(), torch.autocast(
+        device_type="cpu", dtype=torch.bfloat16, enabled=model.device.type == "cpu"
+    ):
+        embeddings = model.encode(
+            documents,
+            batch_size=EMBEDDING_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+    return embeddings.astype("float32", copy=False).tolist()
+
 
 async def download_mitre_attack() -> list[dict]:
-    """Download MITRE ATT&CK framework data."""
+    """Download MITRE ATT&CK framework data (reusing the shared on-disk cache)."""
     logger.info("Downloading MITRE ATT&CK data")
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(settings.mitre_attack_url)
-            response.raise_for_status()
-            data = response.json()
-
-            techniques = []
-            for obj in data.get("objects", []):
-                if obj.get("type") == "attack-pattern":
-                    kill_chain_phases = obj.get("kill_chain_phases", [])
-                    if kill_chain_phases and isinstance(kill_chain_phases, list) and "phase_name" in kill_chain_phases[0]:
-                        tactic = ", ".join(kill_chain_phases[0].get("phase_name", "").split("-"))
-                    else:
-                        tactic = ""
-                    techniques.append({
-                        "id": obj.get("external_references", [{}])[0].get("external_id", ""),
-                        "name": obj.get("name", ""),
-                        "description": obj.get("description", ""),
-                        "tactic": tactic,
-                    })
-
-            logger.info("Downloaded MITRE ATT&CK techniques", count=len(techniques))
-            return techniques
+        bundle = await load_mitre_techniques(url=settings.mitre_attack_url)
+        # Gunzip and JSON parsing are CPU-bound; keep them off the event loop
+        techniques = await asyncio.to_thread(list, bundle)
+        logger.info("Downloaded MITRE ATT&CK techniques", count=len(techniques))
+        return techniques
     except Exception as e:
         logger.error("Failed to download MITRE ATT&CK", error=str(e))
         return []
@@ -200,8 +231,11 @@ async def ingest_data():
         ids.append(f"owasp_{i}")
 
     # Ingest into Chroma
+    logger.info("Encoding documents", total_documents=len(documents), model=EMBEDDING_MODEL_NAME)
+    embeddings = encode_documents(documents)
+
     logger.info("Ingesting documents into Chroma", total_documents=len(documents))
-    chroma_service.add_documents(documents, metadatas, ids)
+    chroma_service.add_documents(documents, metadatas, ids, embeddings=embeddings)
 
     logger.info("RAG data ingestion completed", total_documents=len(documents))
     logger.info("Collection count", count=chroma_service.get_collection_count())
@@ -1,15 +1,48 @@
 """Multi-turn MDP-based orchestrator for adaptive adversarial attacks."""
 
+import asyncio
+import heapq
 import logging
+import math
+import sqlite3
+import sys
+from array import array
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from itertools import count
+from pathlib import Path
 
 import numpy as np
 
+from ..model.batching import PredictionBatcher
 from .red_team_engine import RedTeamEngine
 
 logger = logging.getLogger(__name__)
 
+# Append-only on-disk chain log; several orchestrators may share one file
+_CHAIN_LOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chains (
+    chain_id INTEGER PRIMARY KEY,
+    evasion_succeeded INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transitions (
+    chain_id INTEGER NOT NULL,
+    turn INTEGER NOT NULL,
+    action INTEGER NOT NULL,
+    conf_before REAL NOT NULL,
+    conf_after REAL NOT NULL,
+    label_before TEXT NOT NULL,
+    label_after TEXT NOT NULL,
+    reward REAL NOT NULL
+);
+"""
+
+
+def _label(prediction: dict) -> str:
+    """Interned prediction label, so every stored state shares one string per label."""
+    return sys.intern(prediction.get("label", "UNKNOWN"))
+
 
 class AttackType(Enum):
     """Enumeration of available attack types for MDP."""
@@ -22,19 +55,30 @@ class AttackType(Enum):
     HOMOGRAPH_SUBSTITUTION = "HOMOGRAPH_SUBSTITUTION"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AttackState:
-    """Represents state in adversarial attack MDP."""
+    """
+    Represents state in adversarial attack MDP.
+
+    States in one chain share a single append-only action log; each state sees
+    the first ``turn_count`` entries, so a turn appends one item instead of
+    copying the whole history into a new list.
+    """
 
     current_text: str
     model_confidence: float
     model_label: str
-    attack_history: list[str]
+    shared_history: list[str]
     turn_count: int
     confidence_threshold: float = 0.5  # Below this is considered evasion
 
+    @property
+    def attack_history(self) -> list[str]:
+        """Actions taken to reach this state, oldest first."""
+        return self.shared_history[: self.turn_count]
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AttackTransition:
     """Represents a transition in the MDP."""
 
@@ -44,6 +88,25 @@ class AttackTransition:
     reward: float
 
 
+@dataclass
+class BanditArm:
+    """Reward statistics for one attack type under a bandit selection policy."""
+
+    pulls: int = 0
+    total_reward: float = 0.0
+    total_reward_sq: float = 0.0
+
+    def mean(self) -> float:
+        """Average reward observed for this arm (0.0 before the first pull)."""
+        return self.total_reward / self.pulls if self.pulls else 0.0
+
+    def update(self, reward: float) -> None:
+        """Record the reward of one pull."""
+        self.pulls += 1
+        self.total_reward += reward
+        self.total_reward_sq += reward * reward
+
+
 class MultiTurnAdversarialOrchestrator:
     """
     Orchestrate multi-turn adversarial attacks using MDP framework.
@@ -56,18 +119,112 @@ class MultiTurnAdversarialOrchestrator:
     This mimics real attackers who adapt based on feedback.
     """
 
-    def __init__(self, red_team_engine: RedTeamEngine, model_classifier_func):
+    POLICIES = ("exp3", "ucb1", "heuristic")
+
+    # Lower bound on Exp3 weights (relative to the largest); keeps every arm sampleable
+    EXP3_WEIGHT_FLOOR = 1e-12
+
+    # Candidate attacks drawn at random when the model is no longer confident
+    LOW_CONFIDENCE_ATTACKS = (
+        AttackType.PROMPT_INJECTION,
+        AttackType.ENCODING_EVASION,
+        AttackType.MULTILINGUAL_INJECTION,
+    )
+    TARGETED_LOW_CONFIDENCE_ATTACKS = (
+        AttackType.PROMPT_INJECTION,
+        AttackType.ENCODING_EVASION,
+        AttackType.HOMOGRAPH_SUBSTITUTION,
+    )
+
+    def __init__(
+        self,
+        red_team_engine: RedTeamEngine,
+        model_classifier_func,
+        policy: str = "exp3",
+        exploration: float = 1.4,
+        horizon: int = 1000,
+        prediction_cache_size: int = 4096,
+        seed: int | None = None,
+        chain_log: str | Path | None = None,
+    ):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            red_team_engine: Engine used to execute attacks
+            model_classifier_func: Function mapping text to a prediction dict
+            policy: Attack selection policy: "exp3" (adversarial bandit, robust to a
+                classifier that changes over time), "ucb1" (stochastic bandit) or
+                "heuristic" (fixed confidence bands)
+            exploration: UCB1 exploration coefficient
+            horizon: Expected number of attack turns, used to set the Exp3 learning rate
+            prediction_cache_size: Number of classifier results kept per text (0 disables
+                caching, e.g. for a classifier that is retrained between calls)
+            seed: Seed for this orchestrator's random generator (reproducible runs)
+            chain_log: SQLite file to append finished chains to instead of keeping them
+                in ``attack_chains``; analysis then aggregates every chain in the file
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown policy: {policy} (expected one of {self.POLICIES})")
+
         self.red_team = red_team_engine
+        # Attack type → engine method, resolved once instead of an if/elif chain per turn
+        self._dispatch = {
+            AttackType.OBFUSCATION: red_team_engine.execute_obfuscation,
+            AttackType.SEMANTIC_SHIFT: red_team_engine.execute_semantic_shift,
+            AttackType.PROMPT_INJECTION: red_team_engine.execute_prompt_injection,
+            AttackType.MULTILINGUAL_INJECTION: red_team_engine.execute_multilingual_injection,
+            AttackType.ENCODING_EVASION: red_team_engine.execute_encoding_evasion,
+            AttackType.HOMOGRAPH_SUBSTITUTION: red_team_engine.execute_homograph_substitution,
+        }
         self.classifier = model_classifier_func
+        self.policy = policy
+        # Per-instance generator: reproducible without touching numpy's global state
+        self._rng = np.random.default_rng(seed)
+
+        # Per-instance prediction cache (a class-level lru_cache would pin the orchestrator);
+        # re-attacked seeds and repeated attack outputs skip the model call entirely
+        self._cached_prediction = lru_cache(maxsize=prediction_cache_size)(self.classifier)
+        self.exploration = exploration
 
         # Action space: available attack types
         self.action_space = list(AttackType)
 
+        # Per-action reward statistics shared by every chain run on this orchestrator
+        self.arms = {action: BanditArm() for action in self.action_space}
+
+        # Exp3 state: one weight per action and eta = sqrt(ln K / (T * K))
+        num_actions = len(self.action_space)
+        self.exp3_eta = math.sqrt(math.log(num_actions) / (horizon * num_actions))
+        self.exp3_weights = np.ones(num_actions)
+        self._action_index = {action: i for i, action in enumerate(self.action_space)}
+
         # Track attack chains for analysis
         self.attack_chains: list[list[AttackTransition]] = []
+        # Column store of every recorded transition (action index, reward) for analysis
+        self._action_ids = array("b")
+        self._rewards = array("f")
+
+        # Long sweeps stream chains to disk so memory stays flat
+        self._chain_log: sqlite3.Connection | None = None
+        if chain_log is not None:
+            self._chain_log = sqlite3.connect(chain_log)
+            self._chain_log.executescript(_CHAIN_LOG_SCHEMA)
 
         logger.info(f"MDP Orchestration engine initialized with {len(self.action_space)} actions")
 
+    def _predict(self, text: str) -> dict:
+        """
+        Classify text, serving repeated texts from the prediction cache.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            Prediction dict (a copy, so callers cannot alter the cached entry)
+        """
+        return dict(self._cached_prediction(text))
+
     def calculate_reward(self, state_before: AttackState, state_after: AttackState) -> float:
         """
         Calculate reward based on state transition.
@@ -79,33 +236,176 @@ class MultiTurnAdversarialOrchestrator:
         Returns:
             Reward value (+1 for evasion, -1 for detection maintained, 0 for neutral)
         """
-        # Check for label flip (e.g., from SPAM to NOT_SPAM)
-        label_flip = state_before.model_label != state_after.model_label
+        # Evasion checks run cheapest first and return as soon as one holds
+        # Label flip (e.g., from SPAM to NOT_SPAM)
+        if state_before.model_label != state_after.model_label:
+            return 1.0
 
-        # Check for significant confidence drop
-        confidence_drop = state_before.model_confidence - state_after.model_confidence
-        significant_drop = confidence_drop > 0.3  # 30% confidence drop
+        confidence_before = state_before.model_confidence
+        confidence_after = state_after.model_confidence
 
-        # Check for confidence threshold crossing
-        crossed_threshold = (
-            state_before.model_confidence > state_before.confidence_threshold
-            and state_after.model_confidence < state_after.confidence_threshold
-        )
+        # Significant (30%) confidence drop
+        if confidence_before - confidence_after > 0.3:
+            return 1.0
 
-        # Positive reward if any evasion condition is met
-        if label_flip or significant_drop or crossed_threshold:
+        # Confidence threshold crossing
+        if (
+            confidence_before > state_before.confidence_threshold
+            and confidence_after < state_after.confidence_threshold
+        ):
             return 1.0
 
-        # Negative reward if confidence actually increases (attack backfired)
-        if state_after.model_confidence > state_before.model_confidence:
-            return -1.0
+        # Negative reward if confidence actually increases (attack backfired), else neutral
+        return -1.0 if confidence_after > confidence_before else 0.0
+
+    @staticmethod
+    def calculate_rewards(
+        confidence_before,
+        labels_before,
+        confidence_after,
+        labels_after,
+        confidence_threshold=0.5,
+    ) -> np.ndarray:
+        """
+        Vectorized :meth:`calculate_reward` for replaying many transitions at once.
+
+        Args:
+            confidence_before: Model confidences before each attack
+            labels_before: Model labels before each attack
+            confidence_after: Model confidences after each attack
+            labels_after: Model labels after each attack
+            confidence_threshold: Evasion threshold (scalar or one per transition)
+
+        Returns:
+            float32 array of rewards (+1 evasion, -1 backfire, 0 neutral)
+        """
+        # Compare in float64 so borderline drops match the scalar path on Python floats
+        conf_before = np.asarray(confidence_before, dtype=np.float64)
+        conf_after = np.asarray(confidence_after, dtype=np.float64)
+        threshold = np.asarray(confidence_threshold, dtype=np.float64)
+
+        label_flip = np.asarray(labels_before, dtype=object) != np.asarray(
+            labels_after, dtype=object
+        )
+        significant_drop = (conf_before - conf_after) > 0.3
+        crossed_threshold = (conf_before > threshold) & (conf_after < threshold)
 
-        # Neutral reward otherwise
-        return 0.0
+        evasion = label_flip | significant_drop | crossed_threshold
+        backfire = (conf_after > conf_before) & ~evasion
+        return evasion.astype(np.float32) - backfire.astype(np.float32)
 
     def select_adaptive_attack(self, current_state: AttackState) -> AttackType:
         """
-        Select next attack based on current state using adaptive strategy.
+        Select next attack based on current state using the configured policy.
+
+        Args:
+            current_state: Current state in the MDP
+
+        Returns:
+            Selected AttackType
+        """
+        if self.policy == "heuristic":
+            return self._select_heuristic(current_state)
+        if self.policy == "ucb1":
+            return self._select_ucb1()
+        return self._select_exp3()
+
+    def update_policy(self, action: AttackType, reward: float) -> None:
+        """
+        Feed the reward of an executed attack back into the selection policy.
+
+        Args:
+            action: Attack that was executed
+            reward: Reward from calculate_reward
+        """
+        self.arms[action].update(reward)
+
+        if self.policy == "exp3":
+            # Importance-weighted loss in [0, 1] from reward in {-1, 0, +1}
+            index = self._action_index[action]
+            weights = self.exp3_weights
+            prob = weights[index] / weights.sum()
+            loss = (1.0 - reward) / 2.0
+            weights[index] *= math.exp(-self.exp3_eta * loss / prob)
+            # Rescale so the largest weight is 1, then floor the rest: a rarely chosen
+            # arm has a tiny prob, and its update would otherwise underflow to exactly 0
+            weights /= weights.max()
+            np.maximum(weights, self.EXP3_WEIGHT_FLOOR, out=weights)
+
+    def _select_exp3(self) -> AttackType:
+        """
+        Sample an attack from the Exp3 distribution pi = w / sum(w).
+
+        Returns:
+            Selected AttackType
+        """
+        probs = self.exp3_weights / self.exp3_weights.sum()
+        return self.action_space[self._rng.choice(len(probs), p=probs)]
+
+    def _pick(self, actions: tuple[AttackType, ...]) -> AttackType:
+        """Draw one attack uniformly from a fixed candidate tuple."""
+        return actions[self._rng.integers(len(actions))]
+
+    def _select_ucb1(self) -> AttackType:
+        """
+        Select the attack with the highest UCB1 score.
+
+        Every arm is tried once before scores are compared; afterwards the mean
+        reward is traded off against an exploration bonus that shrinks as an arm
+        is pulled, so classifier calls concentrate on attacks that evade.
+
+        Returns:
+            Selected AttackType
+        """
+        scores = self._ucb1_scores()
+        return max(scores, key=scores.get)
+
+    def _ucb1_scores(self) -> dict[AttackType, float]:
+        """UCB1 score per attack; arms never pulled score infinity so they are tried first."""
+        total_pulls = sum(arm.pulls for arm in self.arms.values())
+        log_total = math.log(total_pulls) if total_pulls else 0.0
+        return {
+            action: (
+                arm.mean() + self.exploration * math.sqrt(2 * log_total / arm.pulls)
+                if arm.pulls
+                else math.inf
+            )
+            for action, arm in self.arms.items()
+        }
+
+    def _select_candidates(self, current_state: AttackState, k: int) -> list[AttackType]:
+        """
+        Select up to ``k`` distinct attacks to expand from a state, best first.
+
+        Args:
+            current_state: State being expanded
+            k: Number of candidate attacks
+
+        Returns:
+            Distinct AttackTypes ranked by the configured policy
+        """
+        k = min(k, len(self.action_space))
+        if k == 1:
+            return [self.select_adaptive_attack(current_state)]
+
+        if self.policy == "ucb1":
+            scores = self._ucb1_scores()
+            return sorted(scores, key=scores.get, reverse=True)[:k]
+        if self.policy == "exp3":
+            probs = self.exp3_weights / self.exp3_weights.sum()
+            # Sampling without replacement needs k arms with non-zero probability;
+            # any remaining slots take the other attacks in action-space order
+            sampled = min(k, np.count_nonzero(probs))
+            indices = self._rng.choice(len(probs), size=sampled, replace=False, p=probs).tolist()
+            indices += [i for i in range(len(probs)) if i not in indices][: k - sampled]
+            return [self.action_space[i] for i in indices]
+
+        first = self._select_heuristic(current_state)
+        return [first] + [action for action in self.action_space if action != first][: k - 1]
+
+    def _select_heuristic(self, current_state: AttackState) -> AttackType:
+        """
+        Select next attack from fixed confidence bands.
 
         Strategy:
         - High confidence (0.8+): Use strong obfuscation attacks
@@ -129,13 +429,7 @@ class MultiTurnAdversarialOrchestrator:
             return AttackType.SEMANTIC_SHIFT
         elif confidence > 0.3:
             # Lower confidence - use injection/encoding
-            return np.random.choice(
-                [
-                    AttackType.PROMPT_INJECTION,
-                    AttackType.ENCODING_EVASION,
-                    AttackType.MULTILINGUAL_INJECTION,
-                ]
-            )
+            return self._pick(self.LOW_CONFIDENCE_ATTACKS)
         else:
             # Very low confidence - try to confuse model further
             return AttackType.HOMOGRAPH_SUBSTITUTION
@@ -146,6 +440,8 @@ class MultiTurnAdversarialOrchestrator:
         max_turns: int = 5,
         confidence_threshold: float = 0.5,
         target_label: str = "NOT_SPAM",  # What we want the model to predict
+        beam: int = 1,
+        include_transitions: bool = True,
     ) -> dict:
         """
         Generate adaptive multi-turn attack chain.
@@ -156,11 +452,18 @@ class MultiTurnAdversarialOrchestrator:
         3. Adapt: Select next attack based on confidence
         4. Repeat until evasion or max turns reached
 
+        With ``beam > 1`` the chain becomes a best-first tree search: the live state
+        with the lowest model confidence is expanded with ``beam`` candidate attacks,
+        children whose attack backfired are pruned, and the search stops at the first
+        evasion or after ``max_turns * beam`` classifier calls.
+
         Args:
             initial_text: Starting text to attack
             max_turns: Maximum attack turns (depth of search)
             confidence_threshold: Threshold for successful evasion
             target_label: Desired model label
+            beam: Number of candidate attacks expanded per step (1 = linear chain)
+            include_transitions: Include the per-transition breakdown in the result
 
         Returns:
             Dict with attack chain results
@@ -168,120 +471,344 @@ class MultiTurnAdversarialOrchestrator:
 
         # Initial prediction
         try:
-            initial_prediction = self.classifier(initial_text)
+            initial_prediction = self._predict(initial_text)
         except Exception as e:
             logger.error(f"Initial model prediction failed: {e}")
             return {"error": f"Model prediction failed: {e}"}
 
-        initial_state = AttackState(
-            current_text=initial_text,
-            model_confidence=initial_prediction.get("score", 0.0),
-            model_label=initial_prediction.get("label", "UNKNOWN"),
-            attack_history=[],
-            turn_count=0,
-            confidence_threshold=confidence_threshold,
-        )
+        initial_state = self._initial_state(initial_text, initial_prediction, confidence_threshold)
+        if beam > 1:
+            return self._beam_search(
+                initial_state, max_turns, target_label, beam, include_transitions
+            )
 
         current_state = initial_state
         transitions = []
         evasion_succeeded = False
 
         for turn in range(max_turns):
-            # Select next attack based on adaptive strategy
-            selected_attack = self.select_adaptive_attack(current_state)
-
-            logger.info(
-                f"Turn {turn + 1}: Selected attack '{selected_attack.value}' "
-                f"for confidence {current_state.model_confidence:.3f}"
-            )
-
             try:
-                # Execute selected attack
-                if selected_attack == AttackType.OBFUSCATION:
-                    modified_text, metadata = self.red_team.execute_obfuscation(
-                        current_state.current_text
-                    )
-                elif selected_attack == AttackType.SEMANTIC_SHIFT:
-                    modified_text, metadata = self.red_team.execute_semantic_shift(
-                        current_state.current_text
-                    )
-                elif selected_attack == AttackType.PROMPT_INJECTION:
-                    modified_text, metadata = self.red_team.execute_prompt_injection(
-                        current_state.current_text
-                    )
-                elif selected_attack == AttackType.MULTILINGUAL_INJECTION:
-                    modified_text, metadata = self.red_team.execute_multilingual_injection(
-                        current_state.current_text
-                    )
-                elif selected_attack == AttackType.ENCODING_EVASION:
-                    modified_text, metadata = self.red_team.execute_encoding_evasion(
-                        current_state.current_text
-                    )
-                elif selected_attack == AttackType.HOMOGRAPH_SUBSTITUTION:
-                    modified_text, metadata = self.red_team.execute_homograph_substitution(
-                        current_state.current_text
-                    )
-                else:
-                    raise ValueError(f"Unknown attack type: {selected_attack}")
+                selected_attack, modified_text = self._attack_turn(current_state, turn)
 
                 # Get new model prediction
-                new_prediction = self.classifier(modified_text)
-                new_confidence = new_prediction.get("score", 0.0)
-                new_label = new_prediction.get("label", "UNKNOWN")
-
-                # Create new state
-                new_state = AttackState(
-                    current_text=modified_text,
-                    model_confidence=new_confidence,
-                    model_label=new_label,
-                    attack_history=current_state.attack_history + [selected_attack.value],
-                    turn_count=turn + 1,
-                    confidence_threshold=confidence_threshold,
-                )
+                new_prediction = self._predict(modified_text)
 
-                # Calculate reward for this transition
-                reward = self.calculate_reward(current_state, new_state)
-
-                # Create transition record
-                transition = AttackTransition(
-                    state_before=current_state,
-                    action_taken=selected_attack,
-                    state_after=new_state,
-                    reward=reward,
+                transition = self._record_transition(
+                    current_state, selected_attack, modified_text, new_prediction
                 )
-
                 transitions.append(transition)
 
-                # Check for successful evasion
-                # Evasion if: 1) target label achieved, or 2) confidence below threshold
-                if (
-                    new_label == target_label
-                    or new_confidence < confidence_threshold
-                    or reward > 0.5
-                ):  # High positive reward indicates success
+                if self._is_evasion(transition, target_label):
                     evasion_succeeded = True
                     logger.info(f"Evasion succeeded at turn {turn + 1}")
                     break
 
                 # Update state for next iteration
-                current_state = new_state
+                current_state = transition.state_after
 
-                logger.info(
-                    f"Turn {turn + 1}: {selected_attack.value} → "
-                    f"confidence: {new_confidence:.3f}, reward: {reward:.2f}"
+            except Exception as e:
+                logger.error(f"Attack execution failed at turn {turn + 1}: {e}")
+                break  # Stop on error
+
+        return self._finish_chain(
+            initial_state,
+            current_state,
+            transitions,
+            evasion_succeeded,
+            max_turns,
+            include_transitions,
+        )
+
+    def _beam_search(
+        self,
+        initial_state: AttackState,
+        max_turns: int,
+        target_label: str,
+        beam: int,
+        include_transitions: bool,
+    ) -> dict:
+        """Best-first expansion of attack states within a classifier-call budget."""
+        budget = max_turns * beam
+        predictions = 0
+        transitions = []
+        evasion_succeeded = False
+        best_state = initial_state
+
+        # Min-heap on confidence: the least confident live state is the most promising
+        order = count()
+        frontier = [(initial_state.model_confidence, next(order), initial_state)]
+
+        while frontier and predictions < budget and not evasion_succeeded:
+            _, _, state = heapq.heappop(frontier)
+
+            for selected_attack in self._select_candidates(state, beam):
+                if predictions >= budget:
+                    break
+                try:
+                    modified_text, _ = self._execute_attack(selected_attack, state.current_text)
+                    new_prediction = self._predict(modified_text)
+                except Exception as e:
+                    logger.error(f"Attack expansion failed at depth {state.turn_count + 1}: {e}")
+                    continue
+                predictions += 1
+
+                transition = self._record_transition(
+                    state, selected_attack, modified_text, new_prediction
                 )
+                transitions.append(transition)
+                child = transition.state_after
+
+                if self._is_evasion(transition, target_label):
+                    evasion_succeeded = True
+                    best_state = child
+                    logger.info(f"Evasion succeeded at depth {child.turn_count}")
+                    break
+
+                # Prune branches where the attack backfired
+                if transition.reward < 0 and child.model_confidence > state.model_confidence:
+                    continue
+                if child.model_confidence < best_state.model_confidence:
+                    best_state = child
+                heapq.heappush(frontier, (child.model_confidence, next(order), child))
+
+        return self._finish_chain(
+            initial_state,
+            best_state,
+            transitions,
+            evasion_succeeded,
+            max_turns,
+            include_transitions,
+        )
+
+    async def agenerate_adaptive_attack_chain(
+        self,
+        initial_text: str,
+        predict_func,
+        max_turns: int = 5,
+        confidence_threshold: float = 0.5,
+        target_label: str = "NOT_SPAM",
+        include_transitions: bool = True,
+    ) -> dict:
+        """
+        Async variant of :meth:`generate_adaptive_attack_chain`.
+
+        Each classifier call is awaited, so many chains can run concurrently and
+        share a batching predictor (see :meth:`agenerate_adaptive_attack_chains`).
+
+        Args:
+            initial_text: Starting text to attack
+            predict_func: Coroutine function mapping a text to a prediction dict
+            max_turns: Maximum attack turns (depth of search)
+            confidence_threshold: Threshold for successful evasion
+            target_label: Desired model label
+            include_transitions: Include the per-transition breakdown in the result
+
+        Returns:
+            Dict with attack chain results
+        """
+        try:
+            initial_prediction = await predict_func(initial_text)
+        except Exception as e:
+            logger.error(f"Initial model prediction failed: {e}")
+            return {"error": f"Model prediction failed: {e}"}
+
+        initial_state = self._initial_state(initial_text, initial_prediction, confidence_threshold)
+        current_state = initial_state
+        transitions = []
+        evasion_succeeded = False
+
+        for turn in range(max_turns):
+            try:
+                selected_attack, modified_text = self._attack_turn(current_state, turn)
+                new_prediction = await predict_func(modified_text)
+
+                transition = self._record_transition(
+                    current_state, selected_attack, modified_text, new_prediction
+                )
+                transitions.append(transition)
+
+                if self._is_evasion(transition, target_label):
+                    evasion_succeeded = True
+                    logger.info(f"Evasion succeeded at turn {turn + 1}")
+                    break
+
+                current_state = transition.state_after
 
             except Exception as e:
                 logger.error(f"Attack execution failed at turn {turn + 1}: {e}")
                 break  # Stop on error
 
+        return self._finish_chain(
+            initial_state,
+            current_state,
+            transitions,
+            evasion_succeeded,
+            max_turns,
+            include_transitions,
+        )
+
+    async def agenerate_adaptive_attack_chains(
+        self,
+        texts: list[str],
+        batch_classifier_func=None,
+        max_batch: int = 32,
+        max_wait_ms: float = 5.0,
+        include_transitions: bool = False,
+        **chain_kwargs,
+    ) -> list[dict]:
+        """
+        Run one adaptive attack chain per text concurrently with batched predictions.
+
+        While a chain executes its next attack the others keep queueing classifier
+        requests; a :class:`PredictionBatcher` coalesces them into one model call.
+
+        Args:
+            texts: Starting texts, one chain each
+            batch_classifier_func: Function (sync or async) mapping a list of texts to a
+                list of prediction dicts; defaults to the cached single-text classifier
+            max_batch: Maximum number of texts per model call
+            max_wait_ms: Maximum time to wait for a batch to fill, in milliseconds
+            include_transitions: Include per-transition breakdowns; off by default for
+                sweeps, use :meth:`describe_transitions` on ``attack_chains`` instead
+            **chain_kwargs: Passed to :meth:`agenerate_adaptive_attack_chain`
+
+        Returns:
+            Chain results in input order
+        """
+        if batch_classifier_func is None:
+
+            def batch_classifier_func(batch: list[str]) -> list[dict]:
+                return [self._predict(text) for text in batch]
+
+        batcher = PredictionBatcher(
+            batch_classifier_func, max_batch=max_batch, max_wait_ms=max_wait_ms
+        )
+        try:
+            results = await asyncio.gather(
+                *(
+                    self.agenerate_adaptive_attack_chain(
+                        text,
+                        batcher.predict,
+                        include_transitions=include_transitions,
+                        **chain_kwargs,
+                    )
+                    for text in texts
+                )
+            )
+        finally:
+            await batcher.close()
+
+        logger.info(f"Ran {len(texts)} attack chains in {batcher.batches_dispatched} model calls")
+        return list(results)
+
+    @staticmethod
+    def _initial_state(
+        initial_text: str, prediction: dict, confidence_threshold: float
+    ) -> AttackState:
+        """Build the starting state of a chain from the first prediction."""
+        return AttackState(
+            current_text=initial_text,
+            model_confidence=prediction.get("score", 0.0),
+            model_label=_label(prediction),
+            shared_history=[],
+            turn_count=0,
+            confidence_threshold=confidence_threshold,
+        )
+
+    def _attack_turn(self, current_state: AttackState, turn: int) -> tuple[AttackType, str]:
+        """Select the next attack for a state and apply it to the state's text."""
+        # Select next attack based on adaptive strategy
+        selected_attack = self.select_adaptive_attack(current_state)
+
+        logger.info(
+            f"Turn {turn + 1}: Selected attack '{selected_attack.value}' "
+            f"for confidence {current_state.model_confidence:.3f}"
+        )
+
+        modified_text, _ = self._execute_attack(selected_attack, current_state.current_text)
+        return selected_attack, modified_text
+
+    def _execute_attack(self, attack: AttackType, text: str) -> tuple[str, dict]:
+        """Run one attack through the red team engine."""
+        try:
+            execute = self._dispatch[attack]
+        except KeyError:
+            raise ValueError(f"Unknown attack type: {attack}") from None
+        return execute(text)
+
+    def _record_transition(
+        self,
+        current_state: AttackState,
+        selected_attack: AttackType,
+        modified_text: str,
+        new_prediction: dict,
+    ) -> AttackTransition:
+        """Build the next state, score the transition and feed the reward to the policy."""
+        new_confidence = new_prediction.get("score", 0.0)
+
+        # Reuse the parent's text object when the attack left it unchanged
+        if modified_text == current_state.current_text:
+            modified_text = current_state.current_text
+
+        # Create new state, extending the shared log unless another branch already has
+        history = current_state.shared_history
+        if len(history) != current_state.turn_count:
+            history = history[: current_state.turn_count]
+        history.append(selected_attack.value)
+        new_state = AttackState(
+            current_text=modified_text,
+            model_confidence=new_confidence,
+            model_label=_label(new_prediction),
+            shared_history=history,
+            turn_count=current_state.turn_count + 1,
+            confidence_threshold=current_state.confidence_threshold,
+        )
+
+        # Calculate reward for this transition
+        reward = self.calculate_reward(current_state, new_state)
+        self.update_policy(selected_attack, reward)
+
+        logger.info(
+            f"Turn {new_state.turn_count}: {selected_attack.value} → "
+            f"confidence: {new_confidence:.3f}, reward: {reward:.2f}"
+        )
+
+        return AttackTransition(
+            state_before=current_state,
+            action_taken=selected_attack,
+            state_after=new_state,
+            reward=reward,
+        )
+
+    @staticmethod
+    def _is_evasion(transition: AttackTransition, target_label: str) -> bool:
+        """Check whether a transition counts as a successful evasion."""
+        # Evasion if: 1) target label achieved, 2) confidence below threshold, or
+        # 3) high positive reward
+        state = transition.state_after
+        return (
+            state.model_label == target_label
+            or state.model_confidence < state.confidence_threshold
+            or transition.reward > 0.5
+        )
+
+    def _finish_chain(
+        self,
+        initial_state: AttackState,
+        current_state: AttackState,
+        transitions: list[AttackTransition],
+        evasion_succeeded: bool,
+        max_turns: int,
+        include_transitions: bool = True,
+    ) -> dict:
+        """Record a completed chain and summarise it."""
         # Calculate overall chain metrics
         total_reward = sum(t.reward for t in transitions) if transitions else 0
         avg_reward = total_reward / len(transitions) if transitions else 0
 
         result = {
             "evasion_succeeded": evasion_succeeded,
-            "initial_text": initial_text,
+            "initial_text": initial_state.current_text,
             "final_text": current_state.current_text,
             "initial_confidence": initial_state.model_confidence,
             "final_confidence": current_state.model_confidence,
@@ -292,21 +819,16 @@ class MultiTurnAdversarialOrchestrator:
             "max_turns": max_turns,
             "total_reward": total_reward,
             "avg_reward": avg_reward,
-            "transitions": [
-                {
-                    "turn": i + 1,
-                    "action": t.action_taken.value,
-                    "confidence_before": t.state_before.model_confidence,
-                    "confidence_after": t.state_after.model_confidence,
-                    "label_before": t.state_before.model_label,
-                    "label_after": t.state_after.model_label,
-                    "reward": t.reward,
-                }
-                for i, t in enumerate(transitions)
-            ],
         }
+        if include_transitions:
+            result["transitions"] = self.describe_transitions(transitions)
 
-        self.attack_chains.append(transitions)
+        if self._chain_log is None:
+            self.attack_chains.append(transitions)
+            self._action_ids.extend(self._action_index[t.action_taken] for t in transitions)
+            self._rewards.extend(t.reward for t in transitions)
+        else:
+            self._log_chain(transitions, evasion_succeeded)
         logger.info(
             f"Attack chain completed: {len(transitions)} transitions, "
             f"success: {evasion_succeeded}, total reward: {total_reward:.2f}"
@@ -314,6 +836,59 @@ class MultiTurnAdversarialOrchestrator:
 
         return result
 
+    def _log_chain(self, transitions: list[AttackTransition], evasion_succeeded: bool) -> None:
+        """Append one finished chain to the on-disk log in a single transaction."""
+        with self._chain_log:
+            chain_id = self._chain_log.execute(
+                "INSERT INTO chains (evasion_succeeded) VALUES (?)", (evasion_succeeded,)
+            ).lastrowid
+            self._chain_log.executemany(
+                "INSERT INTO transitions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        chain_id,
+                        t.state_after.turn_count,
+                        self._action_index[t.action_taken],
+                        t.state_before.model_confidence,
+                        t.state_after.model_confidence,
+                        t.state_before.model_label,
+                        t.state_after.model_label,
+                        t.reward,
+                    )
+                    for t in transitions
+                ],
+            )
+
+    def close(self) -> None:
+        """Close the on-disk chain log, if one is open."""
+        if self._chain_log is not None:
+            self._chain_log.close()
+            self._chain_log = None
+
+    @staticmethod
+    def describe_transitions(transitions: list[AttackTransition]) -> list[dict]:
+        """
+        Summarise recorded transitions as plain dicts.
+
+        Args:
+            transitions: A chain from ``attack_chains``
+
+        Returns:
+            One dict per transition with action, confidences, labels and reward
+        """
+        return [
+            {
+                "turn": t.state_after.turn_count,
+                "action": t.action_taken.value,
+                "confidence_before": t.state_before.model_confidence,
+                "confidence_after": t.state_after.model_confidence,
+                "label_before": t.state_before.model_label,
+                "label_after": t.state_after.model_label,
+                "reward": t.reward,
+            }
+            for t in transitions
+        ]
+
     def generate_targeted_attack(
         self,
         target_text: str,
@@ -335,7 +910,7 @@ class MultiTurnAdversarialOrchestrator:
         """
         # Start with initial state
         try:
-            initial_prediction = self.classifier(target_text)
+            initial_prediction = self._predict(target_text)
         except Exception as e:
             logger.error(f"Initial prediction failed: {e}")
             return {"error": f"Model prediction failed: {e}"}
@@ -366,33 +941,14 @@ class MultiTurnAdversarialOrchestrator:
                 selected_attack = AttackType.SEMANTIC_SHIFT
             else:
                 # Low confidence - try various attacks
-                selected_attack = np.random.choice(
-                    [
-                        AttackType.PROMPT_INJECTION,
-                        AttackType.ENCODING_EVASION,
-                        AttackType.HOMOGRAPH_SUBSTITUTION,
-                    ]
-                )
+                selected_attack = self._pick(self.TARGETED_LOW_CONFIDENCE_ATTACKS)
 
             # Execute attack
             try:
-                if selected_attack == AttackType.OBFUSCATION:
-                    modified_text, _ = self.red_team.execute_obfuscation(current_text)
-                elif selected_attack == AttackType.SEMANTIC_SHIFT:
-                    modified_text, _ = self.red_team.execute_semantic_shift(current_text)
-                elif selected_attack == AttackType.PROMPT_INJECTION:
-                    modified_text, _ = self.red_team.execute_prompt_injection(current_text)
-                elif selected_attack == AttackType.MULTILINGUAL_INJECTION:
-                    modified_text, _ = self.red_team.execute_multilingual_injection(current_text)
-                elif selected_attack == AttackType.ENCODING_EVASION:
-                    modified_text, _ = self.red_team.execute_encoding_evasion(current_text)
-                elif selected_attack == AttackType.HOMOGRAPH_SUBSTITUTION:
-                    modified_text, _ = self.red_team.execute_homograph_substitution(current_text)
-                else:
-                    raise ValueError(f"Unknown attack: {selected_attack}")
+                modified_text, _ = self._execute_attack(selected_attack, current_text)
 
                 # Get new prediction
-                new_prediction = self.classifier(modified_text)
+                new_prediction = self._predict(modified_text)
 
                 # Update state
                 current_text = modified_text
@@ -436,45 +992,56 @@ class MultiTurnAdversarialOrchestrator:
         Returns:
             Dict with statistics about attack effectiveness
         """
+        if self._chain_log is not None:
+            return self._analyze_chain_log()
         if not self.attack_chains:
             return {"error": "No attack chains recorded yet"}
 
-        # Flatten all transitions
-        all_transitions = []
-        for chain in self.attack_chains:
-            all_transitions.extend(chain)
+        # Per-action counts and sums in one C-level pass over the transition columns
+        action_ids = np.frombuffer(self._action_ids, dtype=np.int8)
+        rewards = np.frombuffer(self._rewards, dtype=np.float32)
+        num_actions = len(self.action_space)
+
+        totals = np.bincount(action_ids, minlength=num_actions)
+        reward_sums = np.bincount(action_ids, weights=rewards, minlength=num_actions)
+        positives = np.bincount(action_ids[rewards > 0], minlength=num_actions)
+        negatives = np.bincount(action_ids[rewards < 0], minlength=num_actions)
+
+        rows = [
+            (index, totals[index], reward_sums[index], positives[index], negatives[index])
+            for index in np.flatnonzero(totals)
+        ]
+        return self._effectiveness_report(len(self.attack_chains), len(action_ids), rows)
+
+    def _analyze_chain_log(self) -> dict:
+        """Aggregate every chain in the on-disk log, including other writers' chains."""
+        total_chains = self._chain_log.execute("SELECT COUNT(*) FROM chains").fetchone()[0]
+        if not total_chains:
+            return {"error": "No attack chains recorded yet"}
+
+        rows = self._chain_log.execute(
+            "SELECT action, COUNT(*), SUM(reward), SUM(reward > 0), SUM(reward < 0) "
+            "FROM transitions GROUP BY action ORDER BY action"
+        ).fetchall()
+        return self._effectiveness_report(total_chains, sum(row[1] for row in rows), rows)
 
-        # Calculate statistics by attack type
+    def _effectiveness_report(
+        self, total_chains: int, total_transitions: int, rows: list[tuple]
+    ) -> dict:
+        """Build the effectiveness summary from (action index, total, sum, pos, neg) rows."""
         stats_by_type = {}
-
-        for transition in all_transitions:
-            attack_type = transition.action_taken.value
-            if attack_type not in stats_by_type:
-                stats_by_type[attack_type] = {
-                    "total": 0,
-                    "positive_rewards": 0,
-                    "negative_rewards": 0,
-                    "avg_reward": 0.0,
-                    "reward_sum": 0.0,
-                }
-
-            stats = stats_by_type[attack_type]
-            stats["total"] += 1
-            stats["reward_sum"] += transition.reward
-
-            if transition.reward > 0:
-                stats["positive_rewards"] += 1
-            elif transition.reward < 0:
-                stats["negative_rewards"] += 1
-
-        # Calculate averages
-        for attack_type, stats in stats_by_type.items():
-            if stats["total"] > 0:
-                stats["avg_reward"] = stats["reward_sum"] / stats["total"]
+        for index, total, reward_sum, positives, negatives in rows:
+            stats_by_type[self.action_space[index].value] = {
+                "total": int(total),
+                "positive_rewards": int(positives),
+                "negative_rewards": int(negatives),
+                "avg_reward": float(reward_sum) / int(total),
+                "reward_sum": float(reward_sum),
+            }
 
         return {
-            "total_chains": len(self.attack_chains),
-            "total_transitions": len(all_transitions),
+            "total_chains": total_chains,
+            "total_transitions": total_transitions,
             "attack_effectiveness": stats_by_type,
             "best_attack_type": (
                 max(stats_by_type.items(), key=lambda x: x[1]["avg_reward"])
@@ -2,8 +2,15 @@
 
 import logging
 import random
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+
+import numpy as np
 
 from .attack_vectors import (
     AttackResult,
@@ -18,6 +25,33 @@ from .attack_vectors import (
 logger = logging.getLogger(__name__)
 
 
+def _safe_predict(model_predict_func, text: str, context: str) -> dict | None:
+    """Run a model prediction, logging and returning None on failure."""
+    try:
+        return model_predict_func(text)
+    except Exception as e:
+        logger.error("Model prediction failed %s '%.50s...': %s", context, text, e)
+        return None
+
+
+def _safe_predict_batch(
+    model_predict_batch_func, texts: list[str], batch_size: int
+) -> list[dict | None]:
+    """Run batched model predictions in chunks, yielding None for every text of a failed chunk."""
+    predictions = []
+    for start in range(0, len(texts), batch_size):
+        chunk = texts[start : start + batch_size]
+        try:
+            chunk_preds = model_predict_batch_func(chunk)
+            if len(chunk_preds) != len(chunk):
+                raise ValueError(f"got {len(chunk_preds)} predictions for {len(chunk)} texts")
+        except Exception as e:
+            logger.error("Batched model prediction failed for %d texts: %s", len(chunk), e)
+            chunk_preds = [None] * len(chunk)
+        predictions.extend(chunk_preds)
+    return predictions
+
+
 @dataclass
 class AttackHistory:
     """Track history of attack attempts."""
@@ -32,6 +66,58 @@ class AttackHistory:
     metadata: dict
 
 
+class AttackHistoryLog:
+    """
+    Append-only list of AttackHistory entries with column-stored confidences.
+
+    Rows are kept as AttackHistory objects, while the two confidence values are
+    also appended to contiguous float arrays so threshold queries compare whole
+    columns at once and only build results for the matching rows.
+    """
+
+    __slots__ = ("_rows", "_before", "_after")
+
+    def __init__(self, entries: Iterable[AttackHistory] = ()):
+        self._rows: list[AttackHistory] = []
+        self._before = array("d")
+        self._after = array("d")
+        self.extend(entries)
+
+    def append(self, entry: AttackHistory) -> None:
+        """Record one attack attempt."""
+        self._rows.append(entry)
+        self._before.append(entry.confidence_before)
+        self._after.append(entry.confidence_after)
+
+    def extend(self, entries: Iterable[AttackHistory]) -> None:
+        """Record several attack attempts."""
+        for entry in entries:
+            self.append(entry)
+
+    def with_confidence_drop_over(self, min_drop: float) -> list[AttackHistory]:
+        """
+        Select entries whose confidence fell by more than ``min_drop``.
+
+        Args:
+            min_drop: Minimum confidence drop
+
+        Returns:
+            Matching AttackHistory entries in insertion order
+        """
+        before = np.frombuffer(self._before, dtype=np.float64)
+        after = np.frombuffer(self._after, dtype=np.float64)
+        return [self._rows[i] for i in np.flatnonzero(after < before - min_drop)]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[AttackHistory]:
+        return iter(self._rows)
+
+    def __getitem__(self, index):
+        return self._rows[index]
+
+
 @dataclass
 class RobustnessReport:
     """Report of model robustness metrics."""
@@ -53,7 +139,7 @@ class RedTeamEngine:
     """
 
     def __init__(self):
-        self.attack_history: list[AttackHistory] = []
+        self.attack_history = AttackHistoryLog()
         self.character_obfuscation = CharacterObfuscationAttack()
         self.semantic_shift = SemanticShiftAttack()
         self.prompt_injection = PromptInjectionAttack()
@@ -85,18 +171,23 @@ class RedTeamEngine:
         Returns:
             AttackResult with the results of the attack
         """
-        if attack_name not in self.attack_registry:
-            raise ValueError(f"Unknown attack: {attack_name}")
+        try:
+            attack = self.attack_registry[attack_name]
+        except KeyError:
+            raise ValueError(f"Unknown attack: {attack_name}") from None
+        return self._run_attack(attack_name, attack, text, **kwargs)
 
-        logger.info(f"Executing attack '{attack_name}' on text: {text[:50]}...")
+    @staticmethod
+    def _run_attack(attack_name: str, attack, text: str, **kwargs) -> AttackResult:
+        """Run an already-resolved attack, turning failures into unsuccessful results."""
+        logger.debug("Executing attack '%s' on text: %.50s...", attack_name, text)
 
-        attack = self.attack_registry[attack_name]
         try:
             result = attack.execute(text, **kwargs)
-            logger.info(f"Attack '{attack_name}' completed successfully")
+            logger.debug("Attack '%s' completed successfully", attack_name)
             return result
         except Exception as e:
-            logger.error(f"Attack '{attack_name}' failed with error: {str(e)}")
+            logger.error("Attack '%s' failed with error: %s", attack_name, e)
             return AttackResult(
                 success=False,
                 original_text=text,
@@ -105,6 +196,55 @@ class RedTeamEngine:
                 attack_type=attack_name,
             )
 
+    def execute_campaign(
+        self, texts: list[str], attack_names: list[str] | None = None
+    ) -> dict[str, list[AttackResult]]:
+        """
+        Execute a matrix of attacks across many texts.
+
+        Each attack is resolved once and applied to every text in turn, rather
+        than re-dispatching through ``execute_attack`` per (text, attack) pair.
+
+        Args:
+            texts: Input texts to attack
+            attack_names: Attacks to run (default: all registered attacks)
+
+        Returns:
+            Dict mapping attack name to AttackResults aligned with ``texts``
+        """
+        if attack_names is None:
+            attack_names = list(self.attack_registry.keys())
+
+        unknown = [name for name in attack_names if name not in self.attack_registry]
+        if unknown:
+            raise ValueError(f"Unknown attack: {', '.join(unknown)}")
+
+        logger.info("Executing campaign: %d attacks x %d texts", len(attack_names), len(texts))
+
+        campaign_results = {}
+        for attack_name in attack_names:
+            execute = self.attack_registry[attack_name].execute
+            results = []
+
+            for text in texts:
+                try:
+                    results.append(execute(text))
+                except Exception as e:
+                    logger.error("Campaign: %s failed with error: %s", attack_name, e)
+                    results.append(
+                        AttackResult(
+                            success=False,
+                            original_text=text,
+                            modified_text=text,
+                            metadata={"error": str(e)},
+                            attack_type=attack_name,
+                        )
+                    )
+
+            campaign_results[attack_name] = results
+
+        return campaign_results
+
     def execute_all_attacks(self, text: str) -> list[AttackResult]:
         """
         Execute all available attacks on the given text.
@@ -116,14 +256,16 @@ class RedTeamEngine:
             List of AttackResult objects for each attack
         """
         results = []
+        failures = 0
 
         for attack_name, attack in self.attack_registry.items():
             try:
                 result = attack.execute(text)
                 results.append(result)
-                logger.info(f"All-attacks: {attack_name} completed successfully")
+                logger.debug("All-attacks: %s completed successfully", attack_name)
             except Exception as e:
-                logger.error(f"All-attacks: {attack_name} failed with error: {str(e)}")
+                failures += 1
+                logger.error("All-attacks: %s failed with error: %s", attack_name, e)
                 results.append(
                     AttackResult(
                         success=False,
@@ -134,6 +276,9 @@ class RedTeamEngine:
                     )
                 )
 
+        logger.info(
+            "All-attacks: %d of %d attacks completed", len(results) - failures, len(results)
+        )
         return results
 
     def test_model_robustness(
@@ -142,16 +287,31 @@ class RedTeamEngine:
         text_samples: list[str],
         attack_samples_per_text: int = 1,
         attack_types: list[str] | None = None,
+        max_workers: int | None = None,
+        model_predict_batch_func=None,
+        batch_size: int = 64,
     ) -> RobustnessReport:
         """
         Comprehensive robustness testing against specified attacks.
 
+        Attack generation always runs sequentially so seeded runs stay reproducible;
+        with ``max_workers`` > 1 the model predictions are fanned out to a thread pool.
+        Inference backends release the GIL, and the predictor may be a closure, which
+        rules out a process pool.
+
+        With ``model_predict_batch_func`` the originals and then all attacked texts are
+        classified ``batch_size`` at a time instead of one call per text.
+
         Args:
             model_predict_func: Function that takes text and returns prediction dict
-                with 'label' and 'score' keys
+                with 'label' and 'score' keys (may be None with a batch function)
             text_samples: List of text samples to attack
             attack_samples_per_text: Number of attacks per text sample
             attack_types: List of attack types to use (default: all)
+            max_workers: Number of threads for model predictions (default: sequential)
+            model_predict_batch_func: Function mapping a list of texts to prediction
+                dicts in the same order; preferred over ``model_predict_func`` if given
+            batch_size: Maximum number of texts per batched prediction call
 
         Returns:
             RobustnessReport with metrics and statistics
@@ -159,80 +319,135 @@ class RedTeamEngine:
         if attack_types is None:
             attack_types = list(self.attack_registry.keys())
 
-        all_history = []
-        successful_evasions = 0
-        confidence_drops = []
+        unknown = [name for name in attack_types if name not in self.attack_registry]
+        if unknown:
+            raise ValueError(f"Unknown attack: {', '.join(unknown)}")
+        # Resolve each attack once instead of per sample
+        attacks = [(name, self.attack_registry[name]) for name in attack_types]
 
-        for text in text_samples:
-            # Get original prediction
-            try:
-                original_pred = model_predict_func(text)
-            except Exception as e:
-                logger.error(f"Model prediction failed for text '{text[:50]}...': {e}")
-                continue
-
-            original_confidence = original_pred.get("score", 0.0)
+        executor = (
+            ThreadPoolExecutor(max_workers=max_workers)
+            if max_workers is not None and max_workers > 1 and model_predict_batch_func is None
+            else None
+        )
+        map_func = executor.map if executor else map
 
-            for _ in range(attack_samples_per_text):
-                # Select a random attack
-                attack_name = random.choice(attack_types)
+        if model_predict_batch_func is not None:
 
-                # Execute attack
-                attack_result = self.execute_attack(attack_name, text)
+            def predict_all(texts: list[str], context: str) -> list[dict | None]:
+                return _safe_predict_batch(model_predict_batch_func, texts, batch_size)
 
-                if not attack_result.success:
-                    continue
+        else:
 
-                # Get prediction on modified text
-                try:
-                    modified_pred = model_predict_func(attack_result.modified_text)
-                except Exception as e:
-                    logger.error(f"Model prediction failed after attack: {e}")
-                    continue
+            def predict_all(texts: list[str], context: str) -> list[dict | None]:
+                return list(
+                    map_func(lambda text: _safe_predict(model_predict_func, text, context), texts)
+                )
 
-                modified_confidence = modified_pred.get("score", 0.0)
+        try:
+            # Get original predictions, once per distinct text
+            unique_samples = list(dict.fromkeys(text_samples))
+            predictions = dict(
+                zip(unique_samples, predict_all(unique_samples, "for text"), strict=True)
+            )
 
-                # Calculate confidence drop
-                confidence_drop = original_confidence - modified_confidence
+            attack_targets = [
+                (text, predictions[text]) for text in text_samples if predictions[text] is not None
+            ]
+            # Draw every random attack choice up front in one call
+            attack_choices = iter(
+                random.choices(attacks, k=len(attack_targets) * attack_samples_per_text)
+            )
 
-                # Check for successful evasion
-                # Evasion if: 1) label changed, or 2) confidence dropped significantly
-                evasion_success = (
-                    original_pred.get("label") != modified_pred.get("label")
-                    or confidence_drop > 0.5  # Significant confidence drop
+            planned_attacks = []
+            for text, original_pred in attack_targets:
+                for attack_name, attack in islice(attack_choices, attack_samples_per_text):
+                    # Execute attack
+                    attack_result = self._run_attack(attack_name, attack, text)
+
+                    if attack_result.success:
+                        planned_attacks.append((text, original_pred, attack_result))
+
+            # Get predictions on modified texts; texts already classified (no-op attacks,
+            # colliding outputs) reuse their prediction instead of calling the model again
+            new_texts = list(
+                dict.fromkeys(
+                    attack_result.modified_text
+                    for _, _, attack_result in planned_attacks
+                    if attack_result.modified_text not in predictions
                 )
+            )
+            predictions.update(
+                zip(new_texts, predict_all(new_texts, "after attack on"), strict=True)
+            )
+            modified_preds = [
+                predictions[attack_result.modified_text] for _, _, attack_result in planned_attacks
+            ]
+        finally:
+            if executor:
+                executor.shutdown()
+
+        scored = [
+            (text, original_pred, attack_result, modified_pred)
+            for (text, original_pred, attack_result), modified_pred in zip(
+                planned_attacks, modified_preds, strict=True
+            )
+            if modified_pred is not None
+        ]
 
-                if evasion_success:
-                    successful_evasions += 1
+        # Score every attack at once over confidence columns
+        confidence_before = np.array(
+            [original_pred.get("score", 0.0) for _, original_pred, _, _ in scored], dtype=float
+        )
+        confidence_after = np.array(
+            [modified_pred.get("score", 0.0) for _, _, _, modified_pred in scored], dtype=float
+        )
+        label_changed = np.array(
+            [
+                original_pred.get("label") != modified_pred.get("label")
+                for _, original_pred, _, modified_pred in scored
+            ],
+            dtype=bool,
+        )
+        confidence_drops = confidence_before - confidence_after
 
-                confidence_drops.append(confidence_drop)
+        # Evasion if: 1) label changed, or 2) confidence dropped significantly
+        evasions = label_changed | (confidence_drops > 0.5)
 
-                # Record in history
-                history_entry = AttackHistory(
-                    timestamp=datetime.now(),
+        # Record in history
+        timestamp = datetime.now()
+        all_history = []
+        for (text, _, attack_result, _), success, before, after in zip(
+            scored,
+            evasions.tolist(),
+            confidence_before.tolist(),
+            confidence_after.tolist(),
+            strict=True,
+        ):
+            all_history.append(
+                AttackHistory(
+                    timestamp=timestamp,
                     original_text=text,
                     modified_text=attack_result.modified_text,
                     attack_type=attack_result.attack_type,
-                    success=evasion_success,
-                    confidence_before=original_confidence,
-                    confidence_after=modified_confidence,
+                    success=success,
+                    confidence_before=before,
+                    confidence_after=after,
                     metadata=attack_result.metadata,
                 )
-
-                all_history.append(history_entry)
+            )
 
         # Calculate metrics
         total_attacks = len(all_history)
+        successful_evasions = int(evasions.sum())
         evasion_rate = successful_evasions / total_attacks if total_attacks > 0 else 0
-        avg_confidence_drop = (
-            sum(confidence_drops) / len(confidence_drops) if confidence_drops else 0
-        )
+        avg_confidence_drop = float(confidence_drops.mean()) if total_attacks else 0
 
         # Calculate attack type histogram
-        attack_histogram = {}
-        for history in all_history:
-            attack_type = history.attack_type
-            attack_histogram[attack_type] = attack_histogram.get(attack_type, 0) + 1
+        attack_types_run, counts = np.unique(
+            [h.attack_type for h in all_history], return_counts=True
+        )
+        attack_histogram = dict(zip(attack_types_run.tolist(), counts.tolist(), strict=True))
 
         report = RobustnessReport(
             total_attacks=total_attacks,
@@ -244,10 +459,12 @@ class RedTeamEngine:
         )
 
         logger.info(
-            f"Robustness test completed: "
-            f"{total_attacks} total attacks, "
-            f"{successful_evasions} successful evasions ({evasion_rate:.2%}), "
-            f"avg confidence drop: {avg_confidence_drop:.3f}"
+            "Robustness test completed: %d total attacks, "
+            "%d successful evasions (%.2f%%), avg confidence drop: %.3f",
+            total_attacks,
+            successful_evasions,
+            evasion_rate * 100,
+            avg_confidence_drop,
         )
 
         return report
@@ -262,12 +479,7 @@ class RedTeamEngine:
         Returns:
             List of AttackHistory objects that show significant evasions
         """
-        evasions = []
-        for history in self.attack_history:
-            if history.confidence_after < history.confidence_before - min_confidence_drop:
-                evasions.append(history)
-
-        return evasions
+        return self.attack_history.with_confidence_drop_over(min_confidence_drop)
 
     def execute_obfuscation(self, text: str, **kwargs) -> tuple[str, dict]:
         """
@@ -280,7 +492,7 @@ class RedTeamEngine:
         Returns:
             Tuple of (modified_text, metadata)
         """
-        result = self.execute_attack("OBFUSCATION", text, **kwargs)
+        result = self._run_attack("OBFUSCATION", self.character_obfuscation, text, **kwargs)
         return result.modified_text, result.metadata
 
     def execute_semantic_shift(self, text: str, **kwargs) -> tuple[str, dict]:
@@ -294,7 +506,7 @@ class RedTeamEngine:
         Returns:
             Tuple of (modified_text, metadata)
         """
-        result = self.execute_attack("SEMANTIC_SHIFT", text, **kwargs)
+        result = self._run_attack("SEMANTIC_SHIFT", self.semantic_shift, text, **kwargs)
         return result.modified_text, result.metadata
 
     def execute_prompt_injection(self, text: str, **kwargs) -> tuple[str, dict]:
@@ -308,7 +520,7 @@ class RedTeamEngine:
         Returns:
             Tuple of (modified_text, metadata)
         """
-        result = self.execute_attack("PROMPT_INJECTION", text, **kwargs)
+        result = self._run_attack("PROMPT_INJECTION", self.prompt_injection, text, **kwargs)
         return result.modified_text, result.metadata
 
     def execute_multilingual_injection(self, text: str, **kwargs) -> tuple[str, dict]:
@@ -322,7 +534,9 @@ class RedTeamEngine:
         Returns:
             Tuple of (modified_text, metadata)
         """
-        result = self.execute_attack("MULTILINGUAL_INJECTION", text, **kwargs)
+        result = self._run_attack(
+            "MULTILINGUAL_INJECTION", self.multilingual_injection, text, **kwargs
+        )
         return result.modified_text, result.metadata
 
     def execute_encoding_evasion(self, text: str, **kwargs) -> tuple[str, dict]:
@@ -336,7 +550,7 @@ class RedTeamEngine:
         Returns:
             Tuple of (modified_text, metadata)
         """
-        result = self.execute_attack("ENCODING_EVASION", text, **kwargs)
+        result = self._run_attack("ENCODING_EVASION", self.encoding_evasion, text, **kwargs)
         return result.modified_text, result.metadata
 
     def execute_homograph_substitution(self, text: str, **kwargs) -> tuple[str, dict]:
@@ -350,5 +564,13 @@ class RedTeamEngine:
         Returns:
             Tuple of (modified_text, metadata)
         """
-        result = self.execute_attack("HOMOGRAPH_SUBSTITUTION", text, **kwargs)
+        result = self._run_attack(
+            "HOMOGRAPH_SUBSTITUTION", self.homograph_substitution, text, **kwargs
+        )
         return result.modified_text, result.metadata
+
+
+@lru_cache
+def get_red_team_engine() -> RedTeamEngine:
+    """Get cached process-wide red team engine instance."""
+    return RedTeamEngine()
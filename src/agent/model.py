@@ -1,9 +1,14 @@
 """Ollama model wrapper with streaming support and retry/backoff."""
 
-from collections.abc import AsyncIterator
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
@@ -11,28 +16,75 @@ from src.core.logging import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Keep warm connections to Ollama between requests instead of reconnecting per call
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60)
+
+_default_model: "OllamaModel | None" = None
+_default_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Retry transport failures and server errors; client errors (4xx) fail immediately."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+async def aiter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """
+    Decode newline-delimited JSON straight from raw response bytes.
+
+    Lines are split and parsed as bytes, skipping the intermediate text
+    decoding and per-line strings of ``aiter_lines``.
+
+    Args:
+        chunks: Async iterable of raw response chunks (e.g. ``response.aiter_bytes()``)
+
+    Yields:
+        One decoded object per non-blank line
+    """
+    buffer = b""
+    async for data in chunks:
+        buffer += data
+        if b"\n" not in data:
+            continue
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+    if buffer.strip():
+        yield json.loads(buffer)
+
 
 class OllamaModel:
     """Ollama LLM client wrapper with streaming support and retry/backoff."""
 
+    # Responses are only reused when sampling is close enough to deterministic
+    MAX_CACHED_TEMPERATURE = 0.1
+
     def __init__(
         self,
         base_url: str | None = None,
         model: str | None = None,
         timeout: int = 300,
+        response_cache_size: int = 512,
     ):
         self.base_url = base_url or settings.ollama_base_url
         self.model = model or settings.ollama_model
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.client = httpx.AsyncClient(timeout=timeout, limits=POOL_LIMITS)
+        self.response_cache_size = response_cache_size
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
 
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
 
     @retry(
+        retry=retry_if_exception(_is_retryable),
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
+        # Jitter keeps concurrent callers from retrying against Ollama in lockstep
+        wait=wait_random_exponential(multiplier=0.5, max=5),
     )
     async def infer(
         self,
@@ -53,6 +105,19 @@ class OllamaModel:
         Returns:
             Generated text response
         """
+        options = {"temperature": temperature, "top_p": top_p, "num_ctx": num_ctx}
+
+        cache_key = None
+        if self.response_cache_size and temperature <= self.MAX_CACHED_TEMPERATURE:
+            cache_key = hashlib.blake2b(
+                json.dumps([self.model, prompt, options]).encode("utf-8"), digest_size=16
+            ).hexdigest()
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                logger.info("Inference served from cache", model=self.model)
+                return cached
+
         logger.info("Sending inference request", model=self.model, prompt_len=len(prompt))
 
         try:
@@ -62,11 +127,7 @@ class OllamaModel:
                     "model": self.model,
                     "prompt": prompt,
                     "stream": False,
-                    "options": {
-                        "temperature": temperature,
-                        "top_p": top_p,
-                        "num_ctx": num_ctx,
-                    },
+                    "options": options,
                 },
             )
             response.raise_for_status()
@@ -79,12 +140,50 @@ class OllamaModel:
                 done=result.get("done"),
             )
 
+            if cache_key is not None:
+                self._response_cache[cache_key] = generated_text
+                if len(self._response_cache) > self.response_cache_size:
+                    self._response_cache.popitem(last=False)
+
             return generated_text
 
         except httpx.HTTPError as e:
             logger.error("Ollama inference failed", error=str(e))
             raise
 
+    async def infer_many(
+        self,
+        prompts: list[str],
+        temperature: float = 0.1,
+        top_p: float = 0.9,
+        num_ctx: int = 1536,
+        concurrency: int = 8,
+    ) -> list[str]:
+        """
+        Generate responses for several prompts with overlapping requests.
+
+        Args:
+            prompts: Input prompts
+            temperature: Temperature for generation (default: 0.1 for deterministic)
+            top_p: Top-p sampling parameter (default: 0.9)
+            num_ctx: Context window size (default: 1536)
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            Generated text responses in prompt order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def infer_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.infer(prompt, temperature, top_p, num_ctx)
+
+        # Identical prompts share one request
+        unique_prompts = list(dict.fromkeys(prompts))
+        responses = await asyncio.gather(*(infer_one(prompt) for prompt in unique_prompts))
+        by_prompt = dict(zip(unique_prompts, responses, strict=True))
+        return [by_prompt[prompt] for prompt in prompts]
+
     async def infer_stream(
         self,
         prompt: str,
@@ -123,21 +222,51 @@ class OllamaModel:
             ) as response:
                 response.raise_for_status()
 
-                async for line in response.aiter_lines():
-                    if line:
-                        import json
-
-                        chunk = json.loads(line)
-                        if "response" in chunk:
-                            yield chunk["response"]
-                        if chunk.get("done"):
-                            break
+                async for chunk in aiter_ndjson(response.aiter_bytes()):
+                    if "response" in chunk:
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        break
 
         except httpx.HTTPError as e:
             logger.error("Ollama streaming inference failed", error=str(e))
             raise
 
 
+def get_default_model() -> OllamaModel:
+    """
+    Get the shared default model, whose connection pool persists across calls.
+
+    A new model is created when the running event loop changes, since pooled
+    connections cannot be reused from another loop. If the previous loop is
+    still open, the previous model is closed on that loop (as soon as it runs);
+    nothing can be awaited on a closed loop, so the previous model is then
+    dropped and its sockets are released when it is garbage-collected.
+
+    Returns:
+        Shared OllamaModel for the running event loop
+    """
+    global _default_model, _default_loop
+
+    # No await between check and assignment, so concurrent callers cannot race here
+    loop = asyncio.get_running_loop()
+    if _default_model is None or _default_loop is not loop:
+        if _default_model is not None and not _default_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(_default_model.close(), _default_loop)
+        _default_model = OllamaModel()
+        _default_loop = loop
+    return _default_model
+
+
+async def close_default_model() -> None:
+    """Close the shared default model, if one was created."""
+    global _default_model, _default_loop
+
+    if _default_model is not None:
+        model, _default_model, _default_loop = _default_model, None, None
+        await model.close()
+
+
 async def infer(
     prompt: str, temperature: float = 0.1, top_p: float = 0.9, num_ctx: int = 1536
 ) -> str:
@@ -153,8 +282,4 @@ async def infer(
     Returns:
         Generated text response
     """
-    model = OllamaModel()
-    try:
-        return await model.infer(prompt, temperature, top_p, num_ctx)
-    finally:
-        await model.close()
+    return await get_default_model().infer(prompt, temperature, top_p, num_ctx)
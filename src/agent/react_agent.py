@@ -4,7 +4,7 @@ import asyncio
 import json
 from typing import Any
 
-from src.agent.model import OllamaModel
+from src.agent.model import OllamaModel, get_default_model
 from src.core.logging import get_logger
 from src.models.schemas import AgentRequest, AgentResponse
 from src.reasoning.planner import Planner
@@ -423,10 +423,9 @@ async def run_agent(req: AgentRequest, user: Any) -> AgentResponse:
         "propose_action": ProposeActionTool(telegram_service),
     }
 
-    # Create model and agent with user context
-    model = OllamaModel()
+    # Create agent with user context on the shared, connection-pooled model
     agent = ReactAgent(
-        model=model,
+        model=get_default_model(),
         tools=tools,
         user=user,
         request=req,
@@ -434,7 +433,4 @@ async def run_agent(req: AgentRequest, user: Any) -> AgentResponse:
         max_exec_time=300,
     )
 
-    try:
-        return await agent.run(req)
-    finally:
-        await model.close()
+    return await agent.run(req)
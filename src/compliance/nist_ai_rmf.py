@@ -1,12 +1,25 @@
 """NIST AI Risk Management Framework implementation for compliance."""
 
+import copy
 import logging
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+DOCS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "docs")
+
+# Documentation the assessment reads; edits to any of them invalidate the cached assessment
+EVIDENCE_DOCUMENTS = (
+    "THREAT_MODEL.md",
+    "SYSTEM_ARCHITECTURE.md",
+    "DATA_FLOW.md",
+    "SECURITY_POLICY.md",
+)
+
 
 class RiskManagementFunction(Enum):
     """NIST AI RMF Core Functions."""
@@ -59,6 +72,10 @@ class NistAIRMFramework:
         self.assessments: list[ComplianceAssessment] = []
         self.risk_register: list[RiskAssessment] = []
 
+        # Bumped whenever assessment inputs change; keys the complete assessment cache
+        self._evidence_version = 0
+        self._assessment_cache: tuple[tuple, dict] | None = None
+
         logger.info("NIST AI RMF Framework initialized")
 
     def assess_map_function(self) -> ComplianceAssessment:
@@ -329,11 +346,22 @@ class NistAIRMFramework:
         Returns:
             True if documentation exists, False otherwise
         """
-        import os
+        return os.path.exists(os.path.join(DOCS_DIR, filename))
 
-        docs_dir = os.path.join(os.path.dirname(__file__), "..", "..", "docs")
-        doc_path = os.path.join(docs_dir, filename)
-        return os.path.exists(doc_path)
+    def _evidence_mtimes(self) -> tuple[int | None, ...]:
+        """
+        Get modification times of the evidence documents.
+
+        Returns:
+            Tuple of mtimes in nanoseconds, None for missing documents
+        """
+        mtimes = []
+        for filename in EVIDENCE_DOCUMENTS:
+            try:
+                mtimes.append(os.stat(os.path.join(DOCS_DIR, filename)).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
 
     def _check_capability_exists(self, capability: str) -> bool:
         """
@@ -495,6 +523,7 @@ class NistAIRMFramework:
             risk.risk_id = f"RISK-{uuid.uuid4().hex[:8].upper()}"
 
         self.risk_register.append(risk)
+        self._evidence_version += 1
 
         logger.info(f"Risk added to register: {risk.risk_id} - {risk.description[:50]}...")
         return risk.risk_id
@@ -522,6 +551,7 @@ class NistAIRMFramework:
         for risk in self.risk_register:
             if risk.risk_id == risk_id:
                 risk.status = new_status
+                self._evidence_version += 1
                 logger.info(f"Risk {risk_id} status updated to: {new_status}")
                 return True
 
@@ -603,13 +633,32 @@ class NistAIRMFramework:
         else:
             return "Accept risk with ongoing monitoring"
 
-    def run_complete_assessment(self) -> dict:
+    def run_complete_assessment(self, refresh: bool = False) -> dict:
         """
         Run complete NIST AI RMF assessment.
 
+        The result is cached until the risk register or an evidence document
+        changes, so repeated calls return a copy of the previous assessment
+        without re-scoring every function. A cached copy carries a fresh
+        ``report_date``; ``assessed_at`` is when the functions were last scored
+        and ``cached`` tells whether this call reused that result.
+
+        Args:
+            refresh: Force a full re-assessment
+
         Returns:
             Complete assessment and compliance report
         """
+        # Direct appends to risk_register bypass the version counter, so include its size
+        cache_key = (self._evidence_version, len(self.risk_register), self._evidence_mtimes())
+        if not refresh and self._assessment_cache and self._assessment_cache[0] == cache_key:
+            logger.info("Returning cached NIST AI RMF assessment")
+            complete_assessment = copy.deepcopy(self._assessment_cache[1])
+            complete_assessment["comprehensive_report"]["report_date"] = datetime.now().isoformat()
+            complete_assessment["cached"] = True
+            self.assessments = list(complete_assessment["individual_assessments"].values())
+            return complete_assessment
+
         logger.info("Running complete NIST AI RMF assessment")
 
         # Clear previous assessments
@@ -641,7 +690,17 @@ class NistAIRMFramework:
                 "compliance_percentage": report["overall_compliance"]["percentage"],
                 "recommendations_count": len(treatment_plan["treatment_recommendations"]),
             },
+            "assessed_at": report["report_date"],
+            "cached": False,
         }
 
+        self._assessment_cache = (cache_key, complete_assessment)
+
         logger.info(f"Complete assessment completed: {report['overall_compliance']['rating']}")
-        return complete_assessment
+        return copy.deepcopy(complete_assessment)
+
+
+@lru_cache
+def get_nist_framework() -> NistAIRMFramework:
+    """Get cached process-wide NIST AI RMF framework instance."""
+    return NistAIRMFramework()
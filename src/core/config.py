@@ -31,6 +31,9 @@ class Settings(BaseSettings):
     secret_key: str = Field(default="change-this-to-a-secure-random-key-in-production")
     algorithm: str = Field(default="HS256")
     access_token_expire_minutes: int = Field(default=30)
+    # Argon2 cost overrides (None keeps passlib's defaults); lower them for dev/test only
+    password_hash_time_cost: int | None = Field(default=None)
+    password_hash_memory_cost: int | None = Field(default=None)
 
     # Database
     database_url: str = Field(default="sqlite:///./otis.db")
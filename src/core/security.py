@@ -6,8 +6,20 @@ from typing import Any
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from src.core.config import get_settings
+
+_settings = get_settings()
+_argon2_costs = {
+    f"argon2__{name}": value
+    for name, value in (
+        ("time_cost", _settings.password_hash_time_cost),
+        ("memory_cost", _settings.password_hash_memory_cost),
+    )
+    if value is not None
+}
+
 # Use argon2 for password hashing (more modern and secure than bcrypt)
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+pwd_context = CryptContext(schemes=["argon2"], deprecated="auto", **_argon2_costs)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
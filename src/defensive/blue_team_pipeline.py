@@ -1,12 +1,18 @@
 """Main orchestration pipeline for blue team threat detection and remediation."""
 
+import asyncio
 import hashlib
+import inspect
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+
+from src.model.batching import PredictionBatcher
 
 from .remediation_engine import AutomatedRemediationEngine
-from .threat_detectors import ThreatLevel, run_all_detectors
+from .threat_detectors import ThreatLevel, run_confidence_detector, run_text_detectors
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +39,21 @@ class BlueTeamPipeline:
     Integrates all detectors and implements automated response actions.
     """
 
-    def __init__(self):
+    # Texts longer than this are scanned every time rather than pinned in the cache
+    MAX_CACHED_TEXT_LENGTH = 10_000
+
+    def __init__(self, detection_cache_size: int = 4096):
+        """
+        Initialize the pipeline.
+
+        Args:
+            detection_cache_size: Number of recent texts whose text-detector results
+                are reused (0 disables caching)
+        """
         self.remediation_engine = AutomatedRemediationEngine()
         self.threat_events: list[ThreatEvent] = []
+        self.detection_cache_size = detection_cache_size
+        self._detect_cache: OrderedDict[str, list[tuple[str, bool, dict | None]]] = OrderedDict()
 
         logger.info("Blue Team Pipeline initialized")
 
@@ -52,8 +70,10 @@ class BlueTeamPipeline:
         """
         logger.info(f"Starting threat detection for text: {text[:100]}...")
 
-        # Run all detectors
-        detector_results = run_all_detectors(text, model_output)
+        # Run all detectors (text detectors are memoized per text)
+        detector_results = self._run_text_detectors_cached(text)
+        if model_output:
+            detector_results.append(run_confidence_detector(model_output))
 
         # Collect triggered detectors and details
         triggered_detectors = []
@@ -127,6 +147,34 @@ class BlueTeamPipeline:
             logger.info("No threats detected")
             return None
 
+    def _run_text_detectors_cached(self, text: str) -> list[tuple[str, bool, dict | None]]:
+        """
+        Run text-based detectors, reusing results for recently seen texts.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            Fresh list of (detector_name, detection_result, details) tuples; details
+            dicts are copies so callers may annotate them
+        """
+        if not self.detection_cache_size or not text or len(text) > self.MAX_CACHED_TEXT_LENGTH:
+            return run_text_detectors(text)
+
+        cached = self._detect_cache.get(text)
+        if cached is None:
+            cached = run_text_detectors(text)
+            self._detect_cache[text] = cached
+            if len(self._detect_cache) > self.detection_cache_size:
+                self._detect_cache.popitem(last=False)
+        else:
+            self._detect_cache.move_to_end(text)
+
+        return [
+            (name, detected, dict(details) if details else details)
+            for name, detected, details in cached
+        ]
+
     def _calculate_severity_score(
         self, triggered_detectors: list[str], avg_confidence: float, details: list[dict]
     ) -> float:
@@ -196,17 +244,31 @@ class BlueTeamPipeline:
         Returns:
             Dict with remediation actions taken
         """
-        threat_info = {
-            "threat_level": threat_event.threat_level.value.upper(),
-            "text": threat_event.text,
-            "detectors_triggered": threat_event.detectors_triggered,
-            "severity_score": threat_event.severity_score,
-            "event_id": threat_event.event_id,
-        }
+        logger.info(f"Initiating remediation for {threat_event.event_id}")
+
+        remediation_result = self.remediation_engine.remediate(self._threat_info(threat_event))
+
+        logger.info(
+            f"Remediation completed for {threat_event.event_id}: {remediation_result.get('status', 'unknown')}"
+        )
 
+        return remediation_result
+
+    async def aimplement_automated_remediation(self, threat_event: ThreatEvent) -> dict:
+        """
+        Async variant of ``implement_automated_remediation``.
+
+        Args:
+            threat_event: ThreatEvent object with threat information
+
+        Returns:
+            Dict with remediation actions taken
+        """
         logger.info(f"Initiating remediation for {threat_event.event_id}")
 
-        remediation_result = self.remediation_engine.remediate(threat_info)
+        remediation_result = await self.remediation_engine.aremediate(
+            self._threat_info(threat_event)
+        )
 
         logger.info(
             f"Remediation completed for {threat_event.event_id}: {remediation_result.get('status', 'unknown')}"
@@ -214,6 +276,17 @@ class BlueTeamPipeline:
 
         return remediation_result
 
+    @staticmethod
+    def _threat_info(threat_event: ThreatEvent) -> dict:
+        """Build the remediation engine payload for a threat event."""
+        return {
+            "threat_level": threat_event.threat_level.value.upper(),
+            "text": threat_event.text,
+            "detectors_triggered": threat_event.detectors_triggered,
+            "severity_score": threat_event.severity_score,
+            "event_id": threat_event.event_id,
+        }
+
     def process_incoming_text(self, text: str, model_predict_func) -> dict:
         """
         Complete pipeline: detect threats and implement remediation if needed.
@@ -237,38 +310,83 @@ class BlueTeamPipeline:
 
         # Run threat detection
         threat_event = self.detect_threats(text, model_output)
+        result = self._build_processing_result(text, model_output, threat_event)
+
+        if threat_event:
+            # Implement remediation
+            remediation_result = self.implement_automated_remediation(threat_event)
+            self._apply_remediation_result(result, remediation_result)
+
+        logger.info(f"Processing completed: action={result['final_action']}")
+        return result
+
+    async def aprocess_incoming_text(self, text: str, model_predict_func) -> dict:
+        """
+        Async pipeline: detect threats and remediate without blocking on I/O.
+
+        Detection runs inline since it is CPU-bound; remediation notifications and
+        audit logging are awaited so many texts can be processed concurrently with
+        ``asyncio.gather``.
+
+        Args:
+            text: Input text to process
+            model_predict_func: Sync function or coroutine function to get model prediction
+
+        Returns:
+            Dict with processing results
+        """
+        logger.info(f"Processing incoming text: {text[:100]}...")
+
+        # Get model prediction
+        try:
+            if inspect.iscoroutinefunction(model_predict_func):
+                model_output = await model_predict_func(text)
+            else:
+                model_output = model_predict_func(text)
+            model_output["text"] = text  # Add text for context
+        except Exception as e:
+            logger.error(f"Model prediction failed: {e}")
+            model_output = {"score": 0.0, "label": "ERROR", "text": text}
+
+        # Run threat detection
+        threat_event = self.detect_threats(text, model_output)
+        result = self._build_processing_result(text, model_output, threat_event)
+
+        if threat_event:
+            # Implement remediation
+            remediation_result = await self.aimplement_automated_remediation(threat_event)
+            self._apply_remediation_result(result, remediation_result)
 
-        result = {
+        logger.info(f"Processing completed: action={result['final_action']}")
+        return result
+
+    @staticmethod
+    def _build_processing_result(
+        text: str, model_output: dict, threat_event: ThreatEvent | None
+    ) -> dict:
+        """Build the initial processing result for a text."""
+        return {
             "text": text,
             "model_prediction": model_output,
             "threat_detected": threat_event is not None,
             "threat_event_id": threat_event.event_id if threat_event else None,
             "final_action": "allow",
-            "processing_steps": [],
+            "processing_steps": ["threat_detected" if threat_event else "no_threat_detected"],
         }
 
-        if threat_event:
-            result["processing_steps"].append("threat_detected")
-
-            # Implement remediation
-            remediation_result = self.implement_automated_remediation(threat_event)
-            result["remediation_result"] = remediation_result
-
-            # Determine final action based on remediation
-            status = remediation_result.get("status", "unknown")
-            if "critical" in status or "quarantined" in status:
-                result["final_action"] = "quarantine"
-            elif "flagged" in status:
-                result["final_action"] = "flag_for_review"
-            elif "logged" in status:
-                result["final_action"] = "allow"
-            else:
-                result["final_action"] = "allow"
+    @staticmethod
+    def _apply_remediation_result(result: dict, remediation_result: dict) -> None:
+        """Record remediation outcome and derive the final action."""
+        result["remediation_result"] = remediation_result
+
+        # Determine final action based on remediation
+        status = remediation_result.get("status", "unknown")
+        if "critical" in status or "quarantined" in status:
+            result["final_action"] = "quarantine"
+        elif "flagged" in status:
+            result["final_action"] = "flag_for_review"
         else:
-            result["processing_steps"].append("no_threat_detected")
-
-        logger.info(f"Processing completed: action={result['final_action']}")
-        return result
+            result["final_action"] = "allow"
 
     def get_threat_statistics(self) -> dict:
         """Get statistics about detected threats."""
@@ -355,6 +473,41 @@ class BlueTeamPipeline:
 
         return results
 
+    async def abatch_process_texts(
+        self,
+        texts: list[str],
+        batch_predict_func,
+        max_batch: int = 32,
+        max_wait_ms: float = 5.0,
+    ) -> list[dict]:
+        """
+        Process texts concurrently, coalescing model predictions into batched calls.
+
+        Args:
+            texts: List of texts to process
+            batch_predict_func: Function (sync or async) mapping a list of texts to a
+                list of prediction dicts in the same order
+            max_batch: Maximum number of texts per model call
+            max_wait_ms: Maximum time to wait for a batch to fill, in milliseconds
+
+        Returns:
+            List of processing results for each text, in input order
+        """
+        batcher = PredictionBatcher(
+            batch_predict_func, max_batch=max_batch, max_wait_ms=max_wait_ms
+        )
+        try:
+            results = await asyncio.gather(
+                *(self.aprocess_incoming_text(text, batcher.predict) for text in texts)
+            )
+        finally:
+            await batcher.close()
+
+        logger.info(
+            f"Batch processed {len(texts)} texts in {batcher.batches_dispatched} model calls"
+        )
+        return list(results)
+
     def get_recent_threats(self, hours: int = 24) -> list[ThreatEvent]:
         """
         Get threats detected in the last specified hours.
@@ -395,3 +548,9 @@ class BlueTeamPipeline:
 
         logger.info(f"Removed {len(old_events)} events older than {days} days")
         return len(old_events)
+
+
+@lru_cache
+def get_blue_team_pipeline() -> BlueTeamPipeline:
+    """Get cached process-wide blue team pipeline instance."""
+    return BlueTeamPipeline()
@@ -1,6 +1,8 @@
 """Automated remediation engine for detected threats."""
 
+import asyncio
 import hashlib
+import inspect
 import logging
 from datetime import datetime
 from enum import Enum
@@ -19,6 +21,19 @@ class ThreatLevel(Enum):
     NONE = "none"
 
 
+async def _call_async(target: Any, method_name: str, *args: Any, **kwargs: Any) -> Any:
+    """
+    Call an integration method without blocking the event loop.
+
+    Prefers a native ``a<method_name>`` coroutine when the integration provides one,
+    otherwise runs the sync method in a worker thread.
+    """
+    async_method = getattr(target, f"a{method_name}", None)
+    if async_method is not None and inspect.iscoroutinefunction(async_method):
+        return await async_method(*args, **kwargs)
+    return await asyncio.to_thread(getattr(target, method_name), *args, **kwargs)
+
+
 class AutomatedRemediationEngine:
     """
     Automated response to detected threats.
@@ -53,7 +68,87 @@ class AutomatedRemediationEngine:
         Returns:
             Dict with remediation actions taken
         """
+        remediation_actions, threat_level = self._init_remediation(threat_event)
+
+        try:
+            notification = self._apply_remediation_actions(
+                remediation_actions, threat_level, threat_event
+            )
+
+            if notification:
+                method_name, kwargs = notification
+                getattr(self.notifications, method_name)(**kwargs)
+
+            # Always audit log if audit logger available
+            if self.audit_logger:
+                try:
+                    self.audit_logger.log_remediation(remediation_actions)
+                except Exception as e:
+                    logger.error(f"Audit logging failed: {e}")
+
+            logger.info(
+                f"Remediation executed: {remediation_actions['event_id']} - {threat_level.value}"
+            )
+
+        except Exception as e:
+            logger.error(f"Remediation failed: {e}")
+            remediation_actions["status"] = "remediation_failed"
+            remediation_actions["error"] = str(e)
+
+        # Add to remediation history
+        self.remediation_history.append(remediation_actions)
+
+        return remediation_actions
+
+    async def aremediate(self, threat_event: dict[str, Any]) -> dict[str, Any]:
+        """
+        Execute remediation for detected threat without blocking the event loop.
+
+        The security notification and the audit log write are issued concurrently,
+        so latency is bounded by the slower of the two calls rather than their sum.
+        Unlike ``remediate``, the audit entry is therefore written even when the
+        notification fails; it is a snapshot of the actions applied before the
+        notification outcome is known. Integrations may expose ``asend_alert``/``asend_notification``/``alog_remediation``
+        coroutines; otherwise their sync methods run in a worker thread.
+
+        Args:
+            threat_event: Dict with threat information (see ``remediate``)
+
+        Returns:
+            Dict with remediation actions taken
+        """
+        remediation_actions, threat_level = self._init_remediation(threat_event)
+
+        try:
+            notification = self._apply_remediation_actions(
+                remediation_actions, threat_level, threat_event
+            )
+
+            notification_result, _ = await asyncio.gather(
+                self._asend_notification(notification),
+                # Snapshot: the worker thread must not see the failure status set below
+                self._alog_remediation(dict(remediation_actions)),
+                return_exceptions=True,
+            )
+            if isinstance(notification_result, Exception):
+                raise notification_result
+
+            logger.info(
+                f"Remediation executed: {remediation_actions['event_id']} - {threat_level.value}"
+            )
 
+        except Exception as e:
+            logger.error(f"Remediation failed: {e}")
+            remediation_actions["status"] = "remediation_failed"
+            remediation_actions["error"] = str(e)
+
+        # Add to remediation history
+        self.remediation_history.append(remediation_actions)
+
+        return remediation_actions
+
+    def _init_remediation(self, threat_event: dict[str, Any]) -> tuple[dict[str, Any], ThreatLevel]:
+        """Parse the threat level and build the initial remediation record."""
         threat_level_str = threat_event.get("threat_level", "LOW")
         try:
             threat_level = ThreatLevel(threat_level_str.upper())
@@ -73,99 +168,129 @@ class AutomatedRemediationEngine:
             "original_threat_data": threat_event,
         }
 
-        try:
-            if threat_level == ThreatLevel.CRITICAL:
-                # Immediate quarantine + escalation
-                remediation_actions["actions_taken"].extend(
-                    [
-                        "quarantine_message",
-                        "alert_security_team_critical",
-                        "trigger_incident_response",
-                        "block_sender_domain",
-                        "create_incident_ticket",
-                    ]
-                )
-
-                # Quarantine
-                self._quarantine_message(text, event_id)
-
-                # Alert security team if notification system available
-                if self.notifications:
-                    self.notifications.send_alert(
-                        level="CRITICAL",
-                        title="Critical Threat Detected",
-                        details=threat_event,
-                        event_id=event_id,
-                    )
-
-                remediation_actions["status"] = "critical_escalated"
-
-            elif threat_level == ThreatLevel.HIGH:
-                # Quarantine + manual review
-                remediation_actions["actions_taken"].extend(
-                    [
-                        "quarantine_message",
-                        "log_to_audit_trail",
-                        "flag_for_manual_review",
-                        "request_additional_analysis",
-                    ]
-                )
+        return remediation_actions, threat_level
 
-                self._quarantine_message(text, event_id)
+    def _apply_remediation_actions(
+        self,
+        remediation_actions: dict[str, Any],
+        threat_level: ThreatLevel,
+        threat_event: dict[str, Any],
+    ) -> tuple[str, dict[str, Any]] | None:
+        """
+        Apply local remediation actions for the threat level.
 
-                if self.notifications:
-                    self.notifications.send_alert(
-                        level="HIGH",
-                        title="High Severity Threat",
-                        details=threat_event,
-                        event_id=event_id,
-                    )
+        Args:
+            remediation_actions: Remediation record to update in place
+            threat_level: Parsed threat level
+            threat_event: Original threat event dict
 
-                remediation_actions["status"] = "quarantined_high"
+        Returns:
+            Tuple of (notification method name, kwargs) to dispatch, or None
+        """
+        text = threat_event.get("text", "")
+        event_id = remediation_actions["event_id"]
+        notification = None
+
+        if threat_level == ThreatLevel.CRITICAL:
+            # Immediate quarantine + escalation
+            remediation_actions["actions_taken"].extend(
+                [
+                    "quarantine_message",
+                    "alert_security_team_critical",
+                    "trigger_incident_response",
+                    "block_sender_domain",
+                    "create_incident_ticket",
+                ]
+            )
+
+            # Quarantine
+            self._quarantine_message(text, event_id)
+
+            # Alert security team if notification system available
+            if self.notifications:
+                notification = (
+                    "send_alert",
+                    {
+                        "level": "CRITICAL",
+                        "title": "Critical Threat Detected",
+                        "details": threat_event,
+                        "event_id": event_id,
+                    },
+                )
 
-            elif threat_level == ThreatLevel.MEDIUM:
-                # Flag for review + enhanced monitoring
-                remediation_actions["actions_taken"].extend(
-                    ["flag_for_review", "apply_enhanced_inspection", "add_to_watchlist"]
+            remediation_actions["status"] = "critical_escalated"
+
+        elif threat_level == ThreatLevel.HIGH:
+            # Quarantine + manual review
+            remediation_actions["actions_taken"].extend(
+                [
+                    "quarantine_message",
+                    "log_to_audit_trail",
+                    "flag_for_manual_review",
+                    "request_additional_analysis",
+                ]
+            )
+
+            self._quarantine_message(text, event_id)
+
+            if self.notifications:
+                notification = (
+                    "send_alert",
+                    {
+                        "level": "HIGH",
+                        "title": "High Severity Threat",
+                        "details": threat_event,
+                        "event_id": event_id,
+                    },
                 )
 
-                if self.notifications:
-                    self.notifications.send_notification(
-                        level="MEDIUM",
-                        title="Medium Severity Threat Flagged",
-                        details=threat_event,
-                        event_id=event_id,
-                    )
+            remediation_actions["status"] = "quarantined_high"
+
+        elif threat_level == ThreatLevel.MEDIUM:
+            # Flag for review + enhanced monitoring
+            remediation_actions["actions_taken"].extend(
+                ["flag_for_review", "apply_enhanced_inspection", "add_to_watchlist"]
+            )
+
+            if self.notifications:
+                notification = (
+                    "send_notification",
+                    {
+                        "level": "MEDIUM",
+                        "title": "Medium Severity Threat Flagged",
+                        "details": threat_event,
+                        "event_id": event_id,
+                    },
+                )
 
-                remediation_actions["status"] = "flagged_medium"
+            remediation_actions["status"] = "flagged_medium"
 
-            elif threat_level == ThreatLevel.LOW:
-                # Log only
-                remediation_actions["actions_taken"].append("log_only")
-                remediation_actions["status"] = "logged"
+        elif threat_level == ThreatLevel.LOW:
+            # Log only
+            remediation_actions["actions_taken"].append("log_only")
+            remediation_actions["status"] = "logged"
 
-            else:  # ThreatLevel.NONE
-                remediation_actions["actions_taken"].append("no_action")
-                remediation_actions["status"] = "no_threat"
+        else:  # ThreatLevel.NONE
+            remediation_actions["actions_taken"].append("no_action")
+            remediation_actions["status"] = "no_threat"
 
-            # Always audit log if audit logger available
-            if self.audit_logger:
-                try:
-                    self.audit_logger.log_remediation(remediation_actions)
-                except Exception as e:
-                    logger.error(f"Audit logging failed: {e}")
+        return notification
 
-            logger.info(f"Remediation executed: {event_id} - {threat_level.value}")
+    async def _asend_notification(self, notification: tuple[str, dict[str, Any]] | None) -> Any:
+        """Dispatch a pending notification, if any."""
+        if not notification:
+            return None
+        method_name, kwargs = notification
+        return await _call_async(self.notifications, method_name, **kwargs)
 
+    async def _alog_remediation(self, remediation_actions: dict[str, Any]) -> None:
+        """Write the remediation record to the audit logger, logging any failure."""
+        if not self.audit_logger:
+            return
+        try:
+            await _call_async(self.audit_logger, "log_remediation", remediation_actions)
         except Exception as e:
-            logger.error(f"Remediation failed: {e}")
-            remediation_actions["status"] = "remediation_failed"
-            remediation_actions["error"] = str(e)
-
-        # Add to remediation history
-        self.remediation_history.append(remediation_actions)
-
-        return remediation_actions
+            logger.error(f"Audit logging failed: {e}")
 
     def _quarantine_message(self, text: str, event_id: str) -> None:
         """Quarantine malicious message."""
@@ -37,6 +37,11 @@ class HomographDetector:
         (0x1F7A0, 0x1F7FF),  # Mathematical Symbols (Extended)
     ]
 
+    # Character class over all ranges so clean text is rejected in a single C-level scan
+    HOMOGRAPH_PATTERN = re.compile(
+        "[" + "".join(f"{chr(start)}-{chr(end)}" for start, end in HOMOGRAPH_RANGES) + "]"
+    )
+
     def __init__(self):
         self.name = "HOMOGRAPH_DETECTION"
         self.description = "Unicode homograph character detection"
@@ -56,16 +61,17 @@ class HomographDetector:
 
         detections = []
 
-        for idx, char in enumerate(text):
+        for match in self.HOMOGRAPH_PATTERN.finditer(text):
+            char = match.group()
             char_code = ord(char)
 
-            # Check if character falls in suspicious range
+            # Resolve which suspicious range the character fell in
             for range_start, range_end in self.HOMOGRAPH_RANGES:
                 if range_start <= char_code <= range_end:
                     detections.append(
                         {
                             "character": char,
-                            "position": idx,
+                            "position": match.start(),
                             "code_point": hex(char_code),
                             "range": f"U+{range_start:04X}-U+{range_end:04X}",
                         }
@@ -190,6 +196,19 @@ class EncodingAnomalyDetector:
     Algorithm: Detect URL encoding, HTML entities, hex escaping patterns.
     """
 
+    PATTERNS = {
+        "url_encoding": r"%[0-9A-Fa-f]{2}",  # %20, %3D
+        "html_entities": r"&#\d{2,5};",  # &#104;
+        "hex_escaping": r"\\x[0-9A-Fa-f]{2}",  # \x41
+        "unicode_escaping": r"\\u[0-9A-Fa-f]{4}",  # \u0041
+    }
+
+    # Patterns start with distinct characters and cannot overlap, so a single
+    # alternation scan yields the same matches as one findall per pattern
+    COMBINED_PATTERN = re.compile(
+        "|".join(f"(?P<{name}>{pattern})" for name, pattern in PATTERNS.items())
+    )
+
     def __init__(self):
         self.name = "ENCODING_ANOMALY_DETECTION"
         self.description = "URL/HTML/Unicode escaping anomaly detection"
@@ -207,22 +226,23 @@ class EncodingAnomalyDetector:
         if not isinstance(text, str) or len(text) == 0:
             return False, None
 
-        patterns = {
-            "url_encoding": r"%[0-9A-Fa-f]{2}",  # %20, %3D
-            "html_entities": r"&#\d{2,5};",  # &#104;
-            "hex_escaping": r"\\x[0-9A-Fa-f]{2}",  # \x41
-            "unicode_escaping": r"\\u[0-9A-Fa-f]{4}",  # \u0041
-        }
+        # Every pattern needs one of these introducers; plain text skips the regex engine
+        if "%" not in text and "&#" not in text and "\\" not in text:
+            return False, None
 
-        detections = {}
+        matches: dict[str, list[str]] = {}
+        for match in self.COMBINED_PATTERN.finditer(text):
+            matches.setdefault(match.lastgroup, []).append(match.group())
 
-        for pattern_name, pattern in patterns.items():
-            matches = re.findall(pattern, text)
-            if matches:
-                detections[pattern_name] = {
-                    "count": len(matches),
-                    "samples": matches[:3],  # First 3 samples
-                }
+        # Report in pattern declaration order regardless of match order
+        detections = {
+            pattern_name: {
+                "count": len(matches[pattern_name]),
+                "samples": matches[pattern_name][:3],  # First 3 samples
+            }
+            for pattern_name in self.PATTERNS
+            if pattern_name in matches
+        }
 
         if detections:
             # Calculate overall severity
@@ -264,6 +284,38 @@ class InjectionPatternDetector:
     Algorithm: Detect known injection keywords and structures.
     """
 
+    INJECTION_KEYWORDS = [
+        "[IGNORE",
+        "[SYSTEM",
+        "[INSTRUCTION",
+        "[ADMIN",
+        "[BYPASS",
+        "IGNORE PREVIOUS",
+        "OVERRIDE CLASSIFICATION",
+        "TRUST THIS",
+        "ADMIN OVERRIDE",
+        "SECURITY BYPASS",
+        "CLASSIFICATION OVERRIDE",
+        "RESET PREVIOUS",
+        "START FRESH",
+        "TREAT AS LEGITIMATE",
+        "MARK AS SAFE",
+        "IGNORE SAFETY",
+        "DISABLE FILTERS",
+        "BYPASS SECURITY",
+        "PRIORITY MESSAGE",
+        "EMERGENCY OVERRIDE",
+        "TRUSTED SOURCE",
+        "VERIFIED CONTENT",
+        "AUTHENTIC MESSAGE",
+        "APPROVED CONTENT",
+        "WHITELISTED",
+        "TRUSTED USER",
+    ]
+
+    # Single pass over the text to rule out clean inputs before per-keyword scans
+    KEYWORD_PREFILTER = re.compile("|".join(re.escape(kw) for kw in INJECTION_KEYWORDS))
+
     def __init__(self):
         self.name = "INJECTION_PATTERN_DETECTION"
         self.description = "Prompt injection pattern detection"
@@ -281,39 +333,13 @@ class InjectionPatternDetector:
         if not isinstance(text, str) or len(text) == 0:
             return False, None
 
-        injection_keywords = [
-            "[IGNORE",
-            "[SYSTEM",
-            "[INSTRUCTION",
-            "[ADMIN",
-            "[BYPASS",
-            "IGNORE PREVIOUS",
-            "OVERRIDE CLASSIFICATION",
-            "TRUST THIS",
-            "ADMIN OVERRIDE",
-            "SECURITY BYPASS",
-            "CLASSIFICATION OVERRIDE",
-            "RESET PREVIOUS",
-            "START FRESH",
-            "TREAT AS LEGITIMATE",
-            "MARK AS SAFE",
-            "IGNORE SAFETY",
-            "DISABLE FILTERS",
-            "BYPASS SECURITY",
-            "PRIORITY MESSAGE",
-            "EMERGENCY OVERRIDE",
-            "TRUSTED SOURCE",
-            "VERIFIED CONTENT",
-            "AUTHENTIC MESSAGE",
-            "APPROVED CONTENT",
-            "WHITELISTED",
-            "TRUSTED USER",
-        ]
-
         text_upper = text.upper()
+        if not self.KEYWORD_PREFILTER.search(text_upper):
+            return False, None
+
         detected_keywords = []
 
-        for keyword in injection_keywords:
+        for keyword in self.INJECTION_KEYWORDS:
             if keyword in text_upper:
                 # Find all occurrences
                 start = 0
@@ -558,6 +584,17 @@ DETECTOR_REGISTRY = {
 }
 
 
+# Detectors are stateless, so run_all_detectors shares one instance of each
+_TEXT_DETECTORS = {
+    "HOMOGRAPH": HomographDetector(),
+    "SCRIPT_MIXING": ScriptMixingDetector(),
+    "ENCODING_ANOMALY": EncodingAnomalyDetector(),
+    "INJECTION_PATTERN": InjectionPatternDetector(),
+    "SUSPICIOUS_LANGUAGE": SuspiciousLanguageDetector(),
+}
+_CONFIDENCE_DETECTOR = ConfidenceAnomalyDetector()
+
+
 def get_detector_by_name(name: str) -> object:
     """Get a detector class by name."""
     if name in DETECTOR_REGISTRY:
@@ -566,6 +603,47 @@ def get_detector_by_name(name: str) -> object:
         raise ValueError(f"Unknown detector type: {name}")
 
 
+def run_text_detectors(text: str) -> list[tuple[str, bool, dict | None]]:
+    """
+    Run all text-based detectors on the given text.
+
+    Args:
+        text: Text to analyze
+
+    Returns:
+        List of tuples (detector_name, detection_result, details)
+    """
+    results = []
+
+    for name, detector in _TEXT_DETECTORS.items():
+        try:
+            detected, details = detector.detect(text)
+            results.append((name, detected, details))
+        except Exception as e:
+            logger.error(f"Detector {name} failed: {e}")
+            results.append((name, False, {"error": str(e)}))
+
+    return results
+
+
+def run_confidence_detector(model_output: dict) -> tuple[str, bool, dict | None]:
+    """
+    Run the confidence anomaly detector on a model output.
+
+    Args:
+        model_output: Model output dict with 'score' and 'label'
+
+    Returns:
+        Tuple (detector_name, detection_result, details)
+    """
+    try:
+        detected, details = _CONFIDENCE_DETECTOR.detect(model_output)
+        return ("CONFIDENCE_ANOMALY", detected, details)
+    except Exception as e:
+        logger.error(f"Confidence detector failed: {e}")
+        return ("CONFIDENCE_ANOMALY", False, {"error": str(e)})
+
+
 def run_all_detectors(
     text: str, model_output: dict | None = None
 ) -> list[tuple[str, bool, dict | None]]:
@@ -579,35 +657,10 @@ def run_all_detectors(
     Returns:
         List of tuples (detector_name, detection_result, details)
     """
-    results = []
-
-    # Initialize detectors
-    detectors = {
-        "HOMOGRAPH": HomographDetector(),
-        "SCRIPT_MIXING": ScriptMixingDetector(),
-        "ENCODING_ANOMALY": EncodingAnomalyDetector(),
-        "INJECTION_PATTERN": InjectionPatternDetector(),
-        "SUSPICIOUS_LANGUAGE": SuspiciousLanguageDetector(),
-    }
-
-    # Run text-based detectors
-    for name, detector in detectors.items():
-        if hasattr(detector, "detect"):
-            try:
-                detected, details = detector.detect(text)
-                results.append((name, detected, details))
-            except Exception as e:
-                logger.error(f"Detector {name} failed: {e}")
-                results.append((name, False, {"error": str(e)}))
+    results = run_text_detectors(text)
 
     # Run confidence anomaly detector if model output provided
     if model_output:
-        try:
-            conf_detector = ConfidenceAnomalyDetector()
-            detected, details = conf_detector.detect(model_output)
-            results.append(("CONFIDENCE_ANOMALY", detected, details))
-        except Exception as e:
-            logger.error(f"Confidence detector failed: {e}")
-            results.append(("CONFIDENCE_ANOMALY", False, {"error": str(e)}))
+        results.append(run_confidence_detector(model_output))
 
     return results
@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 
+from src.agent.model import close_default_model
 from src.api import agent, auth, health, ingest
 from src.core.config import get_settings
 from src.core.logging import configure_logging, get_logger
@@ -41,6 +42,7 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Shutting down Otis")
+    await close_default_model()
 
 
 # Create FastAPI app
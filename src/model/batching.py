@@ -0,0 +1,134 @@
+"""Adaptive micro-batching for model predictions issued from concurrent callers."""
+
+import asyncio
+import inspect
+import logging
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionBatcher:
+    """
+    Coalesce concurrent single-text predictions into batched model calls.
+
+    Callers await ``predict(text)``; a background task drains pending requests
+    until ``max_batch`` texts are queued or ``max_wait_ms`` elapses, sorts them by
+    length so padding stays tight, and issues one ``batch_predict_func`` call.
+    """
+
+    def __init__(
+        self,
+        batch_predict_func: Callable[[list[str]], Any],
+        max_batch: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_predict_func: Function (sync or async) mapping a list of texts to a
+                list of prediction dicts in the same order
+            max_batch: Maximum number of texts per model call
+            max_wait_ms: Maximum time to wait for a batch to fill, in milliseconds
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+
+        self.batch_predict_func = batch_predict_func
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.batches_dispatched = 0
+
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def predict(self, text: str) -> dict[str, Any]:
+        """
+        Queue a text for batched prediction.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            Prediction dict for the text
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the background worker once pending requests have been served."""
+        if self._worker is None or self._worker.done():
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    def _ensure_worker(self) -> None:
+        """Start the drain task, recreating it if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        """Collect pending requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+
+            try:
+                await self._dispatch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Run one model call for the batch and resolve each caller's future."""
+        # Length-sorted batches minimise padding inside the model call
+        batch.sort(key=lambda item: len(item[0]), reverse=True)
+        texts = [text for text, _ in batch]
+
+        try:
+            if inspect.iscoroutinefunction(self.batch_predict_func):
+                predictions = await self.batch_predict_func(texts)
+            else:
+                predictions = await asyncio.to_thread(self.batch_predict_func, texts)
+
+            if len(predictions) != len(texts):
+                raise ValueError(
+                    f"Batch prediction returned {len(predictions)} results for {len(texts)} texts"
+                )
+        except Exception as e:
+            logger.error(f"Batched prediction failed for {len(texts)} texts: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches_dispatched += 1
+        logger.debug(f"Dispatched prediction batch of {len(texts)} texts")
+
+        for (_, future), prediction in zip(batch, predictions, strict=True):
+            if not future.done():
+                future.set_result(prediction)
@@ -1,8 +1,10 @@
 """Model inference engine with security wrapping for Otis anti-spam model."""
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
+from functools import cached_property, lru_cache
+from itertools import islice
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -22,6 +24,8 @@ class OtisInferenceEngine:
         device: str | None = None,
         blue_team_enabled: bool = True,
         red_team_monitoring: bool = False,
+        quantize: str | None = None,
+        backend: str = "torch",
     ):
         """
         Initialize the Otis inference engine.
@@ -31,10 +35,21 @@ class OtisInferenceEngine:
             device: Device to run model on ('cuda', 'cpu', or None for auto)
             blue_team_enabled: Whether to enable blue team security checks
             red_team_monitoring: Whether to monitor for adversarial patterns
+            quantize: Optional quantization mode for CPU inference ('int8' applies
+                dynamic INT8 quantization to the model's Linear layers)
+            backend: Inference backend ('torch', or 'onnx' to export the model and run it
+                through ONNX Runtime with full graph optimization; requires optimum)
         """
+        if quantize not in (None, "int8"):
+            raise ValueError(f"Unsupported quantization mode: {quantize}")
+        if backend not in ("torch", "onnx"):
+            raise ValueError(f"Unsupported inference backend: {backend}")
+        if backend == "onnx" and quantize:
+            raise ValueError("Dynamic quantization is only supported with the torch backend")
+
         try:
             import torch
-            from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+            import transformers  # noqa: F401
         except ImportError as e:
             logger.error(
                 "Transformers library not installed. Please install with: pip install transformers torch"
@@ -45,23 +60,15 @@ class OtisInferenceEngine:
 
         self.model_name = model_name
         self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        if quantize == "int8" and self.device != "cpu":
+            # Dynamic quantization only has CPU kernels
+            logger.warning(f"INT8 quantization is CPU-only, skipping on device '{self.device}'")
+            quantize = None
+        self.quantize = quantize
+        self.backend = backend
 
-        # Initialize model components
-        try:
-            logger.info(f"Loading model '{model_name}' on {self.device}")
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(model_name).to(
-                self.device
-            )
-            self.classifier = pipeline(
-                "text-classification",
-                model=model_name,
-                device=0 if torch.cuda.is_available() else -1,
-                tokenizer=self.tokenizer,
-            )
-        except Exception as e:
-            logger.error(f"Failed to load model '{model_name}': {e}")
-            raise
+        # Per-instance tokenization cache (a class-level lru_cache would pin the engine)
+        self._encode = lru_cache(maxsize=8192)(self._encode_text)
 
         # Initialize security components
         self.blue_team_enabled = blue_team_enabled
@@ -83,6 +90,112 @@ class OtisInferenceEngine:
 
         logger.info(f"Otis Inference Engine initialized on {self.device}")
 
+    # Model components load on first use so engines that only run security
+    # checks (or never predict) skip the weight download and memory cost
+
+    @cached_property
+    def tokenizer(self) -> Any:
+        """Tokenizer for the configured model, loaded on first access."""
+        from transformers import AutoTokenizer
+
+        try:
+            return AutoTokenizer.from_pretrained(self.model_name)
+        except Exception as e:
+            logger.error(f"Failed to load tokenizer for '{self.model_name}': {e}")
+            raise
+
+    @cached_property
+    def model(self) -> Any:
+        """Sequence classification model on the configured device, loaded on first access."""
+        if self.backend == "onnx":
+            return self._load_onnx_model()
+
+        from transformers import AutoModelForSequenceClassification
+
+        try:
+            logger.info(f"Loading model '{self.model_name}' on {self.device}")
+            model = AutoModelForSequenceClassification.from_pretrained(self.model_name).to(
+                self.device
+            )
+        except Exception as e:
+            logger.error(f"Failed to load model '{self.model_name}': {e}")
+            raise
+
+        if self.quantize == "int8":
+            model = self._quantize_int8(model)
+        return model
+
+    @cached_property
+    def classifier(self) -> Any:
+        """Text-classification pipeline sharing the loaded model and tokenizer."""
+        import torch
+        from transformers import pipeline
+
+        return pipeline(
+            "text-classification",
+            model=self.model,
+            # The pipeline moves the model to its device; keep it on the engine's device
+            device=torch.device(self.device),
+            tokenizer=self.tokenizer,
+        )
+
+    def _load_onnx_model(self) -> Any:
+        """
+        Export the model to ONNX and load it into an ONNX Runtime session.
+
+        The session enables all graph optimizations (operator fusion, constant
+        folding). On CUDA it also uses IO binding so outputs stay in preallocated
+        device buffers; on CPU IO binding only adds copies and is left off.
+
+        Returns:
+            ORTModelForSequenceClassification with the same call interface as the
+            transformers model
+        """
+        try:
+            import onnxruntime as ort
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+        except ImportError as e:
+            logger.error(
+                "ONNX Runtime backend not installed. Please install with: pip install optimum[onnxruntime]"
+            )
+            raise ImportError(
+                "optimum[onnxruntime] is required for backend='onnx'. Install with: pip install optimum[onnxruntime]"
+            ) from e
+
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        provider = "CUDAExecutionProvider" if self.device == "cuda" else "CPUExecutionProvider"
+
+        try:
+            logger.info(f"Exporting model '{self.model_name}' to ONNX ({provider})")
+            return ORTModelForSequenceClassification.from_pretrained(
+                self.model_name,
+                export=True,
+                provider=provider,
+                session_options=session_options,
+                use_io_binding=provider == "CUDAExecutionProvider",
+            )
+        except Exception as e:
+            logger.error(f"Failed to load ONNX model '{self.model_name}': {e}")
+            raise
+
+    def _quantize_int8(self, model: Any) -> Any:
+        """
+        Apply dynamic INT8 quantization to the model's Linear layers.
+
+        Only called on CPU; ``__init__`` disables quantization on other devices.
+
+        Args:
+            model: Loaded sequence classification model
+
+        Returns:
+            Quantized model
+        """
+        import torch
+
+        logger.info("Applying dynamic INT8 quantization to Linear layers")
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
     def predict(self, text: str) -> dict[str, Any]:
         """
         Single prediction with optional security wrapping.
@@ -96,29 +209,15 @@ class OtisInferenceEngine:
         logger.info(f"Processing prediction for text: {text[:100]}...")
 
         # Pre-inference security check (blue team)
-        if self.blue_team and self.blue_team_enabled:
-            threat_event = self.blue_team.detect_threats(text)
-            if threat_event and threat_event.threat_level.value in ["critical", "high"]:
-                logger.warning("High threat detected, returning security blocked response")
-                return {
-                    "label": "SECURITY_BLOCKED",
-                    "score": 1.0,
-                    "text": text,
-                    "security_event_id": threat_event.event_id,
-                    "threat_level": threat_event.threat_level.value,
-                }
+        blocked_result = self._pre_inference_check(text)
+        if blocked_result:
+            return blocked_result
 
         # Run inference
         try:
             result = self.classifier(text)[0]
             confidence = result["score"]
-
-            # Map labels if needed (HuggingFace models often use LABEL_0/LABEL_1)
-            label = result["label"]
-            if label == "LABEL_1":
-                label = "SPAM"
-            elif label == "LABEL_0":
-                label = "NOT_SPAM"
+            label = self._map_label(result["label"])
 
             prediction_result = {"label": label, "score": confidence, "text": text}
 
@@ -129,46 +228,221 @@ class OtisInferenceEngine:
             return {"label": "ERROR", "score": 0.0, "text": text, "error": str(e)}
 
         # Post-inference security check
-        if self.blue_team and self.blue_team_enabled:
-            # Run threat detection on the model output
-            model_output_with_text = prediction_result.copy()
-            threat_event = self.blue_team.detect_threats(text, model_output_with_text)
-
-            if threat_event:
-                logger.warning(f"Post-inference threat detected: {threat_event.threat_level.value}")
-                prediction_result["security_event_id"] = threat_event.event_id
-                prediction_result["post_inference_threat"] = threat_event.threat_level.value
-
-        return prediction_result
+        return self._post_inference_check(text, prediction_result)
 
     def predict_batch(self, texts: list[str], batch_size: int = 32) -> list[dict[str, Any]]:
         """
         Batch predictions for efficiency with optional security wrapping.
 
+        Texts that pass the pre-inference security check are tokenized together
+        and classified with a single forward pass per batch. Inputs are ordered
+        by length within each batch to minimize padding, and results are returned
+        in the original input order.
+
         Args:
             texts: List of texts to classify
-            batch_size: Size of batches for processing
+            batch_size: Maximum number of texts per forward pass (bounds memory)
 
         Returns:
             List of prediction results
         """
         logger.info(f"Processing batch of {len(texts)} texts")
 
-        results = []
+        results = list(self.predict_batch_iter(texts, batch_size=batch_size))
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            batch_results = []
+        logger.info(f"Batch processing completed for {len(results)} texts")
+        return results
 
-            for text in batch:
-                result = self.predict_single_with_security(text)
-                batch_results.append(result)
+    def predict_batch_iter(
+        self, texts: Iterable[str], batch_size: int = 32
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream batch predictions, one forward pass per ``batch_size`` texts.
 
-            results.extend(batch_results)
+        Only a single batch of inputs and logits is alive at a time, so callers can
+        classify arbitrarily large (or lazily produced) collections with bounded memory.
+
+        Args:
+            texts: Iterable of texts to classify
+            batch_size: Number of texts per forward pass
+
+        Yields:
+            Prediction results in input order
+        """
+        iterator = iter(texts)
+        while chunk := list(islice(iterator, batch_size)):
+            yield from self._predict_chunk(chunk)
+
+    def _predict_chunk(self, texts: list[str]) -> list[dict[str, Any]]:
+        """
+        Run security checks and a single batched forward pass over a chunk of texts.
+
+        Args:
+            texts: Texts to classify (at most one forward batch)
+
+        Returns:
+            List of prediction results aligned with ``texts``
+        """
+        # Red team monitoring runs a per-text robustness analysis
+        if self.red_team and self.red_team_monitoring:
+            return [self.predict_single_with_security(text) for text in texts]
+
+        results: list[dict[str, Any] | None] = [None] * len(texts)
+
+        # Classify each distinct text once; duplicates receive copies of its prediction
+        positions: dict[str, list[int]] = {}
+        for idx, text in enumerate(texts):
+            blocked_result = self._pre_inference_check(text)
+            if blocked_result:
+                results[idx] = blocked_result
+            else:
+                positions.setdefault(text, []).append(idx)
+
+        if not positions:
+            return results
+
+        # Longest first so the batch pads to a similar length
+        batch_texts = sorted(positions, key=len, reverse=True)
+
+        for text, prediction in zip(batch_texts, self._classify_batch(batch_texts), strict=True):
+            for idx in positions[text]:
+                if prediction["label"] == "ERROR":
+                    results[idx] = dict(prediction)
+                else:
+                    results[idx] = self._post_inference_check(text, dict(prediction))
 
-        logger.info(f"Batch processing completed for {len(results)} texts")
         return results
 
+    def _classify_batch(self, texts: list[str]) -> list[dict[str, Any]]:
+        """
+        Classify a batch of texts with a single tokenizer call and forward pass.
+
+        Falls back to per-text pipeline inference if the batched forward fails.
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            List of prediction dicts aligned with ``texts``
+        """
+        try:
+            import torch
+
+            # Cached encodings are tuples; the tokenizer pads with list concatenation
+            encodings = [self._encode(text) for text in texts]
+            encoded = self.tokenizer.pad(
+                {
+                    "input_ids": [list(input_ids) for input_ids, _ in encodings],
+                    "attention_mask": [list(attention_mask) for _, attention_mask in encodings],
+                },
+                padding=True,
+                return_tensors="pt",
+            ).to(self.device)
+
+            with torch.inference_mode():
+                probs = self.model(**encoded).logits.softmax(-1)
+
+            scores, label_ids = probs.max(dim=-1)
+            id2label = self.model.config.id2label
+
+            return [
+                {"label": self._map_label(id2label[label_id]), "score": score, "text": text}
+                for text, score, label_id in zip(
+                    texts, scores.tolist(), label_ids.tolist(), strict=True
+                )
+            ]
+        except Exception as e:
+            logger.warning(f"Batched inference failed, falling back to per-text inference: {e}")
+
+        predictions = []
+        for text in texts:
+            try:
+                result = self.classifier(text)[0]
+                predictions.append(
+                    {
+                        "label": self._map_label(result["label"]),
+                        "score": result["score"],
+                        "text": text,
+                    }
+                )
+            except Exception as e:
+                logger.error(f"Model inference failed: {e}")
+                predictions.append({"label": "ERROR", "score": 0.0, "text": text, "error": str(e)})
+
+        return predictions
+
+    def _encode_text(self, text: str) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """
+        Tokenize a single text without padding.
+
+        Wrapped per instance in an LRU cache as ``_encode`` so repeated texts skip
+        the tokenizer; tuples keep cached encodings immutable.
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            Tuple of (input_ids, attention_mask)
+        """
+        encoded = self.tokenizer(text, truncation=True, max_length=512)
+        return tuple(encoded["input_ids"]), tuple(encoded["attention_mask"])
+
+    @staticmethod
+    def _map_label(label: str) -> str:
+        """Map raw HuggingFace labels (LABEL_0/LABEL_1) to SPAM/NOT_SPAM."""
+        if label == "LABEL_1":
+            return "SPAM"
+        if label == "LABEL_0":
+            return "NOT_SPAM"
+        return label
+
+    def _pre_inference_check(self, text: str) -> dict[str, Any] | None:
+        """
+        Run the blue team check before inference.
+
+        Args:
+            text: Text about to be classified
+
+        Returns:
+            A SECURITY_BLOCKED response for high/critical threats, None otherwise
+        """
+        if self.blue_team and self.blue_team_enabled:
+            threat_event = self.blue_team.detect_threats(text)
+            if threat_event and threat_event.threat_level.value in ["critical", "high"]:
+                logger.warning("High threat detected, returning security blocked response")
+                return {
+                    "label": "SECURITY_BLOCKED",
+                    "score": 1.0,
+                    "text": text,
+                    "security_event_id": threat_event.event_id,
+                    "threat_level": threat_event.threat_level.value,
+                }
+
+        return None
+
+    def _post_inference_check(self, text: str, prediction_result: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run the blue team check on the model output.
+
+        Args:
+            text: Classified text
+            prediction_result: Prediction dict to annotate with threat information
+
+        Returns:
+            The (possibly annotated) prediction dict
+        """
+        if self.blue_team and self.blue_team_enabled:
+            # Run threat detection on the model output
+            model_output_with_text = prediction_result.copy()
+            threat_event = self.blue_team.detect_threats(text, model_output_with_text)
+
+            if threat_event:
+                logger.warning(f"Post-inference threat detected: {threat_event.threat_level.value}")
+                prediction_result["security_event_id"] = threat_event.event_id
+                prediction_result["post_inference_threat"] = threat_event.threat_level.value
+
+        return prediction_result
+
     def predict_single_with_security(self, text: str) -> dict[str, Any]:
         """
         Single prediction with comprehensive security checking.
@@ -228,6 +502,8 @@ class OtisInferenceEngine:
             "model_type": "transformer_binary_classifier",
             "task": "spam_classification",
             "labels": ["SPAM", "NOT_SPAM"],
+            "quantization": self.quantize,
+            "backend": self.backend,
             "security_features": {
                 "blue_team_enabled": self.blue_team_enabled,
                 "red_team_monitoring": self.red_team_monitoring,
@@ -261,6 +537,7 @@ class OtisInferenceEngine:
                 test_texts,
                 attack_samples_per_text=3,
                 attack_types=attack_types,
+                model_predict_batch_func=self.predict_batch,
             )
 
             robustness_metrics = {
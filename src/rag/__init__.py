@@ -1,5 +1,13 @@
 """RAG (Retrieval-Augmented Generation) module."""
 
-from src.rag.index import build_index, query
-
 __all__ = ["query", "build_index"]
+
+
+def __getattr__(name: str):
+    # Resolve the Chroma-backed API on first access so lightweight helpers such
+    # as src.rag.sources can be imported without loading chromadb
+    if name in __all__:
+        from src.rag import index
+
+        return getattr(index, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
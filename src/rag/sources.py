@@ -0,0 +1,302 @@
+"""Streaming loaders for RAG knowledge sources."""
+
+import codecs
+import gzip
+import hashlib
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+MITRE_ATTACK_URL = (
+    "https://raw.githubusercontent.com/mitre/cti/master/enterprise-attack/enterprise-attack.json"
+)
+DEFAULT_CACHE_DIR = Path("./data/cache")
+_READ_CHUNK_SIZE = 1 << 16
+
+# JSON insignificant whitespace, optionally followed by a value separator
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SEPARATORS = re.compile(r"[ \t\n\r,]*")
+
+
+class JSONArrayStreamParser:
+    """
+    Incrementally decode the items of a JSON array stored under ``key``.
+
+    Bytes are fed as they arrive from the network; each complete array item is
+    returned as soon as it has been read, so only the item currently being
+    received is buffered instead of the whole document. The first ``"key":``
+    occurrence in the stream is taken as the array to decode.
+    """
+
+    def __init__(self, key: str):
+        """
+        Initialize the parser.
+
+        Args:
+            key: Name of the field whose array items should be yielded
+        """
+        self._marker = json.dumps(key)
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._in_array = False
+        self._done = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Feed the next chunk of the response body.
+
+        Args:
+            chunk: Raw bytes from the stream
+
+        Returns:
+            Array items completed by this chunk
+        """
+        self._buffer += self._utf8.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        """
+        Signal the end of the stream.
+
+        Returns:
+            Any remaining array items
+
+        Raises:
+            ValueError: If the array was never found or is not terminated
+        """
+        self._buffer += self._utf8.decode(b"", final=True)
+        items = self._drain(final=True)
+        if not self._done:
+            raise ValueError(f"Stream ended before the {self._marker} array was complete")
+        return items
+
+    def _drain(self, final: bool) -> list[Any]:
+        """Decode every complete item currently in the buffer."""
+        if self._done:
+            return []
+        if not self._in_array and not self._seek_array():
+            return []
+
+        items = []
+        buffer = self._buffer
+        pos = 0
+        length = len(buffer)
+
+        while True:
+            pos = _SEPARATORS.match(buffer, pos).end()
+            if pos >= length:
+                break
+            if buffer[pos] == "]":
+                self._done = True
+                pos += 1
+                break
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+
+            # A scalar touching the end of the buffer may continue in the next chunk
+            if end == length and not final:
+                break
+
+            items.append(item)
+            pos = end
+
+        self._buffer = buffer[pos:]
+        return items
+
+    def _seek_array(self) -> bool:
+        """Advance the buffer to just past the opening bracket of the target array."""
+        buffer = self._buffer
+        start = 0
+
+        while True:
+            index = buffer.find(self._marker, start)
+            if index < 0:
+                # Keep a tail in case the marker is split across chunks
+                self._buffer = buffer[-len(self._marker) :]
+                return False
+
+            pos = _WHITESPACE.match(buffer, index + len(self._marker)).end()
+            if pos < len(buffer) and buffer[pos] == ":":
+                pos = _WHITESPACE.match(buffer, pos + 1).end()
+                if pos < len(buffer) and buffer[pos] == "[":
+                    self._buffer = buffer[pos + 1 :]
+                    self._in_array = True
+                    return True
+
+            if pos >= len(buffer):
+                # Marker found but the value has not arrived yet
+                self._buffer = buffer[index:]
+                return False
+            start = index + 1
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Yield the items of the JSON array under ``key`` from a byte stream.
+
+    Args:
+        chunks: Iterable of raw response chunks (e.g. ``response.iter_bytes()``)
+        key: Name of the array field
+
+    Yields:
+        Decoded array items in document order
+    """
+    parser = JSONArrayStreamParser(key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes], key: str) -> AsyncIterator[Any]:
+    """
+    Async variant of :func:`iter_json_array`.
+
+    Args:
+        chunks: Async iterable of raw response chunks (e.g. ``response.aiter_bytes()``)
+        key: Name of the array field
+
+    Yields:
+        Decoded array items in document order
+    """
+    parser = JSONArrayStreamParser(key)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+
+
+def mitre_cache_path(url: str = MITRE_ATTACK_URL, cache_dir: Path = DEFAULT_CACHE_DIR) -> Path:
+    """
+    Get the on-disk cache location for a MITRE ATT&CK bundle.
+
+    Args:
+        url: Bundle URL
+        cache_dir: Cache directory
+
+    Returns:
+        Path of the gzip-compressed bundle for this URL
+    """
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"mitre-enterprise-{digest}.json.gz"
+
+
+async def fetch_mitre_bundle(
+    client: httpx.AsyncClient,
+    url: str = MITRE_ATTACK_URL,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> Path:
+    """
+    Download the MITRE ATT&CK bundle into the gzip cache, revalidating by ETag.
+
+    When a cached copy exists the request carries ``If-None-Match`` and a
+    ``304 Not Modified`` reply reuses the cache without transferring the body.
+
+    Args:
+        client: Shared HTTP client
+        url: Bundle URL
+        cache_dir: Cache directory
+
+    Returns:
+        Path of the cached, gzip-compressed bundle
+    """
+    cache_path = mitre_cache_path(url, cache_dir)
+    etag_path = cache_path.with_suffix(".etag")
+
+    headers = {}
+    if cache_path.exists() and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text().strip()
+
+    async with client.stream("GET", url, headers=headers) as response:
+        if response.status_code == 304:
+            logger.info("MITRE ATT&CK bundle not modified, using cache", path=str(cache_path))
+            return cache_path
+        response.raise_for_status()
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        partial_path = cache_path.with_suffix(".partial")
+        with gzip.open(partial_path, "wb", compresslevel=6) as cache_file:
+            async for chunk in response.aiter_bytes():
+                cache_file.write(chunk)
+        partial_path.replace(cache_path)
+
+        etag = response.headers.get("etag")
+        if etag:
+            etag_path.write_text(etag)
+        else:
+            etag_path.unlink(missing_ok=True)
+
+    logger.info("MITRE ATT&CK bundle cached", path=str(cache_path))
+    return cache_path
+
+
+def iter_mitre_techniques(bundle_path: Path) -> Iterator[dict[str, str]]:
+    """
+    Stream ATT&CK techniques from a cached, gzip-compressed bundle.
+
+    Args:
+        bundle_path: Path returned by :func:`fetch_mitre_bundle`
+
+    Yields:
+        Technique dicts with 'id', 'name', 'description' and 'tactic' ('' when absent)
+    """
+    with gzip.open(bundle_path, "rb") as bundle_file:
+        chunks = iter(lambda: bundle_file.read(_READ_CHUNK_SIZE), b"")
+
+        for obj in iter_json_array(chunks, "objects"):
+            # Skip the bulk of non-technique objects before reading any other field
+            if obj.get("type") != "attack-pattern":
+                continue
+
+            phases = obj.get("kill_chain_phases")
+            if phases and isinstance(phases, list) and "phase_name" in phases[0]:
+                tactic = ", ".join(phases[0]["phase_name"].split("-"))
+            else:
+                tactic = ""
+            refs = obj.get("external_references")
+
+            yield {
+                "id": refs[0].get("external_id", "") if refs else "",
+                "name": obj.get("name", ""),
+                "description": obj.get("description", ""),
+                "tactic": tactic,
+            }
+
+
+async def load_mitre_techniques(
+    client: httpx.AsyncClient | None = None,
+    url: str = MITRE_ATTACK_URL,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> Iterator[dict[str, str]]:
+    """
+    Fetch (or revalidate) the MITRE ATT&CK bundle and stream its techniques.
+
+    Args:
+        client: Optional shared HTTP client; a short-lived one is used otherwise
+        url: Bundle URL
+        cache_dir: Cache directory
+
+    Returns:
+        Iterator over technique dicts (see :func:`iter_mitre_techniques`)
+    """
+    if client is None:
+        async with httpx.AsyncClient(timeout=60) as own_client:
+            bundle_path = await fetch_mitre_bundle(own_client, url, cache_dir)
+    else:
+        bundle_path = await fetch_mitre_bundle(client, url, cache_dir)
+
+    return iter_mitre_techniques(bundle_path)
@@ -38,15 +38,20 @@ class ChromaService:
         documents: list[str],
         metadatas: list[dict],
         ids: list[str] | None = None,
+        embeddings: list[list[float]] | None = None,
     ) -> None:
-        """Add documents to the vector store."""
+        """Add documents to the vector store.
+
+        Precomputed ``embeddings`` are stored as-is, skipping the collection's
+        embedding function.
+        """
         collection = self.get_collection()
 
         if ids is None:
             ids = [f"doc_{i}" for i in range(len(documents))]
 
         logger.info("Adding documents to Chroma", count=len(documents))
-        collection.add(documents=documents, metadatas=metadatas, ids=ids)
+        collection.add(documents=documents, embeddings=embeddings, metadatas=metadatas, ids=ids)
 
     def query(
         self,
@@ -1,10 +1,11 @@
 """Unit tests for blue team threat detection and remediation components."""
 
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
-from src.defensive.blue_team_pipeline import BlueTeamPipeline, ThreatEvent
+from src.defensive.blue_team_pipeline import BlueTeamPipeline, ThreatEvent, get_blue_team_pipeline
 from src.defensive.remediation_engine import AutomatedRemediationEngine
 from src.defensive.threat_detectors import (
     ConfidenceAnomalyDetector,
@@ -162,6 +163,12 @@ def test_run_all_detectors():
         assert details is None or isinstance(details, dict)
 
 
+def test_get_blue_team_pipeline_is_shared():
+    """Test the cached getter returns one process-wide pipeline."""
+    assert isinstance(get_blue_team_pipeline(), BlueTeamPipeline)
+    assert get_blue_team_pipeline() is get_blue_team_pipeline()
+
+
 def test_blue_team_detect_threats():
     """Test blue team pipeline threat detection."""
     pipeline = BlueTeamPipeline()
@@ -201,6 +208,37 @@ def test_blue_team_process_incoming_text():
     assert result["final_action"] in ["allow", "quarantine", "flag_for_review"]
 
 
+def test_blue_team_detection_cache_reuses_text_detectors(monkeypatch):
+    """Test repeated texts skip the text detectors and still yield independent events."""
+    import src.defensive.blue_team_pipeline as pipeline_module
+
+    calls = []
+    original = pipeline_module.run_text_detectors
+
+    def counting_run_text_detectors(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(pipeline_module, "run_text_detectors", counting_run_text_detectors)
+
+    pipeline = BlueTeamPipeline(detection_cache_size=2)
+    text = "Click 𝟘 here %66%72%65%65 [IGNORE PREVIOUS]"
+
+    first = pipeline.detect_threats(text)
+    second = pipeline.detect_threats(text, {"label": "SPAM", "score": 0.5})
+
+    assert calls == [text]
+    assert first.detector_details is not second.detector_details
+    assert first.detector_details[0] is not second.detector_details[0]
+    assert "CONFIDENCE_ANOMALY" in second.detectors_triggered
+
+    pipeline.detect_threats("first other text")
+    pipeline.detect_threats("second other text")
+    pipeline.detect_threats(text)
+
+    assert calls.count(text) == 2  # evicted once the cache exceeded its size
+
+
 def test_threat_statistics():
     """Test threat statistics functionality."""
     pipeline = BlueTeamPipeline()
@@ -291,6 +329,123 @@ def test_remediation_engine_high_threat():
     ]
 
 
+def test_remediation_engine_async_remediation(mock_audit_logger):
+    """Test async remediation awaits native coroutines and falls back to sync calls."""
+
+    class AsyncNotificationSystem:
+        def __init__(self):
+            self.awaited = []
+
+        async def asend_alert(self, level, title, details, event_id):
+            self.awaited.append(event_id)
+            return {"sent": True}
+
+        async def asend_notification(self, level, title, details, event_id):
+            self.awaited.append(event_id)
+            return {"sent": True}
+
+    notifications = AsyncNotificationSystem()
+    remediation = AutomatedRemediationEngine(
+        audit_logger=mock_audit_logger, notification_system=notifications
+    )
+
+    threat_event = {
+        "threat_level": "HIGH",
+        "text": "High risk content",
+        "detectors_triggered": ["ENCODING_ANOMALY"],
+        "severity_score": 0.8,
+        "event_id": "TEST789",
+    }
+
+    result = asyncio.run(remediation.aremediate(threat_event))
+
+    assert result["event_id"] == "TEST789"
+    assert result["status"] != "remediation_failed"
+    assert mock_audit_logger.logs == [result]
+    assert remediation.remediation_history == [result]
+
+
+def test_remediation_engine_async_notification_failure(mock_audit_logger):
+    """Test a failed async notification marks the remediation failed but not its audit entry."""
+
+    class FailingNotificationSystem:
+        async def asend_notification(self, level, title, details, event_id):
+            raise ConnectionError("alerting backend unavailable")
+
+    remediation = AutomatedRemediationEngine(
+        audit_logger=mock_audit_logger, notification_system=FailingNotificationSystem()
+    )
+    apply_actions = remediation._apply_remediation_actions
+
+    def apply_with_notification(remediation_actions, threat_level, threat_event):
+        apply_actions(remediation_actions, threat_level, threat_event)
+        return "send_notification", {
+            "level": "MEDIUM",
+            "title": "Threat",
+            "details": threat_event,
+            "event_id": remediation_actions["event_id"],
+        }
+
+    remediation._apply_remediation_actions = apply_with_notification
+    threat_event = {"text": "Suspicious content", "event_id": "TEST999"}
+
+    result = asyncio.run(remediation.aremediate(threat_event))
+
+    assert result["status"] == "remediation_failed"
+    assert result["error"] == "alerting backend unavailable"
+    assert len(mock_audit_logger.logs) == 1
+    audit_entry = mock_audit_logger.logs[0]
+    assert audit_entry is not result
+    assert audit_entry["event_id"] == "TEST999"
+    assert audit_entry["status"] == "logged"
+    assert "error" not in audit_entry
+
+def test_blue_team_aprocess_incoming_text_matches_sync():
+    """Test async pipeline processing produces the same outcome as the sync path."""
+    pipeline = BlueTeamPipeline()
+
+    async def mock_model(text):
+        return {"label": "SPAM", "score": 0.85}
+
+    texts = ["Click 𝟘 here for free money!", "Meeting at 2pm"]
+
+    async def process_all():
+        return await asyncio.gather(
+            *(pipeline.aprocess_incoming_text(text, mock_model) for text in texts)
+        )
+
+    async_results = asyncio.run(process_all())
+    sync_results = [
+        pipeline.process_incoming_text(text, lambda t: {"label": "SPAM", "score": 0.85})
+        for text in texts
+    ]
+
+    for async_result, sync_result in zip(async_results, sync_results, strict=True):
+        assert async_result["threat_detected"] == sync_result["threat_detected"]
+        assert async_result["final_action"] == sync_result["final_action"]
+        assert async_result["processing_steps"] == sync_result["processing_steps"]
+
+
+def test_blue_team_abatch_process_texts_coalesces_predictions():
+    """Test batched async processing issues fewer model calls and keeps input order."""
+    pipeline = BlueTeamPipeline()
+    batch_sizes = []
+
+    def batch_predict(texts):
+        batch_sizes.append(len(texts))
+        return [{"label": "SPAM", "score": 0.85} for _ in texts]
+
+    texts = [f"Message number {i}" for i in range(10)] + ["Click 𝟘 here for free money!"]
+
+    results = asyncio.run(pipeline.abatch_process_texts(texts, batch_predict, max_batch=4))
+
+    assert [result["text"] for result in results] == texts
+    assert sum(batch_sizes) == len(texts)
+    assert max(batch_sizes) <= 4
+    assert len(batch_sizes) < len(texts)
+    assert results[-1]["threat_detected"]
+
+
 def test_threat_severity_classification():
     """Test threat severity classification."""
     pipeline = BlueTeamPipeline()
@@ -1,9 +1,11 @@
 """Tests for NIST AI Risk Management Framework compliance."""
 
+import os
 from datetime import datetime
 
 import pytest
 
+from src.compliance import nist_ai_rmf
 from src.compliance.nist_ai_rmf import NistAIRMFramework, RiskAssessment
 
 
@@ -76,6 +78,105 @@ def test_complete_nist_assessment():
     assert "compliance_percentage" in summary
 
 
+def test_complete_assessment_cached_until_risks_change():
+    """Test that repeat assessments are cached and invalidated by risk register changes."""
+    framework = NistAIRMFramework()
+
+    first = framework.run_complete_assessment()
+    cached = framework.run_complete_assessment()
+    assert cached is not first
+    assert cached["assessed_at"] == first["assessed_at"]
+    assert first["cached"] is False
+    assert cached["cached"] is True
+
+    risk_id = framework.add_risk_assessment(
+        RiskAssessment(
+            risk_id="",
+            category="adversarial",
+            description="Homograph evasion of spam classifier",
+            likelihood=0.9,
+            impact=0.9,
+            risk_score=0.81,
+            controls=[],
+            status="Unaddressed",
+        )
+    )
+    second = framework.run_complete_assessment()
+    assert second is not first
+    assert second["summary"]["recommendations_count"] == 1
+
+    framework.update_risk_status(risk_id, "Mitigated")
+    third = framework.run_complete_assessment()
+    assert third is not second
+    assert third["summary"]["recommendations_count"] == 0
+
+    assert framework.run_complete_assessment(refresh=True) is not third
+
+
+def test_cached_assessment_reports_current_date(monkeypatch):
+    """Test that a cached assessment is re-dated and keeps the original assessment time."""
+    clock = iter(datetime(2026, 1, 1, hour) for hour in range(24))
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return next(clock)
+
+    monkeypatch.setattr(nist_ai_rmf, "datetime", FakeDatetime)
+    framework = NistAIRMFramework()
+
+    first = framework.run_complete_assessment()
+    cached = framework.run_complete_assessment()
+
+    assert cached["cached"] is True
+    assert cached["assessed_at"] == first["assessed_at"]
+    assert first["comprehensive_report"]["report_date"] == first["assessed_at"]
+    assert cached["comprehensive_report"]["report_date"] > first["assessed_at"]
+    # The cached original keeps its own date
+    assert framework.run_complete_assessment()["assessed_at"] == first["assessed_at"]
+
+
+def test_complete_assessment_cache_returns_isolated_copies():
+    """Test that mutating a returned assessment does not corrupt the cache."""
+    framework = NistAIRMFramework()
+
+    first = framework.run_complete_assessment()
+    rating = first["summary"]["overall_rating"]
+    first["summary"]["overall_rating"] = "Tampered"
+    first["risk_treatment_plan"]["treatment_recommendations"].append({"risk_id": "X"})
+
+    cached = framework.run_complete_assessment()
+    assert cached["summary"]["overall_rating"] == rating
+    assert cached["risk_treatment_plan"]["treatment_recommendations"] == []
+
+
+def test_complete_assessment_cache_invalidated_by_evidence_changes(tmp_path, monkeypatch):
+    """Test that adding or editing evidence documents invalidates the cached assessment."""
+    monkeypatch.setattr(nist_ai_rmf, "DOCS_DIR", str(tmp_path))
+    framework = NistAIRMFramework()
+    map_calls = []
+    assess_map_function = framework.assess_map_function
+    monkeypatch.setattr(
+        framework, "assess_map_function", lambda: map_calls.append(1) or assess_map_function()
+    )
+
+    first = framework.run_complete_assessment()
+    framework.run_complete_assessment()
+    assert len(map_calls) == 1
+    assert first["individual_assessments"]["map"].findings["has_threat_model"] is False
+
+    threat_model = tmp_path / "THREAT_MODEL.md"
+    threat_model.write_text("# Threat model\n")
+    second = framework.run_complete_assessment()
+    assert len(map_calls) == 2
+    assert second["individual_assessments"]["map"].findings["has_threat_model"] is True
+
+    stat = threat_model.stat()
+    os.utime(threat_model, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    framework.run_complete_assessment()
+    assert len(map_calls) == 3
+
+
 def test_generate_compliance_report():
     """Test compliance report generation."""
     framework = NistAIRMFramework()
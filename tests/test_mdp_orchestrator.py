@@ -0,0 +1,360 @@
+"""Unit tests for the multi-turn MDP attack orchestrator."""
+
+import asyncio
+from dataclasses import FrozenInstanceError
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from src.adversarial.mdp_orchestrator import (
+    AttackState,
+    AttackType,
+    MultiTurnAdversarialOrchestrator,
+)
+from src.adversarial.red_team_engine import RedTeamEngine
+
+
+@pytest.fixture
+def spam_classifier():
+    """Mock model that always flags text as spam."""
+    mock = Mock()
+    mock.return_value = {"label": "SPAM", "score": 0.9}
+    return mock
+
+
+def test_ucb1_tries_every_attack_before_exploiting(spam_classifier):
+    """Verify UCB1 explores each arm once before comparing scores."""
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier, policy="ucb1")
+
+    selected = []
+    for _ in AttackType:
+        action = orchestrator.select_adaptive_attack(Mock())
+        selected.append(action)
+        orchestrator.update_policy(action, 0.0)
+
+    assert sorted(a.value for a in selected) == sorted(a.value for a in AttackType)
+
+
+def test_ucb1_converges_on_rewarding_attack(spam_classifier):
+    """Verify UCB1 concentrates pulls on the attack that keeps evading."""
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier, policy="ucb1")
+
+    for _ in range(200):
+        action = orchestrator.select_adaptive_attack(Mock())
+        reward = 1.0 if action == AttackType.HOMOGRAPH_SUBSTITUTION else -1.0
+        orchestrator.update_policy(action, reward)
+
+    pulls = {action: arm.pulls for action, arm in orchestrator.arms.items()}
+    assert max(pulls, key=pulls.get) == AttackType.HOMOGRAPH_SUBSTITUTION
+    assert pulls[AttackType.HOMOGRAPH_SUBSTITUTION] > 100
+
+
+def test_exp3_shifts_weight_to_rewarding_attack(spam_classifier):
+    """Verify Exp3 weights move toward the attack with the lowest loss."""
+    orchestrator = MultiTurnAdversarialOrchestrator(
+        RedTeamEngine(), spam_classifier, horizon=50, seed=0
+    )
+
+    for _ in range(300):
+        action = orchestrator.select_adaptive_attack(Mock())
+        orchestrator.update_policy(action, 1.0 if action == AttackType.OBFUSCATION else -1.0)
+
+    weights = orchestrator.exp3_weights
+    assert weights.argmax() == orchestrator.action_space.index(AttackType.OBFUSCATION)
+    assert weights.max() == 1.0
+
+
+def test_exp3_weights_never_underflow_to_zero(spam_classifier):
+    """Verify a penalised rarely chosen arm keeps a positive weight and stays sampleable."""
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier, seed=0)
+    orchestrator.exp3_weights[0] = 1e-6
+
+    for _ in range(5):
+        orchestrator.update_policy(orchestrator.action_space[0], -1.0)
+
+    weights = orchestrator.exp3_weights
+    assert np.all(weights > 0)
+    assert np.all(np.isfinite(weights))
+    orchestrator.update_policy(orchestrator.action_space[0], 1.0)
+    assert np.all(np.isfinite(orchestrator.exp3_weights))
+
+
+def test_heuristic_policy_uses_confidence_bands(spam_classifier):
+    """Verify the heuristic policy is still available for comparison."""
+    orchestrator = MultiTurnAdversarialOrchestrator(
+        RedTeamEngine(), spam_classifier, policy="heuristic"
+    )
+    state = Mock(model_confidence=0.95)
+
+    assert orchestrator.select_adaptive_attack(state) == AttackType.OBFUSCATION
+
+
+def test_unknown_policy_rejected(spam_classifier):
+    """Verify an unknown policy name fails fast."""
+    with pytest.raises(ValueError):
+        MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier, policy="greedy")
+
+
+def test_attack_chain_updates_policy(spam_classifier):
+    """Verify chain transitions feed their rewards into the bandit arms."""
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier)
+    result = orchestrator.generate_adaptive_attack_chain("Click here to win money", max_turns=3)
+
+    assert not result["evasion_succeeded"]
+    assert sum(arm.pulls for arm in orchestrator.arms.values()) == len(result["transitions"]) == 3
+
+
+def test_repeated_texts_reuse_cached_prediction(spam_classifier):
+    """Verify the classifier runs once per distinct text."""
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier)
+
+    first = orchestrator.generate_targeted_attack("Win a prize now", "NOT_SPAM", max_turns=0)
+    first["original_prediction"]["score"] = 0.0
+    second = orchestrator.generate_targeted_attack("Win a prize now", "NOT_SPAM", max_turns=0)
+
+    assert spam_classifier.call_count == 1
+    assert second["original_prediction"] == {"label": "SPAM", "score": 0.9}
+
+
+def test_prediction_cache_can_be_disabled(spam_classifier):
+    """Verify a zero-size cache calls the classifier every time."""
+    orchestrator = MultiTurnAdversarialOrchestrator(
+        RedTeamEngine(), spam_classifier, prediction_cache_size=0
+    )
+
+    orchestrator.generate_targeted_attack("Win a prize now", "NOT_SPAM", max_turns=0)
+    orchestrator.generate_targeted_attack("Win a prize now", "NOT_SPAM", max_turns=0)
+
+    assert spam_classifier.call_count == 2
+
+
+def test_chain_states_share_history_log(spam_classifier):
+    """Verify each state sees only its own prefix of the shared action log."""
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier)
+    result = orchestrator.generate_adaptive_attack_chain("Click here to win money", max_turns=3)
+    transitions = orchestrator.attack_chains[-1]
+
+    assert result["attack_chain"] == [t.action_taken.value for t in transitions]
+    assert transitions[0].state_before.attack_history == []
+    assert transitions[1].state_before.attack_history == result["attack_chain"][:1]
+    assert transitions[0].state_after.shared_history is transitions[-1].state_after.shared_history
+
+    with pytest.raises(FrozenInstanceError):
+        transitions[0].state_after.turn_count = 0
+
+
+def test_concurrent_chains_batch_predictions(spam_classifier):
+    """Verify concurrent chains share batched classifier calls."""
+    batch_sizes = []
+
+    def batch_classifier(texts):
+        batch_sizes.append(len(texts))
+        return [{"label": "SPAM", "score": 0.9} for _ in texts]
+
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier)
+    texts = [f"Win prize number {i} now" for i in range(8)]
+    results = asyncio.run(
+        orchestrator.agenerate_adaptive_attack_chains(texts, batch_classifier, max_turns=2)
+    )
+
+    assert [r["initial_text"] for r in results] == texts
+    assert all("transitions" not in r for r in results)
+    assert all(len(chain) == 2 for chain in orchestrator.attack_chains)
+    assert sum(batch_sizes) == 8 * 3
+    assert len(batch_sizes) < 8 * 3
+    assert len(orchestrator.attack_chains) == 8
+
+
+def test_analyze_attack_effectiveness_matches_transitions():
+    """Verify aggregated statistics agree with the recorded transitions."""
+    scores = iter([0.9, 0.95, 0.2, 0.9, 0.9, 0.99, 0.9] * 10)
+    classifier = Mock(side_effect=lambda text: {"label": "SPAM", "score": next(scores)})
+    orchestrator = MultiTurnAdversarialOrchestrator(
+        RedTeamEngine(), classifier, prediction_cache_size=0
+    )
+
+    assert "error" in orchestrator.analyze_attack_effectiveness()
+    for i in range(3):
+        orchestrator.generate_adaptive_attack_chain(f"Claim reward {i}", max_turns=3)
+
+    analysis = orchestrator.analyze_attack_effectiveness()
+    transitions = [t for chain in orchestrator.attack_chains for t in chain]
+
+    assert analysis["total_chains"] == 3
+    assert analysis["total_transitions"] == len(transitions)
+    for action, stats in analysis["attack_effectiveness"].items():
+        rewards = [t.reward for t in transitions if t.action_taken.value == action]
+        assert stats["total"] == len(rewards)
+        assert stats["reward_sum"] == sum(rewards)
+        assert stats["positive_rewards"] == sum(r > 0 for r in rewards)
+        assert stats["negative_rewards"] == sum(r < 0 for r in rewards)
+
+
+def test_targeted_attack_dispatches_each_turn(spam_classifier):
+    """Verify targeted attacks run the selected engine attack every turn."""
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier)
+    result = orchestrator.generate_targeted_attack("Win a prize now", "NOT_SPAM", max_turns=2)
+
+    assert result["attack_sequence"] == [AttackType.OBFUSCATION.value] * 2
+    assert result["final_text"] != "Win a prize now"
+
+
+def test_vectorized_rewards_match_scalar_rewards():
+    """Verify calculate_rewards agrees with calculate_reward transition by transition."""
+    rng = np.random.default_rng(0)
+    before = rng.random(500).round(2)
+    after = rng.random(500).round(2)
+    labels_before = rng.choice(["SPAM", "NOT_SPAM"], 500)
+    labels_after = rng.choice(["SPAM", "NOT_SPAM"], 500, p=[0.8, 0.2])
+
+    rewards = MultiTurnAdversarialOrchestrator.calculate_rewards(
+        before, labels_before, after, labels_after
+    )
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), Mock())
+    expected = [
+        orchestrator.calculate_reward(
+            AttackState(
+                current_text="",
+                model_confidence=float(b),
+                model_label=lb,
+                shared_history=[],
+                turn_count=0,
+            ),
+            AttackState(
+                current_text="",
+                model_confidence=float(a),
+                model_label=la,
+                shared_history=[],
+                turn_count=1,
+            ),
+        )
+        for b, lb, a, la in zip(before, labels_before, after, labels_after, strict=True)
+    ]
+
+    assert rewards.dtype == np.float32
+    assert rewards.tolist() == expected
+    assert {-1.0, 0.0, 1.0} <= set(expected)
+
+
+def test_seeded_orchestrators_select_identically(spam_classifier):
+    """Verify the same seed reproduces the same attack selections."""
+
+    def selections(seed):
+        orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier, seed=seed)
+        picks = []
+        for _ in range(30):
+            action = orchestrator.select_adaptive_attack(Mock())
+            orchestrator.update_policy(action, -1.0)
+            picks.append(action)
+        return picks
+
+    assert selections(42) == selections(42)
+    assert selections(42) != selections(7)
+
+
+def test_beam_search_backtracks_to_evasion():
+    """Verify beam search expands sibling attacks and stops at the first evasion."""
+
+    def classifier(text):
+        if "%" in text:
+            return {"label": "NOT_SPAM", "score": 0.1}
+        return {"label": "SPAM", "score": 0.9}
+
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), classifier, policy="heuristic")
+    linear = orchestrator.generate_adaptive_attack_chain("Win a prize now", max_turns=2)
+    result = orchestrator.generate_adaptive_attack_chain("Win a prize now", max_turns=2, beam=7)
+
+    assert not linear["evasion_succeeded"]
+    assert result["evasion_succeeded"]
+    assert len(result["transitions"]) <= 2 * 7
+    assert result["final_label"] == "NOT_SPAM"
+    assert result["attack_chain"][-1] == AttackType.ENCODING_EVASION.value
+
+
+def test_exp3_beam_over_every_attack_survives_repeated_chains():
+    """Verify expanding every attack per step keeps working as Exp3 weights skew."""
+
+    def classifier(text):
+        # Encoded text looks more like spam, so some attacks keep backfiring
+        score = 0.99 if "%" in text or "\\u" in text else 0.9
+        return {"label": "SPAM", "score": score}
+
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), classifier, seed=0)
+    beam = len(AttackType)
+
+    for _ in range(5):
+        result = orchestrator.generate_adaptive_attack_chain(
+            "Win free money now, click here", max_turns=10, beam=beam
+        )
+        assert len(result["transitions"]) <= 10 * beam
+
+    assert np.all(orchestrator.exp3_weights > 0)
+
+
+def test_exp3_candidates_fill_beyond_zero_probability_arms(spam_classifier):
+    """Verify candidate selection still returns k distinct attacks when some weights are 0."""
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier, seed=0)
+    orchestrator.exp3_weights[[0, 2]] = 0.0
+
+    candidates = orchestrator._select_candidates(Mock(), len(AttackType))
+
+    assert sorted(a.value for a in candidates) == sorted(a.value for a in AttackType)
+
+
+def test_transitions_breakdown_is_optional(spam_classifier):
+    """Verify the per-transition breakdown can be skipped and rebuilt from attack_chains."""
+    orchestrator = MultiTurnAdversarialOrchestrator(RedTeamEngine(), spam_classifier)
+    full = orchestrator.generate_adaptive_attack_chain("Click here to win money", max_turns=3)
+    lean = orchestrator.generate_adaptive_attack_chain(
+        "Click here to win money", max_turns=3, include_transitions=False
+    )
+
+    assert "transitions" not in lean
+    assert lean["turns_needed"] == full["turns_needed"] == 3
+    described = orchestrator.describe_transitions(orchestrator.attack_chains[0])
+    assert described == full["transitions"]
+    assert [t["turn"] for t in described] == [1, 2, 3]
+
+
+def test_states_share_label_and_unchanged_text_objects():
+    """Verify stored states reuse interned labels and the parent's text when unchanged."""
+    classifier = Mock(side_effect=lambda text: {"label": "".join(["SP", "AM"]), "score": 0.9})
+    orchestrator = MultiTurnAdversarialOrchestrator(
+        RedTeamEngine(), classifier, prediction_cache_size=0
+    )
+    state = orchestrator._initial_state("Win now", classifier("Win now"), 0.5)
+
+    transition = orchestrator._record_transition(
+        state, AttackType.OBFUSCATION, "".join(["Win", " now"]), classifier("Win now")
+    )
+
+    assert transition.state_after.model_label is state.model_label
+    assert transition.state_after.current_text is state.current_text
+
+
+def test_chain_log_matches_in_memory_analysis(tmp_path):
+    """Verify chains logged to SQLite aggregate like the in-memory store, across writers."""
+
+    def make(**kwargs):
+        scores = iter([0.9, 0.95, 0.2, 0.9, 0.9, 0.99, 0.9] * 10)
+        classifier = Mock(side_effect=lambda text: {"label": "SPAM", "score": next(scores)})
+        return MultiTurnAdversarialOrchestrator(
+            RedTeamEngine(), classifier, prediction_cache_size=0, seed=3, **kwargs
+        )
+
+    in_memory = make()
+    logged = make(chain_log=tmp_path / "chains.db")
+    assert "error" in logged.analyze_attack_effectiveness()
+    for i in range(3):
+        in_memory.generate_adaptive_attack_chain(f"Claim reward {i}", max_turns=3)
+        logged.generate_adaptive_attack_chain(f"Claim reward {i}", max_turns=3)
+
+    assert logged.attack_chains == []
+    assert logged.analyze_attack_effectiveness() == in_memory.analyze_attack_effectiveness()
+    logged.close()
+
+    other_writer = make(chain_log=tmp_path / "chains.db")
+    other_writer.generate_adaptive_attack_chain("Claim reward", max_turns=3)
+    assert other_writer.analyze_attack_effectiveness()["total_chains"] == 4
+    other_writer.close()
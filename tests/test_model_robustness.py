@@ -325,3 +325,56 @@ def test_engine_device_selection():
         mock_cuda.return_value = False
         engine = OtisInferenceEngine(model_name="test-model", blue_team_enabled=False, device="cpu")
         assert engine.device == "cpu"
+
+
+def test_batched_inference_pads_mixed_length_cached_encodings():
+    """Test that cached (tuple) encodings of different lengths still batch in one forward pass."""
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+
+    class ListTokenizer:
+        """Tokenizer stand-in that pads with list concatenation, like transformers."""
+
+        def __call__(self, text, truncation=True, max_length=512):
+            ids = [101] + [len(word) for word in text.split()] + [102]
+            return {"input_ids": ids, "attention_mask": [1] * len(ids)}
+
+        def pad(self, features, padding=True, return_tensors=None):
+            width = max(len(ids) for ids in features["input_ids"])
+            padded = {
+                key: [seq + [0] * (width - len(seq)) for seq in sequences]
+                for key, sequences in features.items()
+            }
+            return transformers.BatchEncoding(padded, tensor_type=return_tensors)
+
+    engine = OtisInferenceEngine(model_name="test-model", blue_team_enabled=False, device="cpu")
+    model = Mock(
+        side_effect=lambda input_ids, attention_mask: Mock(
+            logits=torch.tensor([[0.0, 1.0]] * len(input_ids))
+        )
+    )
+    model.config.id2label = {0: "LABEL_0", 1: "LABEL_1"}
+    engine.__dict__.update(tokenizer=ListTokenizer(), model=model, classifier=Mock())
+
+    texts = ["short", "a much longer message to classify", "mid length text"]
+    engine._classify_batch(texts)
+    results = engine._classify_batch(texts)
+
+    assert [r["label"] for r in results] == ["SPAM"] * 3
+    assert model.call_count == 2
+    engine.classifier.assert_not_called()
+
+
+def test_classifier_pipeline_uses_engine_device():
+    """Test that the pipeline keeps the shared model on the engine's configured device."""
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+
+    engine = OtisInferenceEngine(model_name="test-model", blue_team_enabled=False, device="cpu")
+    engine.__dict__.update(tokenizer=Mock(), model=Mock())
+
+    with patch("transformers.pipeline") as mock_pipeline:
+        assert engine.classifier is mock_pipeline.return_value
+
+    assert mock_pipeline.call_args.kwargs["device"] == torch.device("cpu")
+    assert mock_pipeline.call_args.kwargs["model"] is engine.model
@@ -1,5 +1,7 @@
 """Unit tests for red team adversarial testing components."""
 
+import random
+from collections import Counter
 from unittest.mock import Mock
 
 import pytest
@@ -12,6 +14,7 @@ from src.adversarial.attack_vectors import (
     MultilingualInjectionAttack,
     PromptInjectionAttack,
     SemanticShiftAttack,
+    get_attack_by_name,
 )
 from src.adversarial.red_team_engine import RedTeamEngine, RobustnessReport
 
@@ -57,6 +60,40 @@ def test_character_obfuscation_preserves_meaning():
     assert abs(len(original) - len(result.modified_text)) < len(original) * 0.1
 
 
+def test_character_obfuscation_leaves_global_rng_untouched():
+    """Verify the fixed-seed generator does not reseed the module-level RNG."""
+    random.seed(123)
+    expected = random.random()
+
+    random.seed(123)
+    CharacterObfuscationAttack().execute("Click here for amazing offers!")
+    assert random.random() == expected
+
+
+def test_character_obfuscation_memoizes_repeat_inputs():
+    """Verify repeated (text, ratio) pairs are served from the cache."""
+    attack = CharacterObfuscationAttack()
+    text = "Win a free cruise today only"
+    first = attack.execute(text, obfuscation_ratio=0.6)
+    hits = CharacterObfuscationAttack._obfuscate.cache_info().hits
+
+    second = CharacterObfuscationAttack().execute(text, obfuscation_ratio=0.6)
+
+    assert CharacterObfuscationAttack._obfuscate.cache_info().hits == hits + 1
+    assert second.modified_text == first.modified_text
+    assert second.metadata == first.metadata
+    assert second.metadata is not first.metadata
+
+
+def test_attack_uses_dedicated_rng():
+    """Verify attacks draw from an injected generator when one is given."""
+    text = "Click here to claim your free prize"
+    first = SemanticShiftAttack(rng=random.Random(5)).execute(text, shift_ratio=0.5)
+    second = SemanticShiftAttack(rng=random.Random(5)).execute(text, shift_ratio=0.5)
+
+    assert first.modified_text == second.modified_text
+
+
 def test_semantic_shift_replaces_keywords():
     """Verify semantic shift replaces spam keywords."""
     attack = SemanticShiftAttack()
@@ -92,6 +129,16 @@ def test_encoding_evasion_encodes_characters():
     assert "%63%6C%69%63%6B" in result.modified_text  # "click" URL encoded
 
 
+def test_encoding_evasion_mixed_uses_every_scheme():
+    """Verify mixed mode spreads words across URL, HTML and Unicode encodings."""
+    attack = EncodingEvasionAttack(rng=random.Random(3))
+    result = attack.execute(" ".join(["click"] * 200), encoding_type="mixed", encode_ratio=1.0)
+    words = result.modified_text.split()
+
+    assert {word[:2] for word in words} == {"%6", "&#", "\\u", "cl"}
+    assert result.metadata["chars_encoded"] == 5 * sum(word != "click" for word in words)
+
+
 def test_homograph_substitution_replaces_characters():
     """Verify homograph substitution replaces characters."""
     attack = HomographSubstitutionAttack()
@@ -102,6 +149,8 @@ def test_homograph_substitution_replaces_characters():
     assert result.modified_text != original
     # Should contain mathematical symbols
     assert "𝐂" in result.modified_text or "𝐥" in result.modified_text or "𝟘" in result.modified_text
+    # Every alphanumeric character is eligible; punctuation and spaces are not
+    assert result.metadata["chars_substituted"] == sum(c.isalnum() for c in original)
 
 
 def test_multilingual_injection_adds_foreign_text():
@@ -191,6 +240,54 @@ def test_model_robustness_test_with_evasion():
     assert isinstance(report.evasion_rate, float)
 
 
+def test_model_robustness_parallel_matches_sequential():
+    """Test that threaded predictions produce the same report as the sequential path."""
+    engine = RedTeamEngine()
+
+    def mock_predict(text):
+        return {"label": "SPAM" if text.isascii() else "NOT_SPAM", "score": len(text) / 100}
+
+    text_samples = ["Click here for free money", "Verify your account now", "Lunch at noon"]
+    attack_types = ["OBFUSCATION", "HOMOGRAPH_SUBSTITUTION", "PROMPT_INJECTION"]
+
+    random.seed(7)
+    sequential = engine.test_model_robustness(
+        mock_predict, text_samples, attack_samples_per_text=3, attack_types=attack_types
+    )
+    random.seed(7)
+    parallel = engine.test_model_robustness(
+        mock_predict,
+        text_samples,
+        attack_samples_per_text=3,
+        attack_types=attack_types,
+        max_workers=4,
+    )
+
+    assert parallel.total_attacks == sequential.total_attacks
+    assert parallel.successful_evasions == sequential.successful_evasions
+    assert parallel.attack_histogram == sequential.attack_histogram
+    assert [h.modified_text for h in parallel.detailed_results] == [
+        h.modified_text for h in sequential.detailed_results
+    ]
+
+
+def test_execute_campaign_matrix():
+    """Test campaign execution returns one aligned result list per attack."""
+    engine = RedTeamEngine()
+    texts = ["Free money opportunity", "Win amazing prizes now"]
+
+    campaign = engine.execute_campaign(texts, ["OBFUSCATION", "PROMPT_INJECTION"])
+
+    assert list(campaign) == ["OBFUSCATION", "PROMPT_INJECTION"]
+    for results in campaign.values():
+        assert [result.original_text for result in results] == texts
+
+    assert set(engine.execute_campaign(texts)) == set(engine.attack_registry)
+
+    with pytest.raises(ValueError):
+        engine.execute_campaign(texts, ["NOT_AN_ATTACK"])
+
+
 def test_red_team_attack_evasion_examples():
     """Test getting evasion examples."""
     engine = RedTeamEngine()
@@ -281,3 +378,150 @@ def test_attack_result_consistency():
     assert result.modified_text == "modified"
     assert result.metadata["test"] == "value"
     assert result.attack_type == "TEST"
+
+
+def test_attack_result_full_metadata():
+    """Verify texts are kept off the metadata dict and merged back on demand."""
+    result = CharacterObfuscationAttack().execute("Click here for amazing offers!")
+
+    assert "original_text" not in result.metadata
+    assert result.full_metadata["original_text"] == result.original_text
+    assert result.full_metadata["modified_text"] == result.modified_text
+    assert result.full_metadata["attack_type"] == result.attack_type
+    assert result.full_metadata["chars_modified"] == result.metadata["chars_modified"]
+
+
+def test_execute_batch_matches_sequential_execute():
+    """Verify batch execution reproduces per-text results under the same seed."""
+    texts = ["Click 0 to win!", "", "Limited offer ends 2024", "Free prize inside"]
+
+    sequential_attack = HomographSubstitutionAttack(rng=random.Random(11))
+    sequential = [sequential_attack.execute(text, substitution_ratio=0.5) for text in texts]
+    batch = HomographSubstitutionAttack(rng=random.Random(11)).execute_batch(
+        texts, substitution_ratio=0.5
+    )
+    assert batch == sequential
+
+    obfuscation = CharacterObfuscationAttack()
+    assert obfuscation.execute_batch(texts) == [obfuscation.execute(text) for text in texts]
+    assert not obfuscation.execute_batch(texts)[1].success
+
+
+def test_get_attack_by_name_returns_shared_instance():
+    """Verify registry lookups reuse one instance and still reject unknown names."""
+    attack = get_attack_by_name("HOMOGRAPH")
+
+    assert isinstance(attack, HomographSubstitutionAttack)
+    assert get_attack_by_name("HOMOGRAPH") is attack
+    with pytest.raises(ValueError):
+        get_attack_by_name("UNKNOWN")
+
+
+def test_model_robustness_batched_matches_single():
+    """Test that batched predictions produce the same report in batch_size-sized calls."""
+    engine = RedTeamEngine()
+    batch_sizes = []
+
+    def mock_predict(text):
+        return {"label": "SPAM" if text.isascii() else "NOT_SPAM", "score": len(text) / 100}
+
+    def mock_predict_batch(texts):
+        batch_sizes.append(len(texts))
+        return [mock_predict(text) for text in texts]
+
+    text_samples = ["Click here for free money", "Verify your account now", "Lunch at noon"]
+    attack_types = ["OBFUSCATION", "HOMOGRAPH_SUBSTITUTION", "PROMPT_INJECTION"]
+
+    random.seed(7)
+    single = engine.test_model_robustness(
+        mock_predict, text_samples, attack_samples_per_text=3, attack_types=attack_types
+    )
+    random.seed(7)
+    batched = engine.test_model_robustness(
+        None,
+        text_samples,
+        attack_samples_per_text=3,
+        attack_types=attack_types,
+        model_predict_batch_func=mock_predict_batch,
+        batch_size=4,
+    )
+
+    assert batched.attack_histogram == single.attack_histogram
+    assert [h.confidence_after for h in batched.detailed_results] == [
+        h.confidence_after for h in single.detailed_results
+    ]
+    assert batch_sizes[0] == 3
+    assert max(batch_sizes) == 4
+    assert sum(batch_sizes) <= 3 + single.total_attacks
+
+
+def test_model_robustness_metrics_match_history():
+    """Test that aggregate metrics agree with the per-attack history entries."""
+    engine = RedTeamEngine()
+
+    def mock_predict(text):
+        return {"label": "SPAM" if text.isascii() else "NOT_SPAM", "score": len(text) / 100}
+
+    random.seed(3)
+    report = engine.test_model_robustness(
+        mock_predict,
+        ["Click here for free money", "Verify your account now", "Lunch at noon"],
+        attack_samples_per_text=4,
+        attack_types=["OBFUSCATION", "HOMOGRAPH_SUBSTITUTION", "PROMPT_INJECTION"],
+    )
+    history = report.detailed_results
+    drops = [h.confidence_before - h.confidence_after for h in history]
+
+    assert report.successful_evasions == sum(h.success for h in history)
+    assert report.avg_confidence_drop == pytest.approx(sum(drops) / len(drops))
+    assert report.attack_histogram == dict(Counter(h.attack_type for h in history))
+
+
+def test_evasion_examples_filter_confidence_columns():
+    """Test that evasion examples are exactly the entries with a large enough drop."""
+    from datetime import datetime
+
+    from src.adversarial.red_team_engine import AttackHistory
+
+    engine = RedTeamEngine()
+    drops = [(0.9, 0.1), (0.9, 0.7), (0.6, 0.2), (0.8, 0.6), (0.5, 0.9)]
+    for before, after in drops:
+        engine.attack_history.append(
+            AttackHistory(
+                timestamp=datetime.now(),
+                original_text="test",
+                modified_text="modified",
+                attack_type="OBFUSCATION",
+                success=True,
+                confidence_before=before,
+                confidence_after=after,
+                metadata={},
+            )
+        )
+
+    expected = [h for h in engine.attack_history if h.confidence_after < h.confidence_before - 0.3]
+    assert engine.get_evasion_examples() == expected
+    assert [(h.confidence_before, h.confidence_after) for h in expected] == [(0.9, 0.1), (0.6, 0.2)]
+    assert len(engine.attack_history) == 5
+
+
+def test_model_robustness_skips_repeated_predictions():
+    """Test that repeated samples and colliding attack outputs are classified only once."""
+    engine = RedTeamEngine()
+    predicted = []
+
+    def mock_predict(text):
+        predicted.append(text)
+        return {"label": "SPAM", "score": 0.9}
+
+    # Obfuscation is seeded per call, so every sample yields the same modified text
+    report = engine.test_model_robustness(
+        mock_predict,
+        ["Click here for free money", "Click here for free money"],
+        attack_samples_per_text=3,
+        attack_types=["OBFUSCATION"],
+    )
+
+    assert report.total_attacks == 6
+    assert len({h.modified_text for h in report.detailed_results}) == 1
+    assert predicted == ["Click here for free money", report.detailed_results[0].modified_text]
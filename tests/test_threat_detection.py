@@ -239,6 +239,23 @@ def test_encoding_detector_patterns():
             assert details["threat_detected"]
 
 
+def test_encoding_detector_counts_per_pattern():
+    """Test that the combined scan reports counts per pattern in declaration order."""
+    detector = EncodingAnomalyDetector()
+
+    detected, details = detector.detect("&#104;&#105; then %41%42%43 and \\x41 \\u0041")
+    assert detected
+    assert details["detection_types"] == [
+        "url_encoding",
+        "html_entities",
+        "hex_escaping",
+        "unicode_escaping",
+    ]
+    assert details["detections"]["url_encoding"]["count"] == 3
+    assert details["detections"]["html_entities"]["samples"] == ["&#104;", "&#105;"]
+    assert details["total_anomalies"] == 7
+
+
 def test_injection_keywords():
     """Test that injection detector finds various injection keywords."""
     detector = InjectionPatternDetector()
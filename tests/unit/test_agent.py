@@ -1,7 +1,10 @@
 """Tests for ReAct agent."""
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from src.agent.model import OllamaModel
@@ -183,3 +186,145 @@ class TestAgentModel:
             )
 
             assert result == "Test response"
+
+    @pytest.mark.asyncio
+    async def test_default_model_reused_across_calls(self):
+        """Test the convenience infer() keeps one pooled client between calls."""
+        from src.agent import model as model_module
+
+        with patch("src.agent.model.httpx.AsyncClient") as mock_client:
+            mock_response = MagicMock()
+            mock_response.json.return_value = {"response": "ok", "done": True}
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
+            mock_client.return_value.aclose = AsyncMock()
+
+            assert await model_module.infer("First") == "ok"
+            assert await model_module.infer("Second") == "ok"
+            await model_module.close_default_model()
+
+            assert mock_client.call_count == 1
+            mock_client.return_value.aclose.assert_awaited_once()
+
+    def test_default_model_closed_on_open_loop_when_loop_changes(self):
+        """Test switching loops closes the previous pooled client on its own loop."""
+        from src.agent import model as model_module
+
+        def new_client(*args, **kwargs):
+            client = MagicMock()
+            client.aclose = AsyncMock()
+            return client
+
+        async def get_model():
+            return model_module.get_default_model()
+
+        old_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=old_loop.run_forever)
+        thread.start()
+        try:
+            with patch("src.agent.model.httpx.AsyncClient", side_effect=new_client):
+                old_model = asyncio.run_coroutine_threadsafe(get_model(), old_loop).result()
+                new_model = asyncio.run(get_model())
+                asyncio.run_coroutine_threadsafe(asyncio.sleep(0), old_loop).result()
+        finally:
+            old_loop.call_soon_threadsafe(old_loop.stop)
+            thread.join()
+            old_loop.close()
+
+        assert new_model is not old_model
+        old_model.client.aclose.assert_awaited_once()
+        new_model.client.aclose.assert_not_awaited()
+        asyncio.run(model_module.close_default_model())
+
+    def test_default_model_replaced_after_loop_closed(self):
+        """Test a model from a closed loop is dropped without awaiting on that loop."""
+        from src.agent import model as model_module
+
+        def new_client(*args, **kwargs):
+            client = MagicMock()
+            client.aclose = AsyncMock()
+            return client
+
+        async def get_model():
+            return model_module.get_default_model()
+
+        with patch("src.agent.model.httpx.AsyncClient", side_effect=new_client):
+            old_model = asyncio.run(get_model())
+            new_model = asyncio.run(get_model())
+
+        assert new_model is not old_model
+        old_model.client.aclose.assert_not_awaited()
+        asyncio.run(model_module.close_default_model())
+
+    @pytest.mark.asyncio
+    async def test_model_infer_caches_deterministic_prompts(self):
+        """Test repeated low-temperature prompts skip the Ollama request."""
+        with patch("src.agent.model.httpx.AsyncClient") as mock_client:
+            mock_response = MagicMock()
+            mock_response.json.return_value = {"response": "Test response", "done": True}
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
+
+            model = OllamaModel()
+            assert await model.infer("Test") == "Test response"
+            assert await model.infer("Test") == "Test response"
+            assert mock_client.return_value.post.await_count == 1
+
+            await model.infer("Test", num_ctx=4096)
+            await model.infer("Test", temperature=0.7)
+            await model.infer("Test", temperature=0.7)
+            assert mock_client.return_value.post.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_model_infer_many_caps_concurrency(self):
+        """Test batched inference keeps prompt order and limits in-flight requests."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_post(url, json):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.json.return_value = {"response": json["prompt"].upper(), "done": True}
+            return response
+
+        with patch("src.agent.model.httpx.AsyncClient") as mock_client:
+            mock_client.return_value.post = fake_post
+
+            model = OllamaModel()
+            prompts = ["a", "b", "a", "c", "d", "e"]
+            result = await model.infer_many(prompts, temperature=0.7, concurrency=2)
+
+        assert result == ["A", "B", "A", "C", "D", "E"]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_ndjson_stream_split_across_chunks(self):
+        """Test streamed lines are reassembled when chunks split lines and characters."""
+        from src.agent.model import aiter_ndjson
+
+        body = '{"response": "Café"}\n\n{"response": "!", "done": true}'.encode()
+
+        async def chunks():
+            for i in range(0, len(body), 5):
+                yield body[i : i + 5]
+
+        items = [item async for item in aiter_ndjson(chunks())]
+
+        assert items == [{"response": "Café"}, {"response": "!", "done": True}]
+
+    @pytest.mark.asyncio
+    async def test_model_infer_does_not_retry_client_errors(self):
+        """Test a 4xx response fails on the first attempt instead of backing off."""
+        request = httpx.Request("POST", "http://ollama/api/generate")
+        not_found = httpx.Response(404, request=request)
+
+        with patch("src.agent.model.httpx.AsyncClient") as mock_client:
+            mock_client.return_value.post = AsyncMock(return_value=not_found)
+
+            model = OllamaModel()
+            with pytest.raises(httpx.HTTPStatusError):
+                await model.infer("Test", temperature=0.7)
+
+            assert mock_client.return_value.post.await_count == 1
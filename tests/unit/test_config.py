@@ -17,3 +17,15 @@ def test_get_settings_cached():
     settings1 = get_settings()
     settings2 = get_settings()
     assert settings1 is settings2
+
+
+def test_password_hash_cost_overrides(monkeypatch):
+    """Test that argon2 cost overrides are read from the environment."""
+    assert Settings().password_hash_time_cost is None
+
+    monkeypatch.setenv("PASSWORD_HASH_TIME_COST", "1")
+    monkeypatch.setenv("PASSWORD_HASH_MEMORY_COST", "1024")
+    settings = Settings()
+
+    assert settings.password_hash_time_cost == 1
+    assert settings.password_hash_memory_cost == 1024
@@ -0,0 +1,116 @@
+"""Tests for streaming RAG source helpers."""
+
+import json
+
+import httpx
+import pytest
+
+from src.rag.sources import (
+    aiter_json_array,
+    fetch_mitre_bundle,
+    iter_json_array,
+    iter_mitre_techniques,
+    load_mitre_techniques,
+)
+
+
+class TestRAGSources:
+    """Test streaming source helpers."""
+
+    BUNDLE = {
+        "type": "bundle",
+        "id": 'bundle--"objects"',
+        "objects": [
+            {"type": "attack-pattern", "name": "Phishing", "id": 1},
+            {"type": "malware", "name": "Émotet", "id": 2},
+            42,
+        ],
+    }
+
+    def test_iter_json_array_across_chunk_boundaries(self):
+        """Test that items are decoded regardless of where chunks split."""
+        raw = json.dumps(self.BUNDLE, ensure_ascii=False).encode("utf-8")
+
+        for size in (1, 3, 17, len(raw)):
+            chunks = [raw[i : i + size] for i in range(0, len(raw), size)]
+            assert list(iter_json_array(chunks, "objects")) == self.BUNDLE["objects"]
+
+    def test_iter_json_array_truncated_stream(self):
+        """Test that a truncated stream raises instead of silently stopping."""
+        raw = json.dumps(self.BUNDLE).encode("utf-8")
+
+        with pytest.raises(ValueError):
+            list(iter_json_array([raw[:-10]], "objects"))
+
+    @pytest.mark.asyncio
+    async def test_aiter_json_array(self):
+        """Test async streaming decode."""
+        raw = json.dumps(self.BUNDLE).encode("utf-8")
+
+        async def chunks():
+            for i in range(0, len(raw), 8):
+                yield raw[i : i + 8]
+
+        items = [item async for item in aiter_json_array(chunks(), "objects")]
+
+        assert items == self.BUNDLE["objects"]
+
+
+class TestMitreSource:
+    """Test the cached MITRE ATT&CK loader."""
+
+    BUNDLE = {
+        "type": "bundle",
+        "objects": [
+            {
+                "type": "attack-pattern",
+                "name": "Phishing",
+                "description": "Adversaries may send phishing messages.",
+                "external_references": [{"external_id": "T1566"}],
+                "kill_chain_phases": [{"phase_name": "initial-access"}],
+            },
+            {"type": "relationship", "source_ref": "a", "target_ref": "b"},
+            {"type": "attack-pattern", "name": "Unreferenced"},
+        ],
+    }
+
+    def _client(self, requests):
+        body = json.dumps(self.BUNDLE).encode("utf-8")
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=body, headers={"ETag": '"v1"'})
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    @pytest.mark.asyncio
+    async def test_load_mitre_techniques(self, tmp_path):
+        """Test that techniques are normalised and non-techniques skipped."""
+        async with self._client([]) as client:
+            techniques = list(await load_mitre_techniques(client, cache_dir=tmp_path))
+
+        assert techniques == [
+            {
+                "id": "T1566",
+                "name": "Phishing",
+                "description": "Adversaries may send phishing messages.",
+                "tactic": "initial, access",
+            },
+            {"id": "", "name": "Unreferenced", "description": "", "tactic": ""},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_fetch_mitre_bundle_revalidates_cache(self, tmp_path):
+        """Test that a cached bundle is revalidated by ETag instead of re-downloaded."""
+        requests = []
+        async with self._client(requests) as client:
+            first = await fetch_mitre_bundle(client, cache_dir=tmp_path)
+            second = await fetch_mitre_bundle(client, cache_dir=tmp_path)
+
+        assert first == second
+        assert first.name.endswith(".json.gz")
+        assert "if-none-match" not in requests[0].headers
+        assert requests[1].headers["if-none-match"] == '"v1"'
+        assert len(list(iter_mitre_techniques(second))) == 2